@@ -0,0 +1,259 @@
+"""
+src/core の主要な処理のベンチマーク
+行数ごとに処理時間（最小値）とピークメモリを計測し、保存したベースラインと比較する
+
+実行例:
+    python -m benchmarks.core --sizes 1000 10000 100000
+    python -m benchmarks.core --save-baseline benchmarks/baseline.json
+    python -m benchmarks.core --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import generate_survey
+from src.core.cleaning import remove_invalid_responses
+from src.core.manipulation import calculate_scale_scores, reverse_score
+from src.core.visualization import create_statistics_summary
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+# ベースラインと比較する際の許容範囲（処理時間はばらつきが大きいため広めにとる）
+DEFAULT_TIME_TOLERANCE = 0.5
+DEFAULT_MEMORY_TOLERANCE = 0.2
+
+
+def build_cases(df: pd.DataFrame, likert_scale: int) -> Dict[str, Callable[[], Any]]:
+    """
+    計測する処理の一覧を作成
+    Args:
+        df (pd.DataFrame): 回答データ
+        likert_scale (int): リッカート尺度のポイント数
+    Returns:
+        Dict[str, Callable[[], Any]]: 処理名 -> 引数なしで呼び出せる関数
+    """
+    items = df.columns.tolist()
+    return {
+        "remove_invalid_responses": lambda: remove_invalid_responses(
+            df, likert_scale, True, True, True, True
+        ),
+        "reverse_score": lambda: reverse_score(df, items[::2], likert_scale),
+        "calculate_scale_scores": lambda: calculate_scale_scores(df, items, "scale"),
+        "create_statistics_summary": lambda: create_statistics_summary(df, items),
+    }
+
+
+def measure_time(func: Callable[[], Any], repeat: int) -> float:
+    """関数の実行時間（秒）を repeat 回計測し、最小値を返す"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure_peak_memory(func: Callable[[], Any]) -> int:
+    """
+    関数の実行中に確保されたメモリのピーク（バイト）を計測
+    tracemalloc は処理を遅くするため、処理時間とは別に1回だけ実行する
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(
+    sizes: List[int],
+    n_items: int,
+    likert_scale: int,
+    repeat: int,
+    seed: int = 0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    行数ごとに全ての処理を計測
+    Args:
+        sizes (List[int]): 行数のリスト
+        n_items (int): 項目数
+        likert_scale (int): リッカート尺度のポイント数
+        repeat (int): 処理時間の計測回数
+        seed (int): 乱数シード
+    Returns:
+        Dict[str, Dict[str, float]]: "処理名@行数" -> {"seconds", "peak_bytes"}
+    """
+    results = {}
+    for n_rows in sizes:
+        df = generate_survey(
+            n_rows,
+            n_items,
+            likert_scale,
+            missing_rate=0.01,
+            straight_line_rate=0.05,
+            step_pattern_rate=0.02,
+            seed=seed,
+        )
+        for name, func in build_cases(df, likert_scale).items():
+            # 初回の呼び出しに含まれるインポートなどを除くため、1回実行してから計測する
+            func()
+            results[f"{name}@{n_rows}"] = {
+                "seconds": measure_time(func, repeat),
+                "peak_bytes": measure_peak_memory(func),
+            }
+    return results
+
+
+def compare_results(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> List[str]:
+    """
+    計測結果をベースラインと比較し、許容範囲を超えて悪化した項目を返す
+    Args:
+        results (Dict[str, Dict[str, float]]): 今回の計測結果
+        baseline (Dict[str, Dict[str, float]]): ベースラインの計測結果
+        time_tolerance (float): 処理時間の許容する増加率
+        memory_tolerance (float): ピークメモリの許容する増加率
+    Returns:
+        List[str]: 悪化した項目の説明
+    """
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        for metric, tolerance in [
+            ("seconds", time_tolerance),
+            ("peak_bytes", memory_tolerance),
+        ]:
+            before, after = baseline[key][metric], result[metric]
+            if before > 0 and after > before * (1 + tolerance):
+                regressions.append(
+                    f"{key} {metric}: {before:.6g} -> {after:.6g} "
+                    f"({after / before:.2f}x)"
+                )
+    return regressions
+
+
+def format_results(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]] | None = None,
+) -> str:
+    """計測結果を表形式の文字列に変換（ベースラインがある場合は比率も表示）"""
+    lines = [f"{'benchmark':<40} {'time [ms]':>12} {'peak [MiB]':>12} {'vs base':>16}"]
+    for key, result in results.items():
+        ratio_text = "-"
+        if baseline and key in baseline:
+            ratio_text = (
+                f"{result['seconds'] / baseline[key]['seconds']:.2f}x / "
+                f"{result['peak_bytes'] / max(baseline[key]['peak_bytes'], 1):.2f}x"
+            )
+        lines.append(
+            f"{key:<40} {result['seconds'] * 1000:>12.2f} "
+            f"{result['peak_bytes'] / 2**20:>12.2f} {ratio_text:>16}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for the src/core functions"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--items", type=int, default=20)
+    parser.add_argument("--likert-scale", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--save-baseline",
+        type=Path,
+        default=None,
+        help="Write the results to this file",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="Compare with a saved baseline and exit with 1 on regressions",
+    )
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument(
+        "--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE
+    )
+    args = parser.parse_args(argv)
+
+    # ログ出力を抑制（検出行のリストが大量に出力されるため）
+    logging.getLogger("survey_cleaning_app").setLevel(logging.WARNING)
+
+    baseline = None
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline["config"]["items"] != args.items or (
+            baseline["config"]["likert_scale"] != args.likert_scale
+        ):
+            parser.error(
+                "The baseline was recorded with different --items/--likert-scale"
+            )
+
+    results = run_benchmarks(
+        args.sizes, args.items, args.likert_scale, args.repeat, args.seed
+    )
+    print(format_results(results, baseline["results"] if baseline else None))
+
+    if args.save_baseline is not None:
+        args.save_baseline.write_text(
+            json.dumps(
+                {
+                    "config": {
+                        "items": args.items,
+                        "likert_scale": args.likert_scale,
+                        "repeat": args.repeat,
+                        "seed": args.seed,
+                    },
+                    "environment": {
+                        "python": platform.python_version(),
+                        "numpy": np.__version__,
+                        "pandas": pd.__version__,
+                        "machine": platform.machine(),
+                    },
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if baseline is not None:
+        regressions = compare_results(
+            results,
+            baseline["results"],
+            args.time_tolerance,
+            args.memory_tolerance,
+        )
+        if regressions:
+            print("\nRegressions against the baseline:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            return 1
+        print("\nNo regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+階段パターン検出のベンチマーク
+参照実装（iterrows）とベクトル化実装の処理時間を比較する
+
+実行例:
+    python -m benchmarks.step_pattern --sizes 10000 100000 1000000
+"""
+
+import argparse
+import logging
+import time
+from typing import Callable, List
+
+from benchmarks.synthetic import generate_survey
+from src.core.cleaning import (
+    remove_step_pattern_responses,
+    remove_step_pattern_responses_vectorized,
+)
+
+
+def measure(func: Callable[[], List[int]]) -> float:
+    """関数の実行時間（秒）を計測"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Step pattern detection benchmark")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--items", type=int, default=20)
+    parser.add_argument("--likert-scale", type=int, default=7)
+    parser.add_argument(
+        "--reference-max-rows",
+        type=int,
+        default=None,
+        help="Above this size the reference time is extrapolated from the largest measured size",
+    )
+    args = parser.parse_args()
+
+    # ログ出力を抑制（検出行のリストが大量に出力されるため）
+    logging.getLogger("survey_cleaning_app").setLevel(logging.WARNING)
+
+    print(f"{'rows':>10} {'reference [s]':>15} {'vectorized [s]':>15} {'speedup':>10}")
+    per_row_reference = None
+    for n_rows in args.sizes:
+        # 約1%を階段パターンとする
+        df = generate_survey(
+            n_rows, args.items, args.likert_scale, step_pattern_rate=0.01
+        )
+
+        vectorized = measure(
+            lambda: remove_step_pattern_responses_vectorized(df, args.likert_scale)
+        )
+
+        if args.reference_max_rows is None or n_rows <= args.reference_max_rows:
+            reference = measure(
+                lambda: remove_step_pattern_responses(df, args.likert_scale)
+            )
+            per_row_reference = reference / n_rows
+            reference_text = f"{reference:.3f}"
+        elif per_row_reference is not None:
+            reference = per_row_reference * n_rows
+            reference_text = f"~{reference:.3f}"
+        else:
+            print(f"{n_rows:>10} {'skipped':>15} {vectorized:>15.4f} {'-':>10}")
+            continue
+
+        print(
+            f"{n_rows:>10} {reference_text:>15} {vectorized:>15.4f} "
+            f"{reference / vectorized:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
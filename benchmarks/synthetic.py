@@ -0,0 +1,61 @@
+"""
+ベンチマーク用の調査データ生成
+乱数シードを固定し、同じ引数からは常に同じデータを生成する
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.core.dataframe_operation import downcast_likert_columns
+
+
+def item_columns(n_items: int) -> list[str]:
+    """項目のカラム名（Q1, Q2, ...）のリスト"""
+    return [f"Q{i}" for i in range(1, n_items + 1)]
+
+
+def generate_survey(
+    n_rows: int,
+    n_items: int,
+    likert_scale: int = 5,
+    missing_rate: float = 0.0,
+    straight_line_rate: float = 0.0,
+    step_pattern_rate: float = 0.0,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    リッカート尺度の回答データを生成
+    ストレートライン・階段パターンの行を指定した割合で含め、欠損値はセル単位で発生させる
+    アップロード時と同じく、項目のカラムは int8（欠損値がある場合は Int8）に変換する
+
+    Args:
+        n_rows (int): 行数
+        n_items (int): 項目数
+        likert_scale (int): リッカート尺度のポイント数
+        missing_rate (float): 欠損値とするセルの割合
+        straight_line_rate (float): ストレートラインとする行の割合
+        step_pattern_rate (float): 階段パターンとする行の割合
+        seed (int): 乱数シード
+    Returns:
+        pd.DataFrame: 回答データ
+    """
+    rng = np.random.default_rng(seed)
+    values = rng.integers(1, likert_scale + 1, size=(n_rows, n_items)).astype(float)
+
+    # 行ごとに回答パターンを割り当てる（ストレートライン → 階段パターン → 通常の回答）
+    pattern = rng.random(n_rows)
+    straight_rows = pattern < straight_line_rate
+    step_rows = (pattern >= straight_line_rate) & (
+        pattern < straight_line_rate + step_pattern_rate
+    )
+
+    values[straight_rows] = rng.integers(
+        1, likert_scale + 1, size=(straight_rows.sum(), 1)
+    )
+    starts = rng.integers(0, likert_scale, size=step_rows.sum())
+    values[step_rows] = (starts[:, None] + np.arange(n_items)) % likert_scale + 1
+
+    if missing_rate > 0:
+        values[rng.random(values.shape) < missing_rate] = np.nan
+
+    return downcast_likert_columns(pd.DataFrame(values, columns=item_columns(n_items)))
@@ -1,6 +1,8 @@
 import streamlit as st
 
+from src.interface.profiling import profile_page_run, render_profiling_panel
 from src.interface.state import initialize_app_state
+from src.utils.logger_config import perf_span
 
 
 def main():
@@ -31,7 +33,9 @@ def main():
         [home_page, cleaning_page, manipulation_page, visualization_page]
     )
     st.session_state.current_page = pg.title
-    pg.run()
+    with perf_span(f"page:{pg.title}"), profile_page_run():
+        pg.run()
+    render_profiling_panel()
 
 
 if __name__ == "__main__":
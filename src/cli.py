@@ -0,0 +1,310 @@
+"""
+Streamlitを介さずにクリーニング・逆転項目の作成・尺度得点の計算を行うCLI
+
+実行例:
+    python -m src.cli data/*.csv --likert-scale 7 --exclude-columns ID \
+        --remove-straight-lines --remove-missing --reverse Q3 Q5 \
+        --scale anxiety=Q1,Q2,Q3_r --output-dir out --jobs 4
+"""
+
+import argparse
+import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+from src.core.cleaning import detect_invalid_response_masks
+from src.core.dataframe_operation import downcast_likert_columns
+from src.core.manipulation import calculate_all_scale_scores, reverse_score
+from src.core.pipeline import compile_pipeline, load_pipeline_spec, run_pipeline
+from src.core.streaming import clean_csv_in_chunks
+from src.core.visualization import create_statistics_summary
+from src.utils.logger_config import logger
+
+
+def read_survey_file(path: Path) -> pd.DataFrame:
+    """
+    拡張子に応じて調査データのファイルを読み込む
+    Args:
+        path (Path): 入力ファイルのパス
+    Returns:
+        pd.DataFrame: 読み込んだデータフレーム
+    """
+    extension = path.suffix.lower()
+    if extension == ".csv":
+        df = pd.read_csv(path)
+    elif extension in [".xlsx", ".xls"]:
+        df = pd.read_excel(path, engine="openpyxl")
+    elif extension == ".parquet":
+        df = pd.read_parquet(path)
+    elif extension in [".feather", ".arrow"]:
+        df = pd.read_feather(path)
+    else:
+        raise ValueError(f"Unsupported file format: {path.suffix}")
+    return downcast_likert_columns(df)
+
+
+def parse_scale_definition(value: str) -> tuple[str, List[str]]:
+    """
+    "尺度名=項目1,項目2,..." 形式の尺度定義を解析
+    Args:
+        value (str): 尺度定義の文字列
+    Returns:
+        tuple[str, List[str]]: 尺度名, 項目のリスト
+    """
+    name, sep, items = value.partition("=")
+    item_list = [item.strip() for item in items.split(",") if item.strip()]
+    if not sep or not name.strip() or not item_list:
+        raise argparse.ArgumentTypeError(
+            f"Invalid scale definition '{value}'. Use NAME=ITEM1,ITEM2,..."
+        )
+    return name.strip(), item_list
+
+
+def process_file(input_path: Path, args: argparse.Namespace) -> Dict[str, int | str]:
+    """
+    1ファイル分のクリーニング・逆転・尺度得点の計算を実行し、結果を書き出す
+    Args:
+        input_path (Path): 入力ファイルのパス
+        args (argparse.Namespace): コマンドライン引数
+    Returns:
+        Dict[str, int | str]: 処理結果のサマリー
+    """
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = input_path.stem
+    cleaned_path = output_dir / f"{stem}_cleaned.csv"
+    removed_path = output_dir / f"{stem}_removed.csv"
+    cleaning_reqs = (
+        args.remove_straight_lines,
+        args.remove_missing,
+        args.remove_out_of_range,
+        args.remove_step_pattern,
+    )
+
+    # チャンク単位のクリーニング（クリーニングのみの場合）
+    if args.chunksize:
+        summary = clean_csv_in_chunks(
+            input_path,
+            cleaned_path,
+            removed_path,
+            args.likert_scale,
+            args.exclude_columns,
+            *cleaning_reqs,
+            chunksize=args.chunksize,
+        )
+        return {"file": str(input_path), **summary}
+
+    df = read_survey_file(input_path)
+
+    # パイプライン仕様による一括実行
+    if args.pipeline_spec is not None:
+        plan = compile_pipeline(args.pipeline_spec, df.columns.tolist())
+        processed_df, removed_df, summary = run_pipeline(plan, df)
+        processed_df.to_csv(output_dir / f"{stem}_processed.csv", index=False)
+        removed_df.to_csv(removed_path, index=False)
+        create_statistics_summary(
+            processed_df,
+            list(plan.block_columns[: plan.n_items])
+            + list(plan.reverse_columns)
+            + [
+                f"{name}_{suffix}"
+                for name in plan.scale_names
+                for suffix in ["total", "mean"]
+            ],
+        ).to_csv(output_dir / f"{stem}_statistics.csv", index=False)
+        return {"file": str(input_path), **summary}
+
+    item_df = df.drop(columns=args.exclude_columns)
+
+    # クリーニング
+    if any(cleaning_reqs):
+        _, remove_mask = detect_invalid_response_masks(
+            item_df, args.likert_scale, *cleaning_reqs
+        )
+        df[remove_mask].to_csv(removed_path, index=False)
+        df = df[~remove_mask]
+    else:
+        remove_mask = None
+    df.to_csv(cleaned_path, index=False)
+
+    # 逆転項目の作成と尺度得点の計算
+    processed_df = df
+    if args.reverse:
+        processed_df = reverse_score(
+            processed_df, args.reverse, args.reverse_scale_points or args.likert_scale
+        )
+    if args.scale:
+        processed_df = calculate_all_scale_scores(processed_df, dict(args.scale))
+    if args.reverse or args.scale:
+        processed_df.to_csv(output_dir / f"{stem}_processed.csv", index=False)
+
+    # 記述統計量（処理対象のカラムと尺度得点）
+    stats_columns = [
+        col
+        for col in processed_df.select_dtypes(include=["number"]).columns
+        if col not in args.exclude_columns
+    ]
+    create_statistics_summary(processed_df, stats_columns).to_csv(
+        output_dir / f"{stem}_statistics.csv", index=False
+    )
+
+    n_removed = int(remove_mask.sum()) if remove_mask is not None else 0
+    return {
+        "file": str(input_path),
+        "total_rows": len(item_df),
+        "cleaned_rows": len(item_df) - n_removed,
+        "removed_rows": n_removed,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """コマンドライン引数のパーサーを作成"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Clean survey data, reverse-score items and calculate scale scores without the web UI.",
+    )
+    parser.add_argument(
+        "inputs", nargs="+", type=Path, help="CSV, Excel, Parquet or Feather files"
+    )
+    parser.add_argument(
+        "--spec",
+        type=Path,
+        default=None,
+        help="JSON/YAML pipeline spec; replaces the cleaning, reverse and scale options",
+    )
+    parser.add_argument(
+        "--likert-scale",
+        type=int,
+        choices=range(3, 10),
+        metavar="{3..9}",
+        help="Number of Likert scale points",
+    )
+    parser.add_argument(
+        "--exclude-columns",
+        nargs="+",
+        default=[],
+        help="Columns excluded from cleaning (e.g. ID, timestamp)",
+    )
+    parser.add_argument("--remove-straight-lines", action="store_true")
+    parser.add_argument("--remove-missing", action="store_true")
+    parser.add_argument("--remove-out-of-range", action="store_true")
+    parser.add_argument("--remove-step-pattern", action="store_true")
+    parser.add_argument(
+        "--reverse", nargs="+", default=[], help="Columns to reverse-score"
+    )
+    parser.add_argument(
+        "--reverse-scale-points",
+        type=int,
+        default=None,
+        help="Scale points used for reverse-scoring (defaults to --likert-scale)",
+    )
+    parser.add_argument(
+        "--scale",
+        action="append",
+        type=parse_scale_definition,
+        default=[],
+        metavar="NAME=ITEM1,ITEM2,...",
+        help="Scale definition; repeat the option for multiple scales",
+    )
+    parser.add_argument("--output-dir", default="output", help="Output directory")
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Number of files processed in parallel"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Clean CSV files in chunks of this many rows (cleaning only)",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Show detailed logs")
+    return parser
+
+
+def configure_logging(verbose: bool) -> None:
+    """
+    ログの出力レベルを設定（--verbose を指定しない場合は警告以上のみ出力）
+    並列実行時はワーカープロセスの起動時にも呼び出す
+    """
+    logger.setLevel(logging.INFO if verbose else logging.WARNING)
+
+
+def process_file_safely(
+    input_path: Path, args: argparse.Namespace
+) -> Dict[str, int | str]:
+    """
+    process_file を実行し、エラーが発生した場合はエラー内容をサマリーとして返す
+    （並列実行時に1ファイルの失敗で全体が停止しないようにする）
+    """
+    try:
+        return process_file(input_path, args)
+    except Exception as e:
+        logger.error(f"Failed to process {input_path}: {str(e)}")
+        return {"file": str(input_path), "error": str(e)}
+
+
+def main(argv: List[str] | None = None) -> int:
+    """CLIのエントリーポイント"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    args.pipeline_spec = None
+    if args.spec is not None:
+        if args.likert_scale or args.reverse or args.scale or args.chunksize:
+            parser.error(
+                "--spec cannot be combined with --likert-scale, --reverse, --scale or --chunksize"
+            )
+        try:
+            args.pipeline_spec = load_pipeline_spec(args.spec)
+        except (OSError, ValueError) as e:
+            parser.error(f"Failed to read pipeline spec: {e}")
+    elif args.likert_scale is None:
+        parser.error("--likert-scale is required unless --spec is given")
+    if args.chunksize and (args.reverse or args.scale):
+        parser.error("--chunksize can only be used for cleaning")
+    if args.chunksize and any(p.suffix.lower() != ".csv" for p in args.inputs):
+        parser.error("--chunksize requires CSV input files")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    # 出力ファイル名は入力ファイル名（拡張子を除く）から作るため、重複すると上書きされる
+    stems = [p.stem for p in args.inputs]
+    duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+    if duplicates:
+        parser.error(
+            f"Input files would write to the same outputs: {', '.join(duplicates)}"
+        )
+
+    configure_logging(args.verbose)
+    if args.jobs > 1:
+        with ProcessPoolExecutor(
+            max_workers=args.jobs,
+            initializer=configure_logging,
+            initargs=(args.verbose,),
+        ) as executor:
+            results = list(
+                executor.map(
+                    process_file_safely, args.inputs, [args] * len(args.inputs)
+                )
+            )
+    else:
+        results = [process_file_safely(path, args) for path in args.inputs]
+
+    failed = 0
+    for result in results:
+        if "error" in result:
+            failed += 1
+            print(f"{result['file']}: failed ({result['error']})", file=sys.stderr)
+        else:
+            print(
+                f"{result['file']}: {result['cleaned_rows']} rows kept, "
+                f"{result['removed_rows']} rows removed"
+            )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ from src.interface.pages.cleaning import (
     render_process_data_cleaning_and_export_section,
 )
 from src.interface.pages.common import render_file_upload_section
+from src.interface.pages.pipeline import render_pipeline_spec_section
 from src.interface.state import (
     check_data_settings_completion,
     check_file_upload_completion,
@@ -47,6 +48,9 @@ try:
 
     # Step1の完了チェック
     if check_file_upload_completion(df):
+        # 保存済みのパイプライン仕様による一括実行（任意）
+        render_pipeline_spec_section(df)
+
         # -----------------------------------
         # Step2. Configure Data Settings
         # -----------------------------------
@@ -1,8 +1,25 @@
-from typing import List
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
-from src.utils.logger_config import logger
+from src.utils.logger_config import logger, perf_log
+
+# クリーニングルールの識別子
+STRAIGHT_LINE = "straight_line"
+MISSING = "missing"
+OUT_OF_RANGE = "out_of_range"
+STEP_PATTERN = "step_pattern"
+CLEANING_RULES = (STRAIGHT_LINE, MISSING, OUT_OF_RANGE, STEP_PATTERN)
+
+# 削除理由のビットマスク（ルールごとに1ビット）
+REASON_BITS = {STRAIGHT_LINE: 1, MISSING: 2, OUT_OF_RANGE: 4, STEP_PATTERN: 8}
+REASON_LABELS = {
+    STRAIGHT_LINE: "Straight-line",
+    MISSING: "Missing values",
+    OUT_OF_RANGE: "Out of range",
+    STEP_PATTERN: "Step pattern",
+}
 
 
 def remove_straight_line_responses(df: pd.DataFrame) -> List[int]:
@@ -69,6 +86,8 @@ def remove_out_of_range_values(df: pd.DataFrame, likert_scale_case: int) -> List
 def remove_step_pattern_responses(df: pd.DataFrame, likert_scale: int) -> List[int]:
     """
     階段パターンの回答を判定
+    ※ 1行ずつ判定する参照実装。実際のクリーニング処理では
+      remove_step_pattern_responses_vectorized を使用する
 
     【要件】
         1. 各被験者の回答は、1〜ユーザーが指定したポイント数（例: 7, 5, 10 など）の整数が20項目分、リスト形式で与えられるものとします。
@@ -143,32 +162,278 @@ def remove_step_pattern_responses(df: pd.DataFrame, likert_scale: int) -> List[i
         raise
 
 
-def remove_invalid_responses(
+def detect_step_pattern_mask(values: np.ndarray, likert_scale: int) -> np.ndarray:
+    """
+    階段パターンの回答をNumPyでベクトル化して判定
+    remove_step_pattern_responses と同じ判定規則を、行×項目の行列全体に対して一度に適用する
+
+    Args:
+        values (np.ndarray): 行×項目の2次元配列（浮動小数点の場合、欠損値はNaN）
+        likert_scale (int): リッカート尺度のポイント数
+    Returns:
+        np.ndarray: 階段パターンの行をTrueとする真偽値配列
+    """
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.integer):
+        # 差分の計算でオーバーフローしないよう2バイト整数で計算する
+        values = values.astype(np.int16)
+    else:
+        values = values.astype(float, copy=False)
+    n_rows, n_items = values.shape
+    if n_items < 2:
+        return np.zeros(n_rows, dtype=bool)
+
+    current = values[:, :-1]
+    diff = values[:, 1:] - current
+
+    # 隣接する回答の差分が ±1、または循環ケース（最大値→1 は 1-最大値、1→最大値 は 最大値-1）
+    ascending = ((diff == 1) & (current < likert_scale)) | (
+        (diff == 1 - likert_scale) & (current == likert_scale)
+    )
+    descending = ((diff == -1) & (current > 1)) | (
+        (diff == likert_scale - 1) & (current == 1)
+    )
+    is_step_pattern = (ascending | descending).all(axis=1)
+
+    # ストレートラインの場合は階段パターンとしない
+    is_straight_line = (values == values[:, :1]).all(axis=1)
+    return is_step_pattern & ~is_straight_line
+
+
+def remove_step_pattern_responses_vectorized(
+    df: pd.DataFrame, likert_scale: int
+) -> List[int]:
+    """
+    階段パターンの回答の行番号をベクトル化した判定で取得
+    判定規則は remove_step_pattern_responses（参照実装）と同一
+
+    Args:
+        df (pd.DataFrame): 入力データフレーム
+        likert_scale (int): リッカート尺度のポイント数
+    Returns:
+        List[int]: 階段状パターンの行番号のリスト
+    """
+    try:
+        values = df.to_numpy(dtype=float, na_value=np.nan)
+        mask = detect_step_pattern_mask(values, likert_scale)
+        remove_rows = df.index[mask].tolist()
+        if remove_rows:
+            logger.info(f"Step pattern responses detected: {remove_rows}")
+        return remove_rows
+
+    except Exception as e:
+        logger.error(f"Error detecting step pattern responses: {str(e)}")
+        raise
+
+
+def to_item_block(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    項目のデータフレームを1つの連続した数値配列と欠損値のマスクに変換
+    全カラムが int8 / Int8 の場合は1バイト整数のまま変換し、それ以外はfloatに変換する
+
+    Args:
+        df (pd.DataFrame): 入力データフレーム
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 行×項目の数値配列, 欠損値のマスク
+    """
+    if df.shape[1] and all(dtype in (np.int8, pd.Int8Dtype()) for dtype in df.dtypes):
+        values = np.empty(df.shape, dtype=np.int8)
+        is_missing = np.zeros(df.shape, dtype=bool)
+        for j in range(df.shape[1]):
+            series = df.iloc[:, j]
+            values[:, j] = series.to_numpy(dtype=np.int8, na_value=0)
+            if isinstance(series.dtype, pd.Int8Dtype):
+                is_missing[:, j] = series.isna().to_numpy()
+        return values, is_missing
+
+    values = np.ascontiguousarray(df.to_numpy(dtype=float, na_value=np.nan))
+    return values, np.isnan(values)
+
+
+def evaluate_cleaning_rules(
+    values: np.ndarray,
+    likert_scale: int,
+    remove_straight_lines: bool = False,
+    remove_missing: bool = False,
+    remove_out_of_range: bool = False,
+    remove_step_pattern: bool = False,
+    is_missing: np.ndarray | None = None,
+) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    行×項目の数値配列に対して有効なルールをまとめて評価する
+    Args:
+        values (np.ndarray): 行×項目の2次元配列（浮動小数点の場合、欠損値はNaN）
+        likert_scale (int): リッカート尺度のポイント数
+        remove_straight_lines (bool): ストレートライン回答を検出するか
+        remove_missing (bool): 欠損値を含む回答を検出するか
+        remove_out_of_range (bool): 範囲外の値を含む回答を検出するか
+        remove_step_pattern (bool): 階段パターンの回答を検出するか
+        is_missing (np.ndarray | None): 欠損値のマスク（整数配列の場合に指定）
+    Returns:
+        Tuple[Dict[str, np.ndarray], np.ndarray]: ルール名ごとのマスク, 全ルールを合わせたマスク
+    """
+    n_rows, n_items = values.shape
+    masks: Dict[str, np.ndarray] = {}
+
+    if n_items == 0:
+        empty = np.zeros(n_rows, dtype=bool)
+        enabled = (
+            remove_straight_lines,
+            remove_missing,
+            remove_out_of_range,
+            remove_step_pattern,
+        )
+        masks = {rule: empty for rule, on in zip(CLEANING_RULES, enabled) if on}
+        return masks, empty.copy()
+
+    is_float = np.issubdtype(values.dtype, np.floating)
+    if is_missing is None:
+        is_missing = np.isnan(values) if is_float else np.zeros(values.shape, bool)
+    has_missing = np.asarray(is_missing.any(axis=1), dtype=bool)
+
+    if remove_straight_lines:
+        # 欠損値を除いた2つ以上の値が全て同じ（標準偏差が0）
+        if is_float:
+            row_max = np.fmax.reduce(values, axis=1)
+            row_min = np.fmin.reduce(values, axis=1)
+        else:
+            info = np.iinfo(values.dtype)
+            row_max = np.where(is_missing, info.min, values).max(axis=1)
+            row_min = np.where(is_missing, info.max, values).min(axis=1)
+        n_answered = n_items - is_missing.sum(axis=1)
+        masks[STRAIGHT_LINE] = (n_answered >= 2) & (row_max == row_min)
+
+    if remove_missing:
+        masks[MISSING] = has_missing
+
+    if remove_out_of_range:
+        masks[OUT_OF_RANGE] = (
+            ((values > likert_scale) | (values < 1)) & ~is_missing
+        ).any(axis=1)
+
+    if remove_step_pattern:
+        masks[STEP_PATTERN] = detect_step_pattern_mask(values, likert_scale) & (
+            ~has_missing
+        )
+
+    return masks, combine_rule_masks(masks, n_rows)
+
+
+def combine_rule_masks(masks: Dict[str, np.ndarray], n_rows: int) -> np.ndarray:
+    """
+    ルールごとのマスクを1つの削除対象マスクにまとめる
+    Args:
+        masks (Dict[str, np.ndarray]): ルール名ごとの真偽値マスク
+        n_rows (int): 行数
+    Returns:
+        np.ndarray: いずれかのルールに該当する行をTrueとする真偽値配列
+    """
+    combined = np.zeros(n_rows, dtype=bool)
+    for rule, mask in masks.items():
+        combined |= mask
+        if mask.any():
+            logger.info(f"{rule} responses detected: {int(mask.sum())} rows")
+    return combined
+
+
+@perf_log
+def detect_invalid_response_masks(
     df: pd.DataFrame,
     likert_scale: int,
     remove_straight_lines: bool = False,
     remove_missing: bool = False,
     remove_out_of_range: bool = False,
     remove_step_pattern: bool = False,
-) -> List[int]:
-    """無効な回答を検出して削除"""
+) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    有効なルールをまとめて評価し、ルールごとの真偽値マスクを取得
+    データフレームを一度だけ連続したNumPy配列（int8 / Int8 の場合は1バイト整数）に変換し、全ルールで共有する
+
+    Args:
+        df (pd.DataFrame): 入力データフレーム
+        likert_scale (int): リッカート尺度のポイント数
+        remove_straight_lines (bool): ストレートライン回答を検出するか
+        remove_missing (bool): 欠損値を含む回答を検出するか
+        remove_out_of_range (bool): 範囲外の値を含む回答を検出するか
+        remove_step_pattern (bool): 階段パターンの回答を検出するか
+    Returns:
+        Tuple[Dict[str, np.ndarray], np.ndarray]: ルール名ごとのマスク, 全ルールを合わせたマスク
+    """
     try:
-        remove_rows = []
+        values, is_missing = to_item_block(df)
+        return evaluate_cleaning_rules(
+            values,
+            likert_scale,
+            remove_straight_lines,
+            remove_missing,
+            remove_out_of_range,
+            remove_step_pattern,
+            is_missing,
+        )
 
-        if remove_straight_lines:
-            remove_rows.extend(remove_straight_line_responses(df))
+    except Exception as e:
+        logger.error(f"Error detecting invalid responses: {str(e)}")
+        raise
 
-        if remove_missing:
-            remove_rows.extend(remove_missing_values(df))
 
-        if remove_out_of_range:
-            remove_rows.extend(remove_out_of_range_values(df, likert_scale))
+def encode_removal_reasons(masks: Dict[str, np.ndarray], n_rows: int) -> np.ndarray:
+    """
+    ルールごとのマスクを回答者ごとのuint8ビットマスクに変換
+    Args:
+        masks (Dict[str, np.ndarray]): ルール名ごとの真偽値マスク
+        n_rows (int): 行数
+    Returns:
+        np.ndarray: 削除理由のビットマスク（0は削除対象外）
+    """
+    reasons = np.zeros(n_rows, dtype=np.uint8)
+    for rule, mask in masks.items():
+        reasons |= mask.astype(np.uint8) * np.uint8(REASON_BITS[rule])
+    return reasons
 
-        if remove_step_pattern:
-            remove_rows.extend(remove_step_pattern_responses(df, likert_scale))
 
-        # 重複を除去
-        remove_rows = list(set(remove_rows))
+def describe_removal_reasons(reasons: np.ndarray) -> np.ndarray:
+    """
+    削除理由のビットマスクを表示用のテキストに変換
+    Args:
+        reasons (np.ndarray): 削除理由のビットマスク
+    Returns:
+        np.ndarray: 削除理由のテキスト（例: "Straight-line, Step pattern"）
+    """
+    # 取りうる全てのビットの組み合わせについてテキストを作成し、参照する
+    lookup = np.array(
+        [
+            ", ".join(
+                REASON_LABELS[rule]
+                for rule in CLEANING_RULES
+                if code & REASON_BITS[rule]
+            )
+            for code in range(1 << len(CLEANING_RULES))
+        ],
+        dtype=object,
+    )
+    return lookup[np.asarray(reasons, dtype=np.uint8)]
+
+
+@perf_log
+def remove_invalid_responses(
+    df: pd.DataFrame,
+    likert_scale: int,
+    remove_straight_lines: bool = False,
+    remove_missing: bool = False,
+    remove_out_of_range: bool = False,
+    remove_step_pattern: bool = False,
+) -> List[int]:
+    """無効な回答を検出して削除"""
+    try:
+        _, combined = detect_invalid_response_masks(
+            df,
+            likert_scale,
+            remove_straight_lines,
+            remove_missing,
+            remove_out_of_range,
+            remove_step_pattern,
+        )
+        remove_rows = df.index[combined].tolist()
         logger.info(f"Total {len(remove_rows)} invalid responses detected")
         return remove_rows
 
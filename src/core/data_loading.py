@@ -1,29 +1,75 @@
+import io
 from pathlib import Path
 
 import pandas as pd
 import streamlit as st
 
-from src.utils.logger_config import logger
+from src.core.dataframe_operation import downcast_likert_columns
+from src.core.upload_cache import (
+    compute_content_hash,
+    get_cached_dataframe,
+    put_cached_dataframe,
+)
+from src.utils.logger_config import logger, perf_log
 
 
+def read_file_bytes(file) -> bytes:
+    """
+    アップロードされたファイルの内容をバイト列として取得
+    Args:
+        file: アップロードされたファイルオブジェクト
+    Returns:
+        bytes: ファイルの内容
+    """
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    file.seek(0)
+    content = file.read()
+    file.seek(0)
+    return content
+
+
+def validate_dataframe(df: pd.DataFrame) -> bool:
+    """
+    読み込んだデータフレームの基本的なバリデーションを実行
+    Args:
+        df (pd.DataFrame): 読み込んだデータフレーム
+    Returns:
+        bool: 有効なデータかどうか
+    """
+    if df.empty:
+        st.error("The uploaded file is empty.")
+        return False
+
+    if len(df.columns) < 2:
+        st.error("The file must contain at least two columns.")
+        return False
+
+    return True
+
+
+@perf_log
 def load_and_validate_csv(file) -> pd.DataFrame | None:
     """
     CSVファイルを読み込み、基本的なバリデーションを実行
+    同じ内容のファイルはハッシュ値をキーにキャッシュから取得する
+
     Args:
         file: アップロードされたファイルオブジェクト
     Returns:
         pd.DataFrame | None: 有効なデータフレーム、またはNone
     """
     try:
-        df = pd.read_csv(file)
+        content = read_file_bytes(file)
+        cache_key = ("csv", compute_content_hash(content))
 
-        if df.empty:
-            st.error("The uploaded file is empty.")
-            return None
-
-        if len(df.columns) < 2:
-            st.error("The file must contain at least two columns.")
-            return None
+        df = get_cached_dataframe(cache_key)
+        if df is None:
+            df = pd.read_csv(io.BytesIO(content))
+            if not validate_dataframe(df):
+                return None
+            df = downcast_likert_columns(df)
+            put_cached_dataframe(cache_key, df)
 
         return df
 
@@ -33,6 +79,43 @@ def load_and_validate_csv(file) -> pd.DataFrame | None:
         return None
 
 
+@perf_log
+def load_and_validate_arrow(file, file_format: str) -> pd.DataFrame | None:
+    """
+    Parquet / Feather（Arrow IPC）ファイルを読み込み、基本的なバリデーションを実行
+    テキストの解析が不要で、保存時のカラムの型がそのまま復元される
+
+    Args:
+        file: アップロードされたファイルオブジェクト
+        file_format (str): "parquet" または "feather"
+    Returns:
+        pd.DataFrame | None: 有効なデータフレーム、またはNone
+    """
+    try:
+        content = read_file_bytes(file)
+        cache_key = (file_format, compute_content_hash(content))
+
+        df = get_cached_dataframe(cache_key)
+        if df is None:
+            if file_format == "parquet":
+                df = pd.read_parquet(io.BytesIO(content))
+            elif file_format == "feather":
+                df = pd.read_feather(io.BytesIO(content))
+            else:
+                raise ValueError(f"Unsupported file format: {file_format}")
+            if not validate_dataframe(df):
+                return None
+            df = downcast_likert_columns(df)
+            put_cached_dataframe(cache_key, df)
+
+        return df
+
+    except Exception as e:
+        logger.error(f"{file_format.capitalize()} file loading error: {str(e)}")
+        st.error(f"An error occurred while reading the {file_format} file.")
+        return None
+
+
 def load_sample_data() -> pd.DataFrame | None:
     """サンプルデータを読み込む"""
     try:
@@ -45,7 +128,7 @@ def load_sample_data() -> pd.DataFrame | None:
             st.error("Sample data file not found.")
             return None
 
-        df = pd.read_csv(sample_path)
+        df = downcast_likert_columns(pd.read_csv(sample_path))
         logger.info(f"Sample data loaded successfully. Shape: {df.shape}")
         return df
 
@@ -55,31 +138,53 @@ def load_sample_data() -> pd.DataFrame | None:
         return None
 
 
+def open_excel_workbook(content: bytes):
+    """
+    Excelファイルを読み取り専用（ストリーミング）モードで開く
+    シート名の一覧はシートの内容を解析せずに取得できる
+
+    Args:
+        content (bytes): Excelファイルの内容
+    Returns:
+        openpyxl.Workbook: 読み取り専用のワークブック
+    """
+    from openpyxl import load_workbook
+
+    return load_workbook(
+        io.BytesIO(content), read_only=True, data_only=True, keep_links=False
+    )
+
+
+@perf_log
 def load_and_validate_excel(file) -> pd.DataFrame | None:
     """
     Excelファイルを読み込み、基本的なバリデーションを実行
+    ワークブックは1回の実行につき最大1回だけ開き、選択されたシートのみを解析する
+    解析したシートはファイル内容のハッシュ値とシート名をキーにキャッシュする
+
     Args:
         file: アップロードされたファイルオブジェクト
     Returns:
         pd.DataFrame | None: 有効なデータフレーム、またはNone
     """
+    workbook = None
     try:
-        # ファイル識別子を作成（ファイル名とサイズの組み合わせ）
-        file_id = f"{file.name}_{file.size}"
-
-        # シート名のリストを取得
-        xls = pd.ExcelFile(file, engine="openpyxl")
-        sheet_names = xls.sheet_names
+        # ファイル識別子を作成（ファイル内容のハッシュ値）
+        content = read_file_bytes(file)
+        file_id = compute_content_hash(content)
 
-        # セッション状態の初期化
+        # セッション状態の初期化（新しいファイルの場合のみシート名のリストを取得）
         if (
             "excel_file_id" not in st.session_state
             or st.session_state.excel_file_id != file_id
         ):
+            workbook = open_excel_workbook(content)
+            sheet_names = workbook.sheetnames
             st.session_state.excel_file_id = file_id
             st.session_state.excel_sheets = sheet_names
             st.session_state.selected_sheet = sheet_names[0]
             st.session_state.sheet_confirmed = False if len(sheet_names) > 1 else True
+        sheet_names = st.session_state.excel_sheets
 
         # シートが複数ある場合は選択UIを表示
         if len(sheet_names) > 1:
@@ -107,18 +212,21 @@ def load_and_validate_excel(file) -> pd.DataFrame | None:
             selected_sheet = sheet_names[0]
             st.info(f"Loading the only sheet: {selected_sheet}")
 
-        # 選択されたシートを読み込む
-        df = pd.read_excel(
-            file, sheet_name=st.session_state.selected_sheet, engine="openpyxl"
-        )
-
-        if df.empty:
-            st.error("The uploaded file is empty.")
-            return None
-
-        if len(df.columns) < 2:
-            st.error("The file must contain at least two columns.")
-            return None
+        # 選択されたシートを読み込む（解析済みのシートはキャッシュから取得）
+        cache_key = ("excel", file_id, st.session_state.selected_sheet)
+        df = get_cached_dataframe(cache_key)
+        if df is None:
+            if workbook is None:
+                workbook = open_excel_workbook(content)
+            df = pd.read_excel(
+                workbook,
+                sheet_name=st.session_state.selected_sheet,
+                engine="openpyxl",
+            )
+            if not validate_dataframe(df):
+                return None
+            df = downcast_likert_columns(df)
+            put_cached_dataframe(cache_key, df)
 
         return df
 
@@ -126,3 +234,7 @@ def load_and_validate_excel(file) -> pd.DataFrame | None:
         logger.error(f"Excel file loading error: {str(e)}")
         st.error("An error occurred while reading the Excel file.")
         return None
+
+    finally:
+        if workbook is not None:
+            workbook.close()
@@ -1,8 +1,14 @@
+import hashlib
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
-from src.utils.logger_config import logger
+from src.utils.logger_config import logger, perf_log
+
+# 1バイトの整数型に変換する値の範囲（0〜10点のリッカート尺度を想定）
+# ID・年齢・回数などのカラムを変換すると、以降の計算で桁あふれが起きるため対象外とする
+LIKERT_VALUE_RANGE = (0, 10)
 
 
 def split_dataframe(
@@ -31,18 +37,62 @@ def split_dataframe(
         raise
 
 
-def create_final_dataset(
-    cleaned_df: pd.DataFrame, removed_df: pd.DataFrame, rows_to_keep: list
-) -> pd.DataFrame:
+@perf_log
+def downcast_likert_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    LIKERT_VALUE_RANGE の整数値のみを含む数値カラム（リッカート尺度の項目）を1バイトの整数型に変換
+    欠損値がない場合は int8、欠損値がある場合は nullable な Int8 を使用する
+    範囲外の値を含むカラムは元の型のまま残す
+
+    Args:
+        df (pd.DataFrame): 入力データフレーム
+    Returns:
+        pd.DataFrame: 変換後のデータフレーム
+    """
+    min_value, max_value = LIKERT_VALUE_RANGE
+    dtypes = {}
+
+    for col in df.columns:
+        series = df[col]
+        if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(
+            series
+        ):
+            continue
+        if series.dtype in (np.int8, pd.Int8Dtype()):
+            continue
+
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        answered = values[~np.isnan(values)]
+        if answered.size == 0:
+            continue
+        if not (
+            np.all(answered == np.round(answered))
+            and answered.min() >= min_value
+            and answered.max() <= max_value
+        ):
+            continue
+
+        dtypes[col] = "Int8" if answered.size < values.size else "int8"
+
+    if not dtypes:
+        return df
+
+    logger.info(f"Downcast {len(dtypes)} columns to 8-bit integers")
+    return df.astype(dtypes)
+
+
+@perf_log
+def compute_dataframe_fingerprint(df: pd.DataFrame) -> str:
     """
-    rows_to_keepを残した最終的にダウンロードされるデータフレームを作成
+    データフレームの内容（値・インデックス・カラム名・型）を表すハッシュ値を計算
     Args:
-        cleaned_df (pd.DataFrame): Cleaned data
-        removed_df (pd.DataFrame): Removed data
-        rows_to_keep (list): List of row indices to restore
+        df (pd.DataFrame): 入力データフレーム
     Returns:
-        pd.DataFrame: Final dataset
+        str: データフレームのハッシュ値
     """
-    if rows_to_keep:
-        return pd.concat([cleaned_df, removed_df.loc[rows_to_keep]])
-    return cleaned_df
+    hasher = hashlib.sha256()
+    hasher.update(
+        repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode()
+    )
+    hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return hasher.hexdigest()
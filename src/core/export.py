@@ -0,0 +1,148 @@
+import gzip
+import io
+import os
+import zipfile
+from contextlib import ExitStack
+from tempfile import SpooledTemporaryFile
+from typing import IO, Dict, Tuple
+
+import pandas as pd
+
+from src.utils.logger_config import perf_log
+
+# ダウンロード形式: 表示名 -> (拡張子, MIMEタイプ)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "Feather": ("feather", "application/vnd.apache.arrow.file"),
+}
+
+# 圧縮形式: 表示名 -> (拡張子, MIMEタイプ)（None は圧縮なし）
+COMPRESSION_FORMATS: Dict[str, Tuple[str, str] | None] = {
+    "None": None,
+    "gzip": ("gz", "application/gzip"),
+    "zip": ("zip", "application/zip"),
+}
+
+# CSVを書き出す際の1チャンクあたりの行数
+EXPORT_CHUNK_ROWS = 50_000
+
+# 書き出し用のバッファをメモリ上に保持する上限（超える場合は一時ファイルに切り替える）。環境変数で変更できる
+EXPORT_SPOOL_MAX_BYTES = int(
+    os.environ.get("EXPORT_SPOOL_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+
+def get_export_file_name(
+    base_name: str, export_format: str, compression: str = "None"
+) -> str:
+    """
+    ダウンロードするファイル名を作成
+    Args:
+        base_name (str): 拡張子を除いたファイル名
+        export_format (str): EXPORT_FORMATS の表示名
+        compression (str): COMPRESSION_FORMATS の表示名
+    Returns:
+        str: 拡張子付きのファイル名
+    """
+    file_name = f"{base_name}.{EXPORT_FORMATS[export_format][0]}"
+    if compression == "gzip":
+        return f"{file_name}.gz"
+    if compression == "zip":
+        return f"{base_name}.zip"
+    return file_name
+
+
+def get_export_mime_type(export_format: str, compression: str = "None") -> str:
+    """
+    ダウンロードするファイルのMIMEタイプを取得
+    Args:
+        export_format (str): EXPORT_FORMATS の表示名
+        compression (str): COMPRESSION_FORMATS の表示名
+    Returns:
+        str: MIMEタイプ
+    """
+    compression_format = COMPRESSION_FORMATS[compression]
+    if compression_format is not None:
+        return compression_format[1]
+    return EXPORT_FORMATS[export_format][1]
+
+
+def _write_dataframe(df: pd.DataFrame, stream, export_format: str) -> None:
+    """データフレームをバイナリのストリームに書き出す（CSVはチャンク単位）"""
+    if export_format == "CSV":
+        text_stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+        for start in range(0, max(len(df), 1), EXPORT_CHUNK_ROWS):
+            df.iloc[start : start + EXPORT_CHUNK_ROWS].to_csv(
+                text_stream, header=start == 0, index=False
+            )
+        # ラッパーを閉じると元のストリームも閉じられるため、切り離してから返す
+        text_stream.flush()
+        text_stream.detach()
+    elif export_format == "Parquet":
+        df.to_parquet(stream, index=False)
+    else:
+        # Feather は既定のインデックスのみ扱えるため振り直す
+        df.reset_index(drop=True).to_feather(stream)
+
+
+@perf_log
+def write_export_file(
+    df: pd.DataFrame,
+    export_format: str = "CSV",
+    compression: str = "None",
+    file_name: str = "data",
+) -> SpooledTemporaryFile:
+    """
+    データフレームを指定した形式・圧縮で一時ファイルに書き出す
+    一時ファイルは EXPORT_SPOOL_MAX_BYTES まではメモリ上に保持され、超えるとディスクに移る
+
+    Args:
+        df (pd.DataFrame): 書き出すデータフレーム
+        export_format (str): EXPORT_FORMATS の表示名
+        compression (str): COMPRESSION_FORMATS の表示名
+        file_name (str): zip 内のファイル名（拡張子を除く）
+    Returns:
+        SpooledTemporaryFile: 先頭に位置を戻した一時ファイル
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    if compression not in COMPRESSION_FORMATS:
+        raise ValueError(f"Unsupported compression: {compression}")
+
+    spooled = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES)
+    stream: IO[bytes] | gzip.GzipFile
+    with ExitStack() as stack:
+        if compression == "gzip":
+            stream = stack.enter_context(gzip.GzipFile(fileobj=spooled, mode="wb"))
+        elif compression == "zip":
+            archive = stack.enter_context(
+                zipfile.ZipFile(spooled, "w", compression=zipfile.ZIP_DEFLATED)
+            )
+            stream = stack.enter_context(
+                archive.open(get_export_file_name(file_name, export_format), "w")
+            )
+        else:
+            stream = spooled
+        _write_dataframe(df, stream, export_format)
+
+    spooled.seek(0)
+    return spooled
+
+
+def serialize_dataframe(
+    df: pd.DataFrame, export_format: str = "CSV", compression: str = "None"
+) -> bytes:
+    """
+    データフレームを指定した形式のバイト列に変換
+    Parquet / Feather ではカラムの型（int8 / Int8 など）がそのまま保存される
+
+    Args:
+        df (pd.DataFrame): 変換するデータフレーム
+        export_format (str): EXPORT_FORMATS の表示名
+        compression (str): COMPRESSION_FORMATS の表示名
+    Returns:
+        bytes: 変換したデータ
+    """
+    with write_export_file(df, export_format, compression) as export_file:
+        return export_file.read()
@@ -1,21 +1,50 @@
-from typing import List
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+from src.utils.logger_config import perf_log
 
+
+@perf_log
 def reverse_score(
-    df: pd.DataFrame, columns: List[str], scale_points: int
+    df: pd.DataFrame, columns: List[str], scale_points: int | Dict[str, int]
 ) -> pd.DataFrame:
     """
     選択された列の得点を逆転させる
     例：5件法の場合、1→5, 2→4, 3→3, 4→2, 5→1
+    全ての逆転項目を1回の演算で計算し、1回の結合で追加する
+
+    Args:
+        df (pd.DataFrame): 入力データフレーム
+        columns (List[str]): 逆転させる列のリスト
+        scale_points (int | Dict[str, int]): 尺度のポイント数（項目ごとに指定する場合は辞書）
+    Returns:
+        pd.DataFrame: 逆転項目（"{列名}_r"）が追加されたデータフレーム
     """
-    df_reversed = df.copy()
-    for col in columns:
-        df_reversed[f"{col}_r"] = (scale_points + 1) - df[col]
-    return df_reversed
+    if not columns:
+        return df.copy()
 
+    if isinstance(scale_points, dict):
+        points = [scale_points[col] for col in columns]
+    else:
+        points = [scale_points] * len(columns)
 
+    # 列ごとに (ポイント数 + 1) - 得点 を計算
+    # 差し引く値を最小の整数型にして、int8 などの項目の型を維持する
+    offsets = np.array(points) + 1
+    if offsets.max() <= np.iinfo(np.int8).max:
+        offsets = offsets.astype(np.int8)
+    offsets = pd.Series(offsets, index=columns)
+    reversed_block = df[columns].rsub(offsets, axis=1).add_suffix("_r")
+
+    # 同名のカラムが既にある場合は置き換える
+    existing = [col for col in reversed_block.columns if col in df.columns]
+    base_df = df.drop(columns=existing) if existing else df
+    return pd.concat([base_df, reversed_block], axis=1)
+
+
+@perf_log
 def prepare_download_data(
     df: pd.DataFrame,
     reversed_df: pd.DataFrame,
@@ -25,14 +54,106 @@ def prepare_download_data(
     """ダウンロード用のデータフレームを準備"""
     if not include_original:
         # 元のカラムを削除し、逆転項目のみを含むデータフレームを作成
-        download_df = df.drop(columns=reverse_columns).copy()
-        # 逆転項目を追加
-        for col in reverse_columns:
-            download_df[f"{col}_r"] = reversed_df[f"{col}_r"]
-        return download_df
+        return pd.concat(
+            [
+                df.drop(columns=reverse_columns),
+                reversed_df[[f"{col}_r" for col in reverse_columns]],
+            ],
+            axis=1,
+        )
     return reversed_df
 
 
+def to_float_block(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    指定カラムを中間のデータフレームを作らずに1つのfloat配列へ変換（欠損値はNaN）
+    Args:
+        df (pd.DataFrame): 入力データフレーム
+        columns (List[str]): 変換するカラムのリスト
+    Returns:
+        np.ndarray: (行数, カラム数) のfloat配列
+    """
+    block = np.empty((len(df), len(columns)), dtype=float)
+    for j, col in enumerate(columns):
+        block[:, j] = df[col].to_numpy(dtype=float, na_value=np.nan)
+    return block
+
+
+def sum_by_scale(
+    values: np.ndarray, membership: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    項目 × 尺度 の所属行列との積で、全尺度の合計得点と回答数を一度に計算
+    欠損値は合計・回答数のどちらにも含めない（pandasの sum / mean と同じ扱い）
+
+    Args:
+        values (np.ndarray): (行数, 項目数) のfloat配列
+        membership (np.ndarray): (項目数, 尺度数) の所属行列
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 合計得点, 回答数（いずれも (行数, 尺度数)）
+    """
+    answered = ~np.isnan(values)
+    totals = np.where(answered, values, 0) @ membership
+    counts = answered @ membership
+    return totals, counts
+
+
+@perf_log
+def calculate_all_scale_scores(
+    df: pd.DataFrame, scales_config: Dict[str, List[str]]
+) -> pd.DataFrame:
+    """
+    全尺度の合計得点と平均得点をまとめて計算する
+    項目は一度だけ数値配列に変換し、得点のカラムは1回の結合で追加する
+
+    Args:
+        df (pd.DataFrame): 入力データフレーム
+        scales_config (Dict[str, List[str]]): 尺度名と構成する項目のリスト
+    Returns:
+        pd.DataFrame: 尺度ごとの合計得点と平均得点が追加されたデータフレーム
+    """
+    if not scales_config:
+        return df.copy()
+
+    items = list(
+        dict.fromkeys(item for cols in scales_config.values() for item in cols)
+    )
+    positions = {item: i for i, item in enumerate(items)}
+    membership = np.zeros((len(items), len(scales_config)))
+    for j, scale_columns in enumerate(scales_config.values()):
+        for item in scale_columns:
+            membership[positions[item], j] += 1
+
+    totals, counts = sum_by_scale(to_float_block(df, items), membership)
+    means = np.divide(
+        totals, counts, out=np.full_like(totals, np.nan), where=counts > 0
+    )
+
+    # 尺度ごとに合計得点・平均得点の順に並べる
+    scores = np.empty((len(df), 2 * len(scales_config)))
+    scores[:, 0::2] = totals
+    scores[:, 1::2] = means
+    score_columns = [
+        f"{name}_{suffix}" for name in scales_config for suffix in ["total", "mean"]
+    ]
+    scores_df = pd.DataFrame(scores, index=df.index, columns=score_columns)
+
+    # 整数の項目のみで構成される尺度の合計得点は整数に戻す
+    is_integer = [pd.api.types.is_integer_dtype(df[item]) for item in items]
+    int_totals = {
+        f"{name}_total": "int64"
+        for j, name in enumerate(scales_config)
+        if all(is_integer[i] for i in np.flatnonzero(membership[:, j]))
+    }
+    if int_totals:
+        scores_df = scores_df.astype(int_totals)
+
+    # 同名のカラムが既にある場合は置き換える
+    existing = [col for col in score_columns if col in df.columns]
+    base_df = df.drop(columns=existing) if existing else df
+    return pd.concat([base_df, scores_df], axis=1)
+
+
 def calculate_scale_scores(
     df: pd.DataFrame,
     scale_columns: List[str],
@@ -48,9 +169,4 @@ def calculate_scale_scores(
     Returns:
         pd.DataFrame: 合計得点と平均得点が追加されたデータフレーム
     """
-    df_scores = df.copy()
-    # 合計得点を計算
-    df_scores[f"{scale_name}_total"] = df[scale_columns].sum(axis=1)
-    # 平均得点を計算
-    df_scores[f"{scale_name}_mean"] = df[scale_columns].mean(axis=1)
-    return df_scores
+    return calculate_all_scale_scores(df, {scale_name: scale_columns})
@@ -0,0 +1,266 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.cleaning import CLEANING_RULES, evaluate_cleaning_rules
+from src.core.manipulation import sum_by_scale, to_float_block
+from src.utils.logger_config import logger, perf_log
+
+SPEC_KEYS = {"likert_scale", "columns", "cleaning", "reverse", "scales"}
+
+
+@dataclass(frozen=True, eq=False)
+class PipelinePlan:
+    """パイプライン仕様をデータのカラム構成に対して解決した実行計画"""
+
+    likert_scale: int
+    # 一度だけ数値配列に変換するカラム（先頭からクリーニング対象の項目が並ぶ）
+    block_columns: Tuple[str, ...]
+    n_items: int
+    rules: Tuple[bool, bool, bool, bool]
+    # 逆転項目: 配列内の位置・出力カラム名・（ポイント数 + 1）
+    reverse_positions: np.ndarray
+    reverse_columns: Tuple[str, ...]
+    reverse_offsets: np.ndarray
+    # 尺度: 尺度名と（配列のカラム + 逆転項目）× 尺度 の所属行列
+    scale_names: Tuple[str, ...]
+    membership: np.ndarray
+
+
+def parse_pipeline_spec(text: str, fmt: str = "json") -> Dict[str, Any]:
+    """
+    パイプライン仕様の文字列を解析
+    Args:
+        text (str): 仕様の文字列
+        fmt (str): "json" または "yaml"
+    Returns:
+        Dict[str, Any]: パイプライン仕様
+    """
+    if fmt == "json":
+        spec = json.loads(text)
+    elif fmt in ["yaml", "yml"]:
+        try:
+            import yaml
+        except ImportError as e:
+            raise ValueError(
+                "PyYAML is required to read YAML pipeline specs. Use JSON instead."
+            ) from e
+        spec = yaml.safe_load(text)
+    else:
+        raise ValueError(f"Unsupported pipeline spec format: {fmt}")
+
+    if not isinstance(spec, dict):
+        raise ValueError("The pipeline spec must be a mapping.")
+    return spec
+
+
+def load_pipeline_spec(path: str | Path) -> Dict[str, Any]:
+    """
+    パイプライン仕様のファイル（JSON/YAML）を読み込む
+    Args:
+        path (str | Path): 仕様ファイルのパス
+    Returns:
+        Dict[str, Any]: パイプライン仕様
+    """
+    path = Path(path)
+    return parse_pipeline_spec(
+        path.read_text(encoding="utf-8"), path.suffix.lstrip(".").lower()
+    )
+
+
+def _require_columns(names: List[str], columns: List[str], section: str) -> None:
+    """仕様で指定されたカラムがデータに存在するか確認"""
+    missing = [name for name in names if name not in columns]
+    if missing:
+        raise ValueError(f"Columns in '{section}' not found: {', '.join(missing)}")
+
+
+def compile_pipeline(spec: Dict[str, Any], columns: List[str]) -> PipelinePlan:
+    """
+    パイプライン仕様を検証し、データのカラム構成に対する実行計画に変換
+    Args:
+        spec (Dict[str, Any]): パイプライン仕様
+        columns (List[str]): 入力データのカラム名のリスト
+    Returns:
+        PipelinePlan: 実行計画
+    """
+    columns = list(columns)
+    unknown_keys = set(spec) - SPEC_KEYS
+    if unknown_keys:
+        raise ValueError(f"Unknown keys in pipeline spec: {', '.join(unknown_keys)}")
+
+    likert_scale = spec.get("likert_scale")
+    if not isinstance(likert_scale, int) or not 3 <= likert_scale <= 9:
+        raise ValueError("'likert_scale' must be an integer between 3 and 9.")
+
+    # カラム選択
+    column_spec = spec.get("columns") or {}
+    if "include" in column_spec and "exclude" in column_spec:
+        raise ValueError("Specify either 'include' or 'exclude' in 'columns'.")
+    if "include" in column_spec:
+        _require_columns(column_spec["include"], columns, "columns.include")
+        items = list(column_spec["include"])
+    else:
+        exclude = column_spec.get("exclude", [])
+        _require_columns(exclude, columns, "columns.exclude")
+        items = [col for col in columns if col not in exclude]
+
+    # クリーニングルール
+    cleaning_spec = spec.get("cleaning") or {}
+    unknown_rules = set(cleaning_spec) - set(CLEANING_RULES)
+    if unknown_rules:
+        raise ValueError(f"Unknown cleaning rules: {', '.join(unknown_rules)}")
+    rules = tuple(bool(cleaning_spec.get(rule, False)) for rule in CLEANING_RULES)
+
+    # 逆転項目（ポイント数は項目ごとに指定することもできる）
+    reverse_spec = spec.get("reverse") or {}
+    reverse_sources = list(reverse_spec.get("columns", []))
+    _require_columns(reverse_sources, columns, "reverse.columns")
+    scale_points = reverse_spec.get("scale_points", likert_scale)
+    if isinstance(scale_points, dict):
+        points = [scale_points.get(col, likert_scale) for col in reverse_sources]
+    else:
+        points = [scale_points] * len(reverse_sources)
+    reverse_columns = [f"{col}_r" for col in reverse_sources]
+
+    # 尺度の項目は元のカラムまたは逆転項目を参照する
+    scales_spec: Dict[str, List[str]] = spec.get("scales") or {}
+    available = columns + reverse_columns
+    for scale_name, scale_items in scales_spec.items():
+        if not scale_items:
+            raise ValueError(f"Scale '{scale_name}' has no items.")
+        _require_columns(scale_items, available, f"scales.{scale_name}")
+
+    output_columns = reverse_columns + [
+        f"{name}_{suffix}" for name in scales_spec for suffix in ["total", "mean"]
+    ]
+    duplicated = [col for col in output_columns if col in columns]
+    if duplicated:
+        raise ValueError(f"Output columns already exist: {', '.join(duplicated)}")
+
+    # 数値配列に変換するカラム（項目 → 逆転対象 → 尺度のみで使うカラムの順）
+    block_columns = list(items)
+    for col in reverse_sources + [
+        item for scale_items in scales_spec.values() for item in scale_items
+    ]:
+        if col in columns and col not in block_columns:
+            block_columns.append(col)
+    positions = {col: i for i, col in enumerate(block_columns)}
+    positions.update(
+        {col: len(block_columns) + i for i, col in enumerate(reverse_columns)}
+    )
+
+    membership = np.zeros(
+        (len(block_columns) + len(reverse_columns), len(scales_spec)), dtype=float
+    )
+    for j, scale_items in enumerate(scales_spec.values()):
+        for item in scale_items:
+            membership[positions[item], j] += 1
+
+    return PipelinePlan(
+        likert_scale=likert_scale,
+        block_columns=tuple(block_columns),
+        n_items=len(items),
+        rules=rules,  # type: ignore[arg-type]
+        reverse_positions=np.array(
+            [positions[col] for col in reverse_sources], dtype=int
+        ),
+        reverse_columns=tuple(reverse_columns),
+        reverse_offsets=np.array(points, dtype=float) + 1,
+        scale_names=tuple(scales_spec),
+        membership=membership,
+    )
+
+
+@perf_log
+def run_pipeline(
+    plan: PipelinePlan, df: pd.DataFrame
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+    """
+    実行計画に従ってクリーニング・逆転項目の作成・尺度得点の計算をまとめて実行
+    対象カラムは一度だけ数値配列に変換し、追加するカラムは1回の結合で付与する
+
+    Args:
+        plan (PipelinePlan): compile_pipeline で作成した実行計画
+        df (pd.DataFrame): 入力データフレーム
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+            処理後のデータ, 削除された行, 行数とルールごとの検出数
+    """
+    try:
+        block = to_float_block(df, list(plan.block_columns))
+
+        # クリーニング
+        masks, remove_mask = evaluate_cleaning_rules(
+            block[:, : plan.n_items], plan.likert_scale, *plan.rules
+        )
+        keep = ~remove_mask
+        kept_block = block[keep]
+
+        # 逆転項目
+        reversed_block = plan.reverse_offsets - kept_block[:, plan.reverse_positions]
+
+        # 尺度得点（所属行列との積で全尺度の合計と回答数を一度に計算）
+        n_block = kept_block.shape[1]
+        totals = np.zeros((len(kept_block), len(plan.scale_names)))
+        counts = np.zeros_like(totals)
+        for values, membership in [
+            (kept_block, plan.membership[:n_block]),
+            (reversed_block, plan.membership[n_block:]),
+        ]:
+            block_totals, block_counts = sum_by_scale(values, membership)
+            totals += block_totals
+            counts += block_counts
+        means = np.divide(
+            totals, counts, out=np.full_like(totals, np.nan), where=counts > 0
+        )
+
+        # 尺度ごとに合計得点・平均得点の順に並べる
+        scores = np.empty((len(kept_block), 2 * len(plan.scale_names)))
+        scores[:, 0::2] = totals
+        scores[:, 1::2] = means
+        score_columns = [
+            f"{name}_{suffix}"
+            for name in plan.scale_names
+            for suffix in ["total", "mean"]
+        ]
+        added_df = pd.DataFrame(
+            np.hstack([reversed_block, scores]),
+            index=df.index[keep],
+            columns=list(plan.reverse_columns) + score_columns,
+        )
+
+        # 整数の項目から作成した逆転項目は元の型（int8 / Int8 など）、合計得点は int64 に戻す
+        is_integer = [
+            pd.api.types.is_integer_dtype(df[col]) for col in plan.block_columns
+        ]
+        is_integer += [is_integer[pos] for pos in plan.reverse_positions]
+        dtypes = {
+            col: df[plan.block_columns[pos]].dtype
+            for col, pos in zip(plan.reverse_columns, plan.reverse_positions)
+            if is_integer[pos]
+        }
+        for j, name in enumerate(plan.scale_names):
+            members = np.flatnonzero(plan.membership[:, j])
+            if all(is_integer[i] for i in members):
+                dtypes[f"{name}_total"] = "int64"
+        if dtypes:
+            added_df = added_df.astype(dtypes)
+
+        processed_df = pd.concat([df[keep], added_df], axis=1)
+        summary = {
+            "total_rows": len(df),
+            "cleaned_rows": int(keep.sum()),
+            "removed_rows": int(remove_mask.sum()),
+            **{rule: int(mask.sum()) for rule, mask in masks.items()},
+        }
+        logger.info(f"Pipeline completed: {summary}")
+        return processed_df, df[remove_mask], summary
+
+    except Exception as e:
+        logger.error(f"Pipeline execution error: {str(e)}")
+        raise
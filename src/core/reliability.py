@@ -0,0 +1,121 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.manipulation import to_float_block
+from src.utils.logger_config import logger, perf_log
+
+
+def reliability_from_covariance(
+    cov: np.ndarray,
+) -> Tuple[float, np.ndarray, np.ndarray]:
+    """
+    項目の共分散行列から信頼性係数を計算
+    項目を除いた場合の値は、合計得点の分散から除く項目の分だけ差し引いて求める
+    （項目ごとに共分散行列を計算し直さない）
+
+    Args:
+        cov (np.ndarray): (項目数, 項目数) の共分散行列
+    Returns:
+        Tuple[float, np.ndarray, np.ndarray]:
+            Cronbachのα係数, 項目を除いた場合のα係数, 修正済み項目-合計相関（I-T相関）
+    """
+    k = cov.shape[0]
+    item_variances = np.diag(cov)
+    # 合計得点の分散と、各項目と合計得点の共分散
+    total_variance = cov.sum()
+    item_total_cov = cov.sum(axis=1)
+    # 項目 i を除いた合計得点の分散
+    rest_variances = total_variance - 2 * item_total_cov + item_variances
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = (
+            k / (k - 1) * (1 - item_variances.sum() / total_variance)
+            if k >= 2
+            else np.nan
+        )
+        alpha_if_deleted = (
+            (k - 1)
+            / (k - 2)
+            * (1 - (item_variances.sum() - item_variances) / rest_variances)
+            if k >= 3
+            else np.full(k, np.nan)
+        )
+        # 項目 i と残りの項目の合計得点との相関
+        item_total_r = (item_total_cov - item_variances) / np.sqrt(
+            item_variances * rest_variances
+        )
+    return float(alpha), alpha_if_deleted, item_total_r
+
+
+@perf_log
+def calculate_reliability(
+    df: pd.DataFrame, scales_config: Dict[str, List[str]]
+) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    尺度ごとにCronbachのα係数・項目を除いた場合のα係数・修正済み項目-合計相関を計算
+    欠損値を含む行は尺度ごとに除外する（リストワイズ削除）
+    欠損値がない場合は全尺度の項目の共分散行列を1回だけ計算し、尺度ごとに部分行列を使用する
+
+    Args:
+        df (pd.DataFrame): 入力データフレーム
+        scales_config (Dict[str, List[str]]): 尺度名と構成する項目のリスト
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+            尺度ごとの n_items, n_respondents, alpha,
+            尺度名 -> 項目ごとの item_total_r, alpha_if_deleted
+    """
+    try:
+        items = list(
+            dict.fromkeys(item for cols in scales_config.values() for item in cols)
+        )
+        positions = {item: i for i, item in enumerate(items)}
+        block = to_float_block(df, items)
+        answered = ~np.isnan(block)
+
+        shared_cov = None
+        if answered.all() and len(block) > 1:
+            shared_cov = np.cov(block, rowvar=False).reshape(len(items), len(items))
+
+        summary = []
+        item_stats = {}
+        for scale_name, scale_columns in scales_config.items():
+            scale_columns = list(dict.fromkeys(scale_columns))
+            cols = [positions[item] for item in scale_columns]
+
+            if shared_cov is not None:
+                n_respondents = len(block)
+                cov = shared_cov[np.ix_(cols, cols)]
+            else:
+                complete = answered[:, cols].all(axis=1)
+                n_respondents = int(complete.sum())
+                if n_respondents > 1:
+                    cov = np.cov(block[complete][:, cols], rowvar=False).reshape(
+                        len(cols), len(cols)
+                    )
+                else:
+                    cov = np.full((len(cols), len(cols)), np.nan)
+
+            alpha, alpha_if_deleted, item_total_r = reliability_from_covariance(cov)
+            summary.append(
+                {
+                    "scale": scale_name,
+                    "n_items": len(cols),
+                    "n_respondents": n_respondents,
+                    "alpha": alpha,
+                }
+            )
+            item_stats[scale_name] = pd.DataFrame(
+                {"item_total_r": item_total_r, "alpha_if_deleted": alpha_if_deleted},
+                index=pd.Index(scale_columns, name="item"),
+            )
+
+        summary_df = pd.DataFrame(
+            summary, columns=["scale", "n_items", "n_respondents", "alpha"]
+        ).set_index("scale")
+        return summary_df, item_stats
+
+    except Exception as e:
+        logger.error(f"Reliability calculation error: {str(e)}")
+        raise
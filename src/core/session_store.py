@@ -0,0 +1,191 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from src.utils.logger_config import logger, perf_log
+
+# データフレームを書き出すディレクトリ。環境変数で変更できる
+SESSION_STORE_DIR = Path(
+    os.environ.get(
+        "SESSION_STORE_DIR", str(Path(tempfile.gettempdir()) / "survey_app_sessions")
+    )
+)
+# このサイズ（バイト）以上のデータフレームをディスクに書き出す。環境変数で変更できる
+SESSION_SPILL_MIN_BYTES = int(
+    os.environ.get("SESSION_SPILL_MIN_BYTES", str(16 * 1024 * 1024))
+)
+# 最後のアクセスからこの秒数が経過したセッションのファイルを削除する。環境変数で変更できる
+SESSION_TTL_SECONDS = int(os.environ.get("SESSION_TTL_SECONDS", str(2 * 60 * 60)))
+# 期限切れのセッションを確認する間隔（秒）
+EVICTION_INTERVAL_SECONDS = 60
+
+_last_eviction = 0.0
+_lock = threading.Lock()
+
+# ディスクから読み込んだデータフレーム（参照 -> データフレーム）
+# 参照がセッション状態から削除されると自動的に破棄される
+_loaded_frames: "weakref.WeakKeyDictionary[FrameHandle, pd.DataFrame]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@dataclass(frozen=True, eq=False)
+class FrameHandle:
+    """セッションに保存したデータフレームへの参照（セッション状態にはこの参照のみ保持する）"""
+
+    session_id: str
+    # ディスクに書き出した場合のファイルパス（小さいデータフレームはメモリ上に保持）
+    path: Path | None
+    frame: pd.DataFrame | None
+    nbytes: int
+
+
+def _session_dir(session_id: str) -> Path:
+    """セッションのファイルを書き出すディレクトリ"""
+    return SESSION_STORE_DIR / session_id
+
+
+def touch_session(session_id: str) -> None:
+    """
+    セッションの最終アクセス時刻を更新（ディレクトリの更新時刻として記録）
+    Args:
+        session_id (str): セッションID
+    """
+    session_dir = _session_dir(session_id)
+    if session_dir.exists():
+        os.utime(session_dir)
+
+
+@perf_log
+def put_frame(
+    session_id: str, df: pd.DataFrame, min_spill_bytes: int | None = None
+) -> FrameHandle:
+    """
+    データフレームを保存し、参照を返す
+    一定サイズ以上のデータフレームは非圧縮のArrow IPC（Feather）ファイルに書き出し、
+    読み込み時はメモリマップで参照する
+
+    Args:
+        session_id (str): セッションID
+        df (pd.DataFrame): 保存するデータフレーム
+        min_spill_bytes (int | None): ディスクに書き出すサイズの下限（省略時は SESSION_SPILL_MIN_BYTES）
+    Returns:
+        FrameHandle: 保存したデータフレームへの参照
+    """
+    min_spill_bytes = (
+        SESSION_SPILL_MIN_BYTES if min_spill_bytes is None else min_spill_bytes
+    )
+    nbytes = int(df.memory_usage(index=True, deep=False).sum())
+    if nbytes < min_spill_bytes:
+        return FrameHandle(session_id, None, df, nbytes)
+
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=True)
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        # Arrowに変換できない型（混在した型のカラムなど）はメモリ上に保持する
+        logger.warning(f"Session store kept a frame in memory: {str(e)}")
+        return FrameHandle(session_id, None, df, nbytes)
+
+    session_dir = _session_dir(session_id)
+    session_dir.mkdir(parents=True, exist_ok=True)
+    path = session_dir / f"{uuid.uuid4().hex}.arrow"
+    feather.write_feather(table, path, compression="uncompressed")
+    logger.info(f"Session store spilled {nbytes} bytes to {path}")
+    return FrameHandle(session_id, path, None, nbytes)
+
+
+@perf_log
+def get_frame(handle: FrameHandle) -> pd.DataFrame:
+    """
+    保存したデータフレームを取得
+    ディスクに書き出したデータフレームはメモリマップで読み込むため、数値のカラムはコピーされない
+    （読み取り専用の配列になるため、値を直接変更する場合はコピーしてから使用する）
+    読み込んだデータフレームは参照ごとに保持し、2回目以降は同じオブジェクトを返す
+
+    Args:
+        handle (FrameHandle): put_frame で取得した参照
+    Returns:
+        pd.DataFrame: 保存したデータフレーム
+    Raises:
+        FileNotFoundError: 期限切れなどでファイルが削除されている場合
+    """
+    if handle.path is None:
+        return handle.frame
+
+    if not handle.path.exists():
+        with _lock:
+            _loaded_frames.pop(handle, None)
+        raise FileNotFoundError(handle.path)
+    touch_session(handle.session_id)
+
+    with _lock:
+        df = _loaded_frames.get(handle)
+    if df is not None:
+        return df
+
+    import pyarrow.feather as feather
+
+    table = feather.read_table(handle.path, memory_map=True)
+    df = table.to_pandas(split_blocks=True)
+    with _lock:
+        _loaded_frames[handle] = df
+    return df
+
+
+def delete_frame(handle: FrameHandle) -> None:
+    """
+    保存したデータフレームのファイルを削除
+    Args:
+        handle (FrameHandle): put_frame で取得した参照
+    """
+    if handle.path is not None:
+        with _lock:
+            _loaded_frames.pop(handle, None)
+        handle.path.unlink(missing_ok=True)
+
+
+def evict_idle_sessions(ttl_seconds: int | None = None, force: bool = False) -> int:
+    """
+    一定時間アクセスのないセッションのファイルを削除
+    複数のセッションから呼ばれるため、EVICTION_INTERVAL_SECONDS ごとに1回だけ確認する
+
+    Args:
+        ttl_seconds (int | None): 削除するまでの秒数（省略時は SESSION_TTL_SECONDS）
+        force (bool): 前回の確認からの経過時間にかかわらず確認するか
+    Returns:
+        int: 削除したセッションの数
+    """
+    global _last_eviction
+    ttl_seconds = SESSION_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+    now = time.time()
+    with _lock:
+        if not force and now - _last_eviction < EVICTION_INTERVAL_SECONDS:
+            return 0
+        _last_eviction = now
+
+    if not SESSION_STORE_DIR.exists():
+        return 0
+
+    evicted = 0
+    for session_dir in SESSION_STORE_DIR.iterdir():
+        try:
+            if session_dir.is_dir() and now - session_dir.stat().st_mtime > ttl_seconds:
+                shutil.rmtree(session_dir, ignore_errors=True)
+                evicted += 1
+        except FileNotFoundError:
+            # 他のプロセスが先に削除した場合
+            continue
+    if evicted:
+        logger.info(f"Session store evicted {evicted} idle sessions")
+    return evicted
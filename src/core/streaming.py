@@ -0,0 +1,135 @@
+from typing import Dict, List
+
+import pandas as pd
+
+from src.core.cleaning import CLEANING_RULES, detect_invalid_response_masks
+from src.utils.logger_config import logger, perf_log
+
+
+def infer_chunk_dtypes(chunk: pd.DataFrame) -> Dict[str, str]:
+    """
+    先頭チャンクから数値カラムの書き出し用の型を決める
+    整数値のみのカラム（欠損値を含む場合も）は Int64、それ以外の数値カラムは float64 とする
+
+    Args:
+        chunk (pd.DataFrame): 先頭チャンク
+    Returns:
+        Dict[str, str]: カラム名 -> 型
+    """
+    dtypes = {}
+    for col in chunk.columns:
+        series = chunk[col]
+        if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(
+            series
+        ):
+            continue
+        answered = series.dropna()
+        is_integer = pd.api.types.is_integer_dtype(series) or bool(
+            (answered == answered.round()).all()
+        )
+        dtypes[col] = "Int64" if is_integer else "float64"
+    return dtypes
+
+
+def align_chunk_dtypes(chunk: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """
+    チャンクの数値カラムを先頭チャンクと同じ型に揃える
+    （チャンクごとに型を推定すると、同じ値が 3 と 3.0 のように異なる形式で書き出されるため）
+
+    Args:
+        chunk (pd.DataFrame): 読み込んだチャンク（カラムの型を直接変更する）
+        dtypes (Dict[str, str]): infer_chunk_dtypes で決めた型
+    Returns:
+        pd.DataFrame: 型を揃えたチャンク
+    """
+    for col, dtype in dtypes.items():
+        if col not in chunk.columns or chunk[col].dtype == dtype:
+            continue
+        try:
+            chunk[col] = chunk[col].astype(dtype)
+        except (TypeError, ValueError):
+            # 先頭チャンクでは整数値のみだったカラムに小数や文字列が含まれる場合は、このチャンクの型のまま書き出す
+            logger.warning(
+                f"Chunked cleaning could not convert column '{col}' to {dtype}"
+            )
+    return chunk
+
+
+@perf_log
+def clean_csv_in_chunks(
+    input_path,
+    cleaned_path,
+    removed_path,
+    likert_scale: int,
+    exclude_columns: List[str] | None = None,
+    remove_straight_lines: bool = False,
+    remove_missing: bool = False,
+    remove_out_of_range: bool = False,
+    remove_step_pattern: bool = False,
+    chunksize: int = 50_000,
+) -> Dict[str, int]:
+    """
+    CSVファイルをチャンク単位で読み込みながらクリーニングし、結果を逐次書き出す
+    各ルールは行単位の判定のため、チャンクごとに適用しても全体に適用した場合と結果は同じ
+    メモリ使用量はファイルサイズではなくチャンクサイズに比例する
+    数値カラムの型は先頭チャンクから決め、全てのチャンクを同じ形式で書き出す
+
+    Args:
+        input_path: 入力CSVファイルのパスまたはファイルオブジェクト
+        cleaned_path: クリーニング後の行を書き出すCSVファイルのパス
+        removed_path: 削除対象の行を書き出すCSVファイルのパス
+        likert_scale (int): リッカート尺度のポイント数
+        exclude_columns (List[str] | None): 処理対象から除外するカラムのリスト
+        remove_straight_lines (bool): ストレートライン回答を削除するか
+        remove_missing (bool): 欠損値を含む回答を削除するか
+        remove_out_of_range (bool): 範囲外の値を含む回答を削除するか
+        remove_step_pattern (bool): 階段パターンの回答を削除するか
+        chunksize (int): 1チャンクあたりの行数
+    Returns:
+        Dict[str, int]: 総行数・残った行数・削除した行数とルールごとの検出数
+    """
+    try:
+        exclude_columns = exclude_columns or []
+        summary = {"total_rows": 0, "cleaned_rows": 0, "removed_rows": 0}
+        enabled = (
+            remove_straight_lines,
+            remove_missing,
+            remove_out_of_range,
+            remove_step_pattern,
+        )
+        for rule, on in zip(CLEANING_RULES, enabled):
+            if on:
+                summary[rule] = 0
+
+        with (
+            open(cleaned_path, "w", newline="", encoding="utf-8") as cleaned_file,
+            open(removed_path, "w", newline="", encoding="utf-8") as removed_file,
+        ):
+            dtypes: Dict[str, str] = {}
+            for i, chunk in enumerate(pd.read_csv(input_path, chunksize=chunksize)):
+                if i == 0:
+                    dtypes = infer_chunk_dtypes(chunk)
+                chunk = align_chunk_dtypes(chunk, dtypes)
+                masks, remove_mask = detect_invalid_response_masks(
+                    chunk.drop(columns=exclude_columns),
+                    likert_scale,
+                    *enabled,
+                )
+
+                # 先頭チャンクのみヘッダーを書き出す
+                chunk[~remove_mask].to_csv(cleaned_file, header=i == 0, index=False)
+                chunk[remove_mask].to_csv(removed_file, header=i == 0, index=False)
+
+                n_removed = int(remove_mask.sum())
+                summary["total_rows"] += len(chunk)
+                summary["removed_rows"] += n_removed
+                summary["cleaned_rows"] += len(chunk) - n_removed
+                for rule, mask in masks.items():
+                    summary[rule] += int(mask.sum())
+
+        logger.info(f"Chunked cleaning completed: {summary}")
+        return summary
+
+    except Exception as e:
+        logger.error(f"Chunked cleaning error: {str(e)}")
+        raise
@@ -0,0 +1,89 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+import pandas as pd
+
+from src.utils.logger_config import logger
+
+# キャッシュ全体のメモリ上限（バイト）。環境変数で変更できる
+UPLOAD_CACHE_MAX_BYTES = int(
+    os.environ.get("UPLOAD_CACHE_MAX_BYTES", str(512 * 1024 * 1024))
+)
+
+# 読み込み済みのデータフレーム（プロセス内の全セッションで共有）
+_cache: "OrderedDict[Hashable, tuple[pd.DataFrame, int]]" = OrderedDict()
+_cache_bytes = 0
+_lock = threading.Lock()
+
+
+def compute_content_hash(data: bytes) -> str:
+    """
+    ファイル内容のハッシュ値を計算
+    Args:
+        data (bytes): ファイルの内容
+    Returns:
+        str: SHA-256のハッシュ値
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_cached_dataframe(key: Hashable) -> pd.DataFrame | None:
+    """
+    キャッシュからデータフレームを取得（最近使用したものとして記録）
+    Args:
+        key (Hashable): キャッシュのキー（内容のハッシュ値を含む）
+    Returns:
+        pd.DataFrame | None: キャッシュされたデータフレーム、またはNone
+    """
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        _cache.move_to_end(key)
+    # 共有されているデータを呼び出し側の列の追加・削除から保護する
+    return entry[0].copy(deep=False)
+
+
+def put_cached_dataframe(
+    key: Hashable, df: pd.DataFrame, max_bytes: int | None = None
+) -> None:
+    """
+    データフレームをキャッシュに追加し、上限を超えた分を古い順に削除
+    Args:
+        key (Hashable): キャッシュのキー（内容のハッシュ値を含む）
+        df (pd.DataFrame): キャッシュするデータフレーム
+        max_bytes (int | None): キャッシュ全体のメモリ上限（省略時は UPLOAD_CACHE_MAX_BYTES）
+    """
+    global _cache_bytes
+    max_bytes = UPLOAD_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    size = int(df.memory_usage(index=True, deep=True).sum())
+    if size > max_bytes:
+        logger.info(f"Upload cache skipped: {size} bytes exceeds the cache limit")
+        return
+
+    with _lock:
+        if key in _cache:
+            _cache_bytes -= _cache.pop(key)[1]
+        while _cache and _cache_bytes + size > max_bytes:
+            evicted_key, (_, evicted_size) = _cache.popitem(last=False)
+            _cache_bytes -= evicted_size
+            logger.info(f"Upload cache evicted: {evicted_key}")
+        _cache[key] = (df, size)
+        _cache_bytes += size
+
+
+def clear_upload_cache() -> None:
+    """キャッシュを全て削除"""
+    global _cache_bytes
+    with _lock:
+        _cache.clear()
+        _cache_bytes = 0
+
+
+def get_upload_cache_bytes() -> int:
+    """キャッシュされているデータフレームの合計サイズ（バイト）を取得"""
+    with _lock:
+        return _cache_bytes
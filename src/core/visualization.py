@@ -1,7 +1,132 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+from src.core.manipulation import to_float_block
+from src.utils.logger_config import perf_log
+
+# 度数を集計する値の種類の上限（これより多い場合は連続値として扱う）
+MAX_DISCRETE_VALUES = 20
+# 連続値のヒストグラムの階級数の上限
+MAX_HISTOGRAM_BINS = 50
+
+
+def _statistics_from_block(block: np.ndarray, columns: List[str]) -> pd.DataFrame:
+    """
+    数値配列の各カラムの基本統計量を計算（欠損値は除外、標準偏差は不偏推定）
+
+    Args:
+        block: (行数, カラム数) のfloat配列
+        columns: カラム名のリスト
+
+    Returns:
+        カラム名をインデックスとした統計量のデータフレーム
+    """
+    answered = ~np.isnan(block)
+    count = answered.sum(axis=0)
+    filled = np.where(answered, block, 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, filled.sum(axis=0) / count, np.nan)
+        squared = np.where(answered, (block - mean) ** 2, 0.0).sum(axis=0)
+        std = np.where(count > 1, np.sqrt(squared / (count - 1)), np.nan)
+    min_val = np.where(count > 0, np.where(answered, block, np.inf).min(axis=0), np.nan)
+    max_val = np.where(
+        count > 0, np.where(answered, block, -np.inf).max(axis=0), np.nan
+    )
+
+    return pd.DataFrame(
+        {
+            "count": count,
+            "mean": mean,
+            "std": std,
+            "min": min_val,
+            "max": max_val,
+            "mean_plus_std": mean + std,
+            "mean_minus_std": mean - std,
+        },
+        index=pd.Index(columns, name="column"),
+    )
+
+
+def _frequencies_from_block(
+    block: np.ndarray, columns: List[str], stats: pd.DataFrame
+) -> Dict[str, pd.Series]:
+    """
+    整数値のみで値の種類が少ないカラムについて、値ごとの度数を一度に集計
+
+    Args:
+        block: (行数, カラム数) のfloat配列
+        columns: カラム名のリスト
+        stats: _statistics_from_block で計算した統計量
+
+    Returns:
+        カラム名と度数（最小値から最大値までの各値の出現回数）の辞書
+    """
+    answered = ~np.isnan(block)
+    integral = np.all(~answered | (block == np.floor(block)), axis=0)
+    min_val = stats["min"].to_numpy()
+    span = stats["max"].to_numpy() - min_val
+    discrete = integral & (stats["count"].to_numpy() > 0) & (span < MAX_DISCRETE_VALUES)
+    if not discrete.any():
+        return {}
+
+    # 各カラムの値を (カラム番号 × 幅 + 最小値からの差) に変換して一度に数える
+    positions = np.flatnonzero(discrete)
+    width = int(span[positions].max()) + 1
+    codes = (block[:, positions] - min_val[positions]) + np.arange(
+        len(positions)
+    ) * width
+    valid = answered[:, positions]
+    counts = np.bincount(
+        codes[valid].astype(np.int64), minlength=len(positions) * width
+    ).reshape(len(positions), width)
+
+    frequencies = {}
+    for j, pos in enumerate(positions):
+        n_values = int(span[pos]) + 1
+        frequencies[columns[pos]] = pd.Series(
+            counts[j, :n_values],
+            index=np.arange(n_values, dtype=np.int64) + int(min_val[pos]),
+            name=columns[pos],
+        )
+    return frequencies
+
+
+def calculate_column_statistics(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    複数カラムの基本統計量を一度に計算する
+
+    Args:
+        df: 入力データフレーム
+        columns: 統計量を計算するカラム名のリスト
+
+    Returns:
+        カラム名をインデックスとした統計量（回答数、平均、標準偏差、最小値、最大値など）
+    """
+    return _statistics_from_block(to_float_block(df, columns), list(columns))
+
+
+@perf_log
+def summarize_columns(
+    df: pd.DataFrame, columns: List[str]
+) -> Tuple[pd.DataFrame, Dict[str, pd.Series]]:
+    """
+    複数カラムの基本統計量と値ごとの度数を、1つの数値配列からまとめて計算する
+
+    Args:
+        df: 入力データフレーム
+        columns: 対象のカラム名のリスト
+
+    Returns:
+        統計量のデータフレーム, 度数の辞書（連続値のカラムは含まない）
+    """
+    columns = list(columns)
+    block = to_float_block(df, columns)
+    stats = _statistics_from_block(block, columns)
+    return stats, _frequencies_from_block(block, columns, stats)
+
 
 def calculate_statistics(df: pd.DataFrame, column: str) -> Dict[str, float]:
     """
@@ -14,19 +139,31 @@ def calculate_statistics(df: pd.DataFrame, column: str) -> Dict[str, float]:
     Returns:
         統計量を含む辞書（平均、標準偏差、最小値、最大値など）
     """
-    mean_val = df[column].mean()
-    std_val = df[column].std()
-    min_val = df[column].min()
-    max_val = df[column].max()
+    return calculate_column_statistics(df, [column]).loc[column].to_dict()
 
-    return {
-        "mean": mean_val,
-        "std": std_val,
-        "min": min_val,
-        "max": max_val,
-        "mean_plus_std": mean_val + std_val,
-        "mean_minus_std": mean_val - std_val,
-    }
+
+@perf_log
+def calculate_histogram(df: pd.DataFrame, column: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    連続値のカラムを階級に分けて度数を集計する（欠損値は除外）
+
+    Args:
+        df: 入力データフレーム
+        column: 対象のカラム名
+
+    Returns:
+        各階級の度数, 階級の境界値（度数より1つ多い）
+    """
+    values = df[column].to_numpy(dtype=float, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(1)
+
+    edges = np.histogram_bin_edges(values, bins="auto")
+    if len(edges) - 1 > MAX_HISTOGRAM_BINS:
+        edges = np.histogram_bin_edges(values, bins=MAX_HISTOGRAM_BINS)
+    counts, edges = np.histogram(values, bins=edges)
+    return counts, edges
 
 
 def check_ceiling_effect(stats: Dict[str, float]) -> bool:
@@ -55,6 +192,33 @@ def check_floor_effect(stats: Dict[str, float]) -> bool:
     return stats["mean_minus_std"] < stats["min"]
 
 
+def build_statistics_summary(stats: pd.DataFrame) -> pd.DataFrame:
+    """
+    統計量から天井効果・床効果の判定を含むサマリーを作成する（表示用の整形は行わない）
+
+    Args:
+        stats: calculate_column_statistics で計算した統計量
+
+    Returns:
+        統計情報のサマリーを含むデータフレーム
+    """
+    return pd.DataFrame(
+        {
+            "Variable": stats.index.to_numpy(),
+            "Mean": stats["mean"].to_numpy(),
+            "SD": stats["std"].to_numpy(),
+            "Min": stats["min"].to_numpy(),
+            "Max": stats["max"].to_numpy(),
+            "Mean+SD": stats["mean_plus_std"].to_numpy(),
+            "Mean-SD": stats["mean_minus_std"].to_numpy(),
+            # check_ceiling_effect / check_floor_effect と同じ判定をカラム単位で行う
+            "Ceiling Effect": (stats["mean_plus_std"] > stats["max"]).to_numpy(),
+            "Floor Effect": (stats["mean_minus_std"] < stats["min"]).to_numpy(),
+        }
+    )
+
+
+@perf_log
 def create_statistics_summary(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     """
     複数カラムの統計情報サマリーを作成する
@@ -64,35 +228,6 @@ def create_statistics_summary(df: pd.DataFrame, columns: List[str]) -> pd.DataFr
         columns: 統計量を計算するカラム名のリスト
 
     Returns:
-        統計情報のサマリーを含むデータフレーム
+        統計情報のサマリーを含むデータフレーム（数値と真偽値）
     """
-    stats_data = []
-
-    for col in columns:
-        stats = calculate_statistics(df, col)
-
-        # 天井効果と床効果の判定
-        ceiling_effect = check_ceiling_effect(stats)
-        floor_effect = check_floor_effect(stats)
-
-        # 効果の表示用テキスト
-        ceiling_text = "⚠️ Yes" if ceiling_effect else "No"
-        floor_text = "⚠️ Yes" if floor_effect else "No"
-
-        # データを追加
-        stats_data.append(
-            {
-                "Variable": col,
-                "Mean": f"{stats['mean']:.2f}",
-                "SD": f"{stats['std']:.2f}",
-                "Min": f"{stats['min']:.2f}",
-                "Max": f"{stats['max']:.2f}",
-                "Mean+SD": f"{stats['mean_plus_std']:.2f}",
-                "Mean-SD": f"{stats['mean_minus_std']:.2f}",
-                "Ceiling Effect": ceiling_text,
-                "Floor Effect": floor_text,
-            }
-        )
-
-    # データフレームに変換
-    return pd.DataFrame(stats_data)
+    return build_statistics_summary(calculate_column_statistics(df, columns))
@@ -1,18 +1,212 @@
-from typing import List
+import os
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 
-from src.core.dataframe_operation import create_final_dataset
+from src.core.export import (
+    get_export_file_name,
+    get_export_mime_type,
+    write_export_file,
+)
 from src.core.visualization import (
-    calculate_statistics,
-    check_ceiling_effect,
-    check_floor_effect,
-    create_statistics_summary,
+    build_statistics_summary,
+    calculate_histogram,
+    summarize_columns,
 )
+from src.interface.components.input import input_export_options
+from src.interface.state import get_dataframe_fingerprint, get_final_dataset
 from src.utils.logger_config import logger
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# 1ページに表示するヒストグラムの数
+HISTOGRAMS_PER_PAGE = 10
+# データの全件を表示する行数の上限（超える場合は一部の行のみブラウザに送る）。環境変数で変更できる
+PREVIEW_MAX_ROWS = int(os.environ.get("PREVIEW_MAX_ROWS", "1000"))
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_column_summary(
+    _df: pd.DataFrame, data_fingerprint: str, columns: Tuple[str, ...]
+) -> Tuple[pd.DataFrame, Dict[str, pd.Series]]:
+    """
+    統計量と度数を計算してキャッシュ（サマリーテーブルとヒストグラムで共有する）
+
+    Args:
+        _df: 入力データフレーム（ハッシュ化せず、data_fingerprint をキーに使用）
+        data_fingerprint: データフレームのハッシュ値
+        columns: 対象のカラム名
+
+    Returns:
+        統計量のデータフレーム, 度数の辞書
+    """
+    return summarize_columns(_df, list(columns))
+
+
+def load_column_summary(
+    df: pd.DataFrame, columns: List[str]
+) -> Tuple[pd.DataFrame, Dict[str, pd.Series]]:
+    """データフレームのハッシュ値をキーにキャッシュされた統計量と度数を取得"""
+    return get_column_summary(df, get_dataframe_fingerprint(df), tuple(columns))
+
+
+def format_statistics_markdown(column: str, stats: pd.Series) -> str:
+    """
+    1カラム分の統計量と天井効果・床効果の判定を表示用のMarkdownに整形
+
+    Args:
+        column: カラム名
+        stats: calculate_column_statistics で計算した1カラム分の統計量
+
+    Returns:
+        表示用のMarkdown
+    """
+    stats_md = f"**Statistics for {column}:**  \n"
+    stats_md += f"Mean: {stats['mean']:.2f}  \n"
+    stats_md += f"Standard Deviation: {stats['std']:.2f}  \n"
+    stats_md += f"Min: {stats['min']:.2f}, Max: {stats['max']:.2f}  \n"
+
+    if stats["mean_plus_std"] > stats["max"]:
+        stats_md += f"⚠️ **Ceiling Effect Detected**: Mean + SD ({stats['mean_plus_std']:.2f}) > Max ({stats['max']:.2f})  \n"
+    if stats["mean_minus_std"] < stats["min"]:
+        stats_md += f"⚠️ **Floor Effect Detected**: Mean - SD ({stats['mean_minus_std']:.2f}) < Min ({stats['min']:.2f})  \n"
+    return stats_md
+
+
+def create_histogram_figure(
+    df: pd.DataFrame,
+    column: str,
+    frequencies: Dict[str, pd.Series],
+    height: int,
+) -> "go.Figure":
+    """
+    集計済みの度数から棒グラフでヒストグラムを作成（生データはブラウザに送らない）
+
+    Args:
+        df: 入力データフレーム
+        column: 表示するカラム名
+        frequencies: summarize_columns で集計した値ごとの度数
+        height: グラフの高さ
+
+    Returns:
+        ヒストグラムの図
+    """
+    # plotly はグラフを初めて表示する際に読み込む（起動時間の短縮のため）
+    import plotly.graph_objects as go
+
+    if column in frequencies:
+        # リッカート尺度などの離散値は値ごとの度数をそのまま使用
+        counts = frequencies[column]
+        bar = go.Bar(x=counts.index, y=counts.to_numpy())
+        bargap = 0.1
+    else:
+        # 尺度得点などの連続値はサーバー側で階級に分けて集計
+        bin_counts, edges = calculate_histogram(df, column)
+        bar = go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=bin_counts,
+            width=np.diff(edges),
+        )
+        bargap = 0
+
+    bar.update(marker_color="#3366CC", opacity=0.7, name=column)
+    fig = go.Figure(bar)
+    fig.update_layout(
+        title=f"Distribution of {column}",
+        xaxis_title=column,
+        yaxis_title="Frequency",
+        bargap=bargap,
+        height=height,
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def get_histogram_figure(
+    _df: pd.DataFrame,
+    _frequencies: Dict[str, pd.Series],
+    data_fingerprint: str,
+    column: str,
+    height: int,
+) -> "go.Figure":
+    """
+    ヒストグラムの図をデータのハッシュ値とカラムごとにキャッシュ
+
+    Args:
+        _df: 入力データフレーム（ハッシュ化せず、data_fingerprint をキーに使用）
+        _frequencies: 値ごとの度数
+        data_fingerprint: データフレームのハッシュ値
+        column: 表示するカラム名
+        height: グラフの高さ
+
+    Returns:
+        ヒストグラムの図
+    """
+    return create_histogram_figure(_df, column, _frequencies, height)
+
+
+def display_download_button(
+    df: pd.DataFrame,
+    file_name: str,
+    label: str,
+    key: str,
+    data_fingerprint: str | None = None,
+) -> None:
+    """
+    ダウンロード形式の選択とダウンロードボタンを表示
+    ファイルは「Prepare download」を押したときに1回だけ作成し、セッション状態に保持する
+
+    Args:
+        df: ダウンロードするデータフレーム
+        file_name: 拡張子を除いたファイル名
+        label: ダウンロードボタンのラベル
+        key: ウィジェットのキーの接頭辞
+        data_fingerprint: データフレームのハッシュ値（省略時は必要になった時点で計算）
+    """
+    export_format, compression = input_export_options(key)
+    options = (export_format, compression)
+    prepared_key = f"{key}_prepared"
+
+    if st.button("Prepare download", key=f"{key}_prepare"):
+        # 呼び出し側のハッシュ値がある場合は同じ値で記録する（比較時に一致させるため）
+        if data_fingerprint is None:
+            data_fingerprint = get_dataframe_fingerprint(df)
+        # ファイルは1回だけ作成してセッション状態に保持する（再実行ごとにコピーしない）
+        with write_export_file(
+            df, export_format, compression, file_name
+        ) as export_file:
+            st.session_state[prepared_key] = (
+                data_fingerprint,
+                options,
+                export_file.read(),
+            )
+
+    # 準備済みのファイルがない、または形式を変更した場合
+    prepared = st.session_state.get(prepared_key)
+    if prepared is None or prepared[1] != options:
+        st.session_state.pop(prepared_key, None)
+        return
+
+    if data_fingerprint is None:
+        data_fingerprint = get_dataframe_fingerprint(df)
+    if prepared[0] != data_fingerprint:
+        # 古いデータのファイルは保持しない
+        del st.session_state[prepared_key]
+        st.info("The data has changed. Click 'Prepare download' again.")
+        return
+
+    st.download_button(
+        label=label,
+        data=prepared[2],
+        file_name=get_export_file_name(file_name, export_format, compression),
+        mime=get_export_mime_type(export_format, compression),
+        type="primary",
+        key=f"{key}_download",
+    )
+
 
 def display_data_summary(df: pd.DataFrame) -> None:
     """
@@ -28,8 +222,55 @@ def display_data_summary(df: pd.DataFrame) -> None:
         with col2:
             st.write(f"Number of columns: {df.shape[1]}")
 
+        # カラムの型（データ全体を走査せずに取得できる情報のみ）
+        with st.expander("Column types"):
+            dtype_counts = df.dtypes.astype(str).value_counts()
+            st.write(
+                ", ".join(f"{dtype}: {count}" for dtype, count in dtype_counts.items())
+            )
+            st.dataframe(
+                pd.DataFrame(
+                    {
+                        "Column": df.columns.astype(str),
+                        "Type": df.dtypes.astype(str).to_numpy(),
+                    }
+                ),
+                use_container_width=True,
+                hide_index=True,
+            )
+
         st.write("Data content:")
-        st.dataframe(df, use_container_width=True)
+        if len(df) <= PREVIEW_MAX_ROWS:
+            st.dataframe(df, use_container_width=True)
+            return
+
+        # 行数が多い場合はページ単位またはランダムに抽出した行のみを表示
+        preview_mode = st.radio(
+            "Preview",
+            ["Page", "Random sample"],
+            horizontal=True,
+            key="preview_mode",
+            help=f"Only {PREVIEW_MAX_ROWS} rows are sent to the browser at a time",
+        )
+        if preview_mode == "Page":
+            n_pages = -(-len(df) // PREVIEW_MAX_ROWS)
+            page = st.number_input(
+                f"Page (1-{n_pages})",
+                min_value=1,
+                max_value=n_pages,
+                value=1,
+                key="preview_page",
+            )
+            start = (page - 1) * PREVIEW_MAX_ROWS
+            preview_df = df.iloc[start : start + PREVIEW_MAX_ROWS]
+        else:
+            positions = np.random.default_rng(0).choice(
+                len(df), size=PREVIEW_MAX_ROWS, replace=False
+            )
+            preview_df = df.iloc[np.sort(positions)]
+
+        st.caption(f"Showing {len(preview_df)} of {len(df)} rows")
+        st.dataframe(preview_df, use_container_width=True)
 
     except Exception as e:
         logger.error(f"Error displaying data summary: {str(e)}")
@@ -38,9 +279,7 @@ def display_data_summary(df: pd.DataFrame) -> None:
 
 def disaply_final_dataset(rows_to_keep: list) -> pd.DataFrame:
     """最終的にダウンロードされるデータセットを作成してUIに表示"""
-    final_cleaned_df = create_final_dataset(
-        st.session_state.cleaned_df, st.session_state.removed_df, rows_to_keep
-    )
+    final_cleaned_df = get_final_dataset()
 
     if rows_to_keep:
         st.write(
@@ -61,10 +300,24 @@ def display_statistics_summary(df: pd.DataFrame, selected_columns: List[str]) ->
     st.markdown("#### Statistical Summary")
 
     # 統計情報のサマリテーブルを作成
-    stats_df = create_statistics_summary(df, selected_columns)
+    stats, _ = load_column_summary(df, selected_columns)
+    stats_df = build_statistics_summary(stats)
+
+    # 効果の判定を表示用のテキストに変換し、数値は小数点以下2桁で表示
+    for col in ["Ceiling Effect", "Floor Effect"]:
+        stats_df[col] = stats_df[col].map({True: "⚠️ Yes", False: "No"})
+    number_format = st.column_config.NumberColumn(format="%.2f")
 
     # サマリテーブルを表示
-    st.dataframe(stats_df, use_container_width=True, hide_index=True)
+    st.dataframe(
+        stats_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            col: number_format
+            for col in ["Mean", "SD", "Min", "Max", "Mean+SD", "Mean-SD"]
+        },
+    )
 
     # 効果の説明
     with st.expander("What are Ceiling and Floor Effects?"):
@@ -108,80 +361,53 @@ def display_single_histogram(df: pd.DataFrame, column: str) -> None:
         df: 入力データフレーム
         column: 表示するカラム名
     """
-    fig = px.histogram(
-        df,
-        x=column,
-        title=f"Distribution of {column}",
-        labels={column: column},
-        color_discrete_sequence=["#3366CC"],
-        opacity=0.7,
-    )
-    fig.update_layout(
-        xaxis_title=column, yaxis_title="Frequency", bargap=0.1, height=500
+    stats, frequencies = load_column_summary(df, [column])
+    fig = get_histogram_figure(
+        df, frequencies, get_dataframe_fingerprint(df), column, height=500
     )
     st.plotly_chart(fig, use_container_width=True)
 
-    # 統計情報を計算
-    stats = calculate_statistics(df, column)
-
-    # 天井効果と床効果の判定
-    ceiling_effect = check_ceiling_effect(stats)
-    floor_effect = check_floor_effect(stats)
-
-    # 統計情報と効果の表示
-    stats_md = f"**Statistics for {column}:**  \n"
-    stats_md += f"Mean: {stats['mean']:.2f}  \n"
-    stats_md += f"Standard Deviation: {stats['std']:.2f}  \n"
-    stats_md += f"Min: {stats['min']:.2f}, Max: {stats['max']:.2f}  \n"
-
-    if ceiling_effect:
-        stats_md += f"⚠️ **Ceiling Effect Detected**: Mean + SD ({stats['mean_plus_std']:.2f}) > Max ({stats['max']:.2f})  \n"
-    if floor_effect:
-        stats_md += f"⚠️ **Floor Effect Detected**: Mean - SD ({stats['mean_minus_std']:.2f}) < Min ({stats['min']:.2f})  \n"
-
-    st.markdown(stats_md)
+    # 統計情報と効果の表示（サマリーテーブルと共通の計算結果を使用）
+    st.markdown(format_statistics_markdown(column, stats.loc[column]))
 
 
 def display_multiple_histograms(df: pd.DataFrame, columns: List[str]) -> None:
     """
-    複数カラムのヒストグラムを2列グリッドで表示
+    複数カラムのヒストグラムを2列グリッドで表示（カラムが多い場合はページ単位で表示）
 
     Args:
         df: 入力データフレーム
         columns: 表示するカラム名のリスト
     """
+    stats, frequencies = load_column_summary(df, columns)
+    data_fingerprint = get_dataframe_fingerprint(df)
+
+    # 表示中のページのヒストグラムのみ作成・送信する
+    n_pages = -(-len(columns) // HISTOGRAMS_PER_PAGE)
+    if n_pages > 1:
+        page = st.number_input(
+            f"Page (1-{n_pages})",
+            min_value=1,
+            max_value=n_pages,
+            value=1,
+            key="histogram_page",
+            help=f"Histograms are shown {HISTOGRAMS_PER_PAGE} at a time",
+        )
+        start = (page - 1) * HISTOGRAMS_PER_PAGE
+        page_columns = columns[start : start + HISTOGRAMS_PER_PAGE]
+        st.caption(
+            f"Showing columns {start + 1}-{start + len(page_columns)} of {len(columns)}"
+        )
+    else:
+        page_columns = columns
+
     cols = st.columns(2)
-    for i, column in enumerate(columns):
+    for i, column in enumerate(page_columns):
         with cols[i % 2]:
-            fig = px.histogram(
-                df,
-                x=column,
-                title=f"Distribution of {column}",
-                labels={column: column},
-                color_discrete_sequence=["#3366CC"],
-                opacity=0.7,
-            )
-            fig.update_layout(
-                xaxis_title=column, yaxis_title="Frequency", bargap=0.1, height=350
+            fig = get_histogram_figure(
+                df, frequencies, data_fingerprint, column, height=350
             )
             st.plotly_chart(fig, use_container_width=True)
 
-            # 統計情報を計算
-            stats = calculate_statistics(df, column)
-
-            # 天井効果と床効果の判定
-            ceiling_effect = check_ceiling_effect(stats)
-            floor_effect = check_floor_effect(stats)
-
             # 統計情報と効果の表示
-            stats_md = f"**Statistics for {column}:**  \n"
-            stats_md += f"Mean: {stats['mean']:.2f}  \n"
-            stats_md += f"Standard Deviation: {stats['std']:.2f}  \n"
-            stats_md += f"Min: {stats['min']:.2f}, Max: {stats['max']:.2f}  \n"
-
-            if ceiling_effect:
-                stats_md += f"⚠️ **Ceiling Effect Detected**: Mean + SD ({stats['mean_plus_std']:.2f}) > Max ({stats['max']:.2f})  \n"
-            if floor_effect:
-                stats_md += f"⚠️ **Floor Effect Detected**: Mean - SD ({stats['mean_minus_std']:.2f}) < Min ({stats['min']:.2f})  \n"
-
-            st.markdown(stats_md)
+            st.markdown(format_statistics_markdown(column, stats.loc[column]))
@@ -1,14 +1,28 @@
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from src.core.cleaning import (
+    CLEANING_RULES,
+    REASON_BITS,
+    REASON_LABELS,
+    describe_removal_reasons,
+)
 from src.core.data_loading import (
+    load_and_validate_arrow,
     load_and_validate_csv,
     load_and_validate_excel,
     load_sample_data,
 )
-from src.interface.state import save_uploaded_data
+from src.core.export import COMPRESSION_FORMATS, EXPORT_FORMATS
+from src.interface.state import (
+    clear_uploaded_data,
+    get_removed_data,
+    load_dataframe,
+    save_uploaded_data,
+)
 from src.utils.logger_config import logger
 
 # ==============================
@@ -19,15 +33,15 @@ from src.utils.logger_config import logger
 def input_file_upload() -> pd.DataFrame | None:
     """ファイルアップロードUIを表示"""
     try:
-        st.markdown("#### Upload CSV or Excel File")
+        st.markdown("#### Upload CSV, Excel, Parquet or Feather File")
 
         # 既存のデータがある場合、クリアオプションを表示
-        if st.session_state.uploaded_df is not None:
+        uploaded_df = load_dataframe("uploaded_df")
+        if uploaded_df is not None:
             if st.button("Clear uploaded data"):
-                st.session_state.uploaded_df = None
-                st.session_state.use_sample = False
+                clear_uploaded_data()
                 st.rerun()
-            return st.session_state.uploaded_df
+            return uploaded_df
 
         # サンプルデータの使用オプション
         use_sample = st.checkbox(
@@ -46,8 +60,8 @@ def input_file_upload() -> pd.DataFrame | None:
 
         # ファイルアップロードオプション
         uploaded_file = st.file_uploader(
-            "Choose a CSV or Excel file",
-            type=["csv", "xlsx", "xls"],
+            "Choose a CSV, Excel, Parquet or Feather file",
+            type=["csv", "xlsx", "xls", "parquet", "feather", "arrow"],
             key="file_uploader",
         )
 
@@ -59,6 +73,10 @@ def input_file_upload() -> pd.DataFrame | None:
                 df = load_and_validate_csv(uploaded_file)
             elif file_extension in ["xlsx", "xls"]:
                 df = load_and_validate_excel(uploaded_file)
+            elif file_extension == "parquet":
+                df = load_and_validate_arrow(uploaded_file, "parquet")
+            elif file_extension in ["feather", "arrow"]:
+                df = load_and_validate_arrow(uploaded_file, "feather")
             else:
                 st.error("Unsupported file format.")
                 return None
@@ -76,6 +94,25 @@ def input_file_upload() -> pd.DataFrame | None:
         return None
 
 
+def input_export_options(key: str) -> Tuple[str, str]:
+    """ダウンロード形式と圧縮形式の選択UIを表示"""
+    col1, col2 = st.columns(2)
+    with col1:
+        export_format = st.selectbox(
+            "File format",
+            options=list(EXPORT_FORMATS),
+            key=f"{key}_format",
+            help="Parquet and Feather keep column types and load faster than CSV",
+        )
+    with col2:
+        compression = st.selectbox(
+            "Compression",
+            options=list(COMPRESSION_FORMATS),
+            key=f"{key}_compression",
+        )
+    return export_format, compression
+
+
 # ==============================
 # for Cleaning
 # ==============================
@@ -183,52 +220,77 @@ def input_cleaning_options() -> Tuple[bool, bool, bool, bool]:
 
 def input_keep_records() -> List[int]:
     """保持するレコードを選択"""
-    if "removed_df_with_checkbox" not in st.session_state:
-        st.session_state.removed_df_with_checkbox = st.session_state.removed_df.copy()
-
-        # 元のアップロードされたデータのカラム順序を取得
-        if (
-            "uploaded_df" in st.session_state
-            and st.session_state.uploaded_df is not None
-        ):
-            original_columns = st.session_state.uploaded_df.columns.tolist()
-
-            # final_cleaned_dfのカラムが元のカラムと一致するか確認
-            if set(original_columns) == set(
-                st.session_state.removed_df_with_checkbox.columns
-            ):
-                # カラム順序を元の順序に合わせる
-                st.session_state.removed_df_with_checkbox = (
-                    st.session_state.removed_df_with_checkbox.loc[:, original_columns]
-                )
-            else:
-                # カラムが一致しない場合はログに記録
-                logger.warning("Column mismatch between original and cleaned data")
-
-        st.session_state.removed_df_with_checkbox.insert(0, "Keep This Row", False)
-        st.session_state.editor_key = 0
+    # 削除対象の行を表示時に元データとマスクから作成する
+    removed_mask: np.ndarray = st.session_state.removed_mask
+    removed_positions = np.flatnonzero(removed_mask)
+    keep_mask: np.ndarray = st.session_state.keep_mask
+
+    removed_df = get_removed_data()
+    reasons = st.session_state.removal_reasons.to_numpy()[removed_positions]
+
+    # 表示用のデータフレームは内部のカラム名で作成し、見出しは column_config で表示する
+    # （調査データに "Keep This Row" や "Reason" というカラムがあっても衝突しない）
+    data_columns = [f"_column_{j}" for j in range(removed_df.shape[1])]
+    display_df = removed_df.set_axis(data_columns, axis=1)
+    display_df.insert(0, "_keep", keep_mask[removed_positions].copy())
+    display_df.insert(1, "_reason", describe_removal_reasons(reasons))
+    column_config = {
+        "_keep": st.column_config.CheckboxColumn(
+            "Keep This Row",
+            help="Select to keep this row in the final dataset",
+            default=False,
+        ),
+        "_reason": st.column_config.TextColumn("Reason"),
+        **{
+            internal: st.column_config.Column(str(original))
+            for internal, original in zip(data_columns, removed_df.columns)
+        },
+    }
+
+    # 削除理由による絞り込みと並べ替え（検出処理は再実行しない）
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected_reasons: List[str] = st.multiselect(
+            "Filter by reason",
+            options=[REASON_LABELS[rule] for rule in CLEANING_RULES],
+            help="Show only rows detected by the selected rules",
+        )
+    with col2:
+        sort_by_reason = st.checkbox("Sort by reason")
+
+    selected_bits = 0
+    for rule in CLEANING_RULES:
+        if REASON_LABELS[rule] in selected_reasons:
+            selected_bits |= REASON_BITS[rule]
+
+    view_positions = np.arange(len(display_df))
+    if selected_bits:
+        view_positions = view_positions[(reasons & selected_bits) != 0]
+    if sort_by_reason:
+        view_positions = view_positions[
+            np.argsort(reasons[view_positions], kind="stable")
+        ]
+    view_df = display_df.iloc[view_positions]
 
     edited_df = st.data_editor(
-        st.session_state.removed_df_with_checkbox,
+        view_df,
         hide_index=False,
-        column_config={
-            "Keep This Row": st.column_config.CheckboxColumn(
-                "Keep This Row",
-                help="Select to keep this row in the final dataset",
-                default=False,
-            )
-        },
-        key=f"removed_records_editor_{st.session_state.editor_key}",
+        column_config=column_config,
+        disabled=[col for col in view_df.columns if col != "_keep"],
+        key=(
+            f"removed_records_editor_{st.session_state.editor_key}"
+            f"_{selected_bits}_{sort_by_reason}"
+        ),
     )
 
-    if not edited_df.equals(st.session_state.removed_df_with_checkbox):
-        st.session_state.removed_df_with_checkbox = edited_df.copy()
+    if not edited_df.equals(view_df):
+        keep_mask[removed_positions[view_positions]] = edited_df["_keep"].to_numpy(
+            dtype=bool
+        )
         st.session_state.editor_key += 1
         st.rerun()
 
-    return st.session_state.removed_df_with_checkbox[
-        st.session_state.removed_df_with_checkbox["Keep This Row"]
-    ].index.tolist()
+    return removed_df.index[keep_mask[removed_positions]].tolist()
 
 
 # ==============================
@@ -236,7 +298,9 @@ def input_keep_records() -> List[int]:
 # ==============================
 
 
-def input_manipulation_settings(df: pd.DataFrame) -> Tuple[int, List[str]]:
+def input_manipulation_settings(
+    df: pd.DataFrame,
+) -> Tuple[int | Dict[str, int], List[str]]:
     """データ操作設定セクションを表示"""
     # リッカート尺度のポイント数を選択
     scale_points = st.select_slider(
@@ -257,6 +321,31 @@ def input_manipulation_settings(df: pd.DataFrame) -> Tuple[int, List[str]]:
         help="Select one or more columns to reverse-score",
     )
 
+    # 項目ごとにポイント数が異なる場合（複数の尺度を含む調査票）
+    if reverse_columns and st.checkbox(
+        "Items use different numbers of scale points",
+        help="Set the number of scale points for each reversed item",
+    ):
+        points_df = st.data_editor(
+            pd.DataFrame(
+                {
+                    "Item": reverse_columns,
+                    "Scale points": [scale_points] * len(reverse_columns),
+                }
+            ),
+            hide_index=True,
+            disabled=["Item"],
+            column_config={
+                "Scale points": st.column_config.NumberColumn(
+                    min_value=3, max_value=9, step=1, required=True
+                )
+            },
+        )
+        return (
+            dict(zip(points_df["Item"], points_df["Scale points"].astype(int))),
+            reverse_columns,
+        )
+
     return scale_points, reverse_columns
 
 
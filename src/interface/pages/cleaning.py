@@ -3,7 +3,10 @@ from typing import Tuple
 import pandas as pd
 import streamlit as st
 
-from src.interface.components.display import disaply_final_dataset
+from src.interface.components.display import (
+    disaply_final_dataset,
+    display_download_button,
+)
 from src.interface.components.input import (
     input_cleaning_options,
     input_column_selection,
@@ -11,12 +14,17 @@ from src.interface.components.input import (
     input_likert_scale_selection,
 )
 from src.interface.state import (
+    get_final_dataset_fingerprint,
+    get_removed_data,
+    has_cleaning_results,
     initialize_cleaning_state,
+    load_dataframe,
     reset_cleaning_state,
 )
-from src.utils.logger_config import logger
+from src.utils.logger_config import logger, perf_log
 
 
+@perf_log
 def render_data_settings_section(
     df: pd.DataFrame,
 ) -> Tuple[pd.DataFrame, pd.DataFrame, int, str]:
@@ -36,6 +44,7 @@ def render_data_settings_section(
         raise
 
 
+@perf_log
 def render_process_data_cleaning_and_export_section(
     df_to_process: pd.DataFrame, df_not_to_process: pd.DataFrame, likert_scale_case: int
 ) -> pd.DataFrame:
@@ -61,17 +70,32 @@ def render_process_data_cleaning_and_export_section(
                 f"step_pattern={cleaning_reqs[3]}"
             )
 
-            if "cleaned_df" not in st.session_state:
+            # 設定またはデータが変わった場合はキャッシュしたルールの判定結果を組み合わせ直す
+            cleaning_settings = (
+                tuple(cleaning_reqs),
+                tuple(df_to_process.columns),
+                likert_scale_case,
+                st.session_state.get("uploaded_fingerprint"),
+            )
+            if (
+                not has_cleaning_results()
+                or st.session_state.get("cleaning_settings") != cleaning_settings
+            ):
                 initialize_cleaning_state(
-                    df_to_process, df_not_to_process, likert_scale_case, cleaning_reqs
+                    df_to_process,
+                    df_not_to_process,
+                    likert_scale_case,
+                    cleaning_reqs,
+                    st.session_state.get("uploaded_fingerprint"),
                 )
+                st.session_state.cleaning_settings = cleaning_settings
 
-            if not st.session_state.cleaned_df.empty:
+            if not st.session_state.removed_mask.all():
                 st.markdown("#### Results and Download")
 
                 st.write("The following rows have been detected.")
                 st.dataframe(
-                    st.session_state.removed_df.loc[:, df_to_process.columns],
+                    get_removed_data().loc[:, df_to_process.columns],
                     use_container_width=True,
                 )
 
@@ -83,12 +107,13 @@ def render_process_data_cleaning_and_export_section(
                 rows_to_keep = input_keep_records()
                 final_cleaned_df = disaply_final_dataset(rows_to_keep)
 
-                # 元のアップロードされたデータのカラム順序を取得
-                if (
-                    "uploaded_df" in st.session_state
-                    and st.session_state.uploaded_df is not None
+                # 元のアップロードされたデータのカラム順序に合わせる
+                # （アップロードされたデータをそのまま参照している場合は既に同じ順序）
+                uploaded_df = load_dataframe("uploaded_df")
+                if uploaded_df is not None and not final_cleaned_df.columns.equals(
+                    uploaded_df.columns
                 ):
-                    original_columns = st.session_state.uploaded_df.columns.tolist()
+                    original_columns = uploaded_df.columns.tolist()
 
                     # final_cleaned_dfのカラムが元のカラムと一致するか確認
                     if set(original_columns) == set(final_cleaned_df.columns):
@@ -106,13 +131,12 @@ def render_process_data_cleaning_and_export_section(
                         reset_cleaning_state()
                         st.rerun()
                 with col2:
-                    csv = final_cleaned_df.to_csv(index=False)
-                    st.download_button(
+                    display_download_button(
+                        final_cleaned_df,
+                        file_name="cleaned_survey_data",
                         label="Download Cleaned Data",
-                        data=csv,
-                        file_name="cleaned_survey_data.csv",
-                        mime="text/csv",
-                        type="primary",
+                        key="cleaning_export",
+                        data_fingerprint=get_final_dataset_fingerprint(),
                     )
                 return final_cleaned_df
             else:
@@ -2,9 +2,10 @@ import streamlit as st
 
 from src.interface.components.display import display_data_summary
 from src.interface.components.input import input_file_upload
-from src.utils.logger_config import logger
+from src.utils.logger_config import logger, perf_log
 
 
+@perf_log
 def render_file_upload_section():
     """ファイルアップロードセクションを表示"""
     try:
@@ -2,10 +2,13 @@ from typing import Dict, List, Tuple
 
 import pandas as pd
 import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
 
-from src.core.manipulation import calculate_scale_scores, reverse_score
+from src.core.manipulation import calculate_all_scale_scores, reverse_score
+from src.core.reliability import calculate_reliability
+from src.interface.components.display import display_download_button
 from src.interface.components.input import input_manipulation_settings
-from src.utils.logger_config import logger
+from src.utils.logger_config import logger, perf_log
 
 
 def render_has_reverse_items_option_section() -> bool:
@@ -18,9 +21,10 @@ def render_has_reverse_items_option_section() -> bool:
     return has_reverse_items
 
 
+@perf_log
 def render_manipulation_settings_section(
     df: pd.DataFrame,
-) -> Tuple[List[str], int, pd.DataFrame]:
+) -> Tuple[List[str], int | Dict[str, int], pd.DataFrame]:
     """データ操作設定セクションを表示"""
     try:
         scale_points, reverse_columns = input_manipulation_settings(df)
@@ -36,11 +40,12 @@ def render_manipulation_settings_section(
         raise
 
 
+@perf_log
 def render_manipulation_preview_section(
     original_df: pd.DataFrame,
     processed_df: pd.DataFrame,
     reverse_columns: List[str],
-    scale_points: int,
+    scale_points: int | Dict[str, int],
 ) -> None:
     """データ操作のプレビューとダウンロードセクションを表示"""
     try:
@@ -124,13 +129,11 @@ def render_manipulation_preview_section(
         st.write("Preview of data to be downloaded:")
         st.dataframe(download_df.head(), use_container_width=True)
 
-        csv = download_df.to_csv(index=False)
-        st.download_button(
+        display_download_button(
+            download_df,
+            file_name="processed_data",
             label="Download Processed Data",
-            data=csv,
-            file_name="processed_data.csv",
-            mime="text/csv",
-            type="primary",
+            key="manipulation_export",
         )
 
     except Exception as e:
@@ -139,6 +142,7 @@ def render_manipulation_preview_section(
         raise
 
 
+@perf_log
 def render_scale_score_section(df: pd.DataFrame) -> pd.DataFrame:
     """因子得点計算のUIセクションを表示"""
     st.markdown("#### Scale Score Calculation")
@@ -157,7 +161,8 @@ def render_scale_score_section(df: pd.DataFrame) -> pd.DataFrame:
     )
 
     scales_config: Dict[str, List[str]] = {}
-    df_with_scores = df.copy()
+    # プレビューは全尺度の得点をまとめて計算した後に表示する
+    preview_containers: Dict[str, DeltaGenerator] = {}
 
     # 各因子の設定
     for i in range(num_scales):
@@ -181,20 +186,79 @@ def render_scale_score_section(df: pd.DataFrame) -> pd.DataFrame:
 
         if scale_items:
             scales_config[scale_name] = scale_items
-            # 因子得点を計算
-            df_with_scores = calculate_scale_scores(
-                df_with_scores, scale_items, scale_name
+            preview_containers[scale_name] = st.container()
+
+    # 全尺度の得点を一度に計算
+    df_with_scores = calculate_all_scale_scores(df, scales_config)
+
+    # プレビューを表示
+    for scale_name, container in preview_containers.items():
+        with container.expander(f"Preview {scale_name} scores"):
+            preview_cols = scales_config[scale_name] + [
+                f"{scale_name}_total",
+                f"{scale_name}_mean",
+            ]
+            st.dataframe(
+                df_with_scores[preview_cols].head(),
+                use_container_width=True,
             )
 
-            # プレビューを表示
-            with st.expander(f"Preview {scale_name} scores"):
-                preview_cols = scale_items + [
-                    f"{scale_name}_total",
-                    f"{scale_name}_mean",
-                ]
-                st.dataframe(
-                    df_with_scores[preview_cols].head(),
-                    use_container_width=True,
-                )
+    if scales_config:
+        render_reliability_section(df, scales_config)
 
     return df_with_scores
+
+
+@perf_log
+def render_reliability_section(
+    df: pd.DataFrame, scales_config: Dict[str, List[str]]
+) -> None:
+    """尺度ごとの信頼性係数（α係数・I-T相関）を表示"""
+    st.markdown("##### Reliability")
+    try:
+        summary, item_stats = calculate_reliability(df, scales_config)
+    except Exception:
+        # 例外は calculate_reliability でログに記録済み
+        st.error("An error occurred while calculating the reliability.")
+        return
+
+    number_format = st.column_config.NumberColumn(format="%.3f")
+    st.dataframe(
+        summary.rename(
+            columns={
+                "n_items": "Items",
+                "n_respondents": "Respondents",
+                "alpha": "Cronbach's α",
+            }
+        ),
+        use_container_width=True,
+        column_config={"Cronbach's α": number_format},
+    )
+    st.caption(
+        "Rows with missing values in a scale are excluded from that scale's "
+        "reliability (listwise deletion)."
+    )
+
+    for scale_name, stats in item_stats.items():
+        with st.expander(f"Item statistics for {scale_name}"):
+            st.dataframe(
+                stats.rename(
+                    columns={
+                        "item_total_r": "Corrected Item-Total r",
+                        "alpha_if_deleted": "α if Item Deleted",
+                    }
+                ),
+                use_container_width=True,
+                column_config={
+                    "Corrected Item-Total r": number_format,
+                    "α if Item Deleted": number_format,
+                },
+            )
+            # 負のI-T相関は逆転項目の処理漏れの可能性がある
+            negative_items = stats.index[stats["item_total_r"] < 0].tolist()
+            if negative_items:
+                st.warning(
+                    "Negative item-total correlation: "
+                    f"{', '.join(negative_items)}. "
+                    "These items may need to be reverse-scored."
+                )
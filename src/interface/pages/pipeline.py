@@ -0,0 +1,113 @@
+from typing import Tuple
+
+import pandas as pd
+import streamlit as st
+
+from src.core.pipeline import (
+    PipelinePlan,
+    compile_pipeline,
+    parse_pipeline_spec,
+    run_pipeline,
+)
+from src.core.upload_cache import compute_content_hash
+from src.interface.components.display import display_download_button
+from src.interface.state import (
+    drop_dataframe,
+    get_dataframe_fingerprint,
+    load_dataframe,
+    store_dataframe,
+)
+from src.utils.logger_config import logger, perf_log
+
+
+@st.cache_data(max_entries=16)
+def compile_pipeline_spec(
+    spec_text: str, fmt: str, columns: Tuple[str, ...]
+) -> PipelinePlan:
+    """パイプライン仕様を解析して実行計画に変換（同じ仕様とカラム構成では再利用）"""
+    return compile_pipeline(parse_pipeline_spec(spec_text, fmt), list(columns))
+
+
+def clear_pipeline_result() -> None:
+    """保存したパイプラインの実行結果を削除"""
+    drop_dataframe("pipeline_processed_df")
+    drop_dataframe("pipeline_removed_df")
+    for key in ["pipeline_result_key", "pipeline_summary"]:
+        st.session_state.pop(key, None)
+
+
+@perf_log
+def render_pipeline_spec_section(df: pd.DataFrame) -> None:
+    """保存済みのパイプライン仕様を読み込んで一括実行するセクションを表示"""
+    with st.expander("Run a saved pipeline spec (optional)"):
+        st.write(
+            "Upload a JSON pipeline spec to run column selection, cleaning, "
+            "reverse-scoring and scale score calculation in one step."
+        )
+        spec_file = st.file_uploader(
+            "Choose a pipeline spec file",
+            type=["json"],
+            key="pipeline_spec_uploader",
+        )
+        if spec_file is None:
+            clear_pipeline_result()
+            return
+
+        spec_bytes = spec_file.getvalue()
+        try:
+            plan = compile_pipeline_spec(
+                spec_bytes.decode("utf-8"),
+                spec_file.name.split(".")[-1].lower(),
+                tuple(df.columns),
+            )
+        except ValueError as e:
+            st.error(f"Invalid pipeline spec: {str(e)}")
+            return
+
+        # 同じ仕様とデータの組み合わせでは保存した実行結果を再利用する
+        result_key = (
+            f"{compute_content_hash(spec_bytes)}:{get_dataframe_fingerprint(df)}"
+        )
+        processed_df = load_dataframe("pipeline_processed_df")
+        removed_df = load_dataframe("pipeline_removed_df")
+        if (
+            st.session_state.get("pipeline_result_key") != result_key
+            or processed_df is None
+            or removed_df is None
+        ):
+            try:
+                processed_df, removed_df, summary = run_pipeline(plan, df)
+            except Exception as e:
+                logger.error(f"Pipeline spec error: {str(e)}")
+                st.error("An error occurred while running the pipeline spec.")
+                clear_pipeline_result()
+                return
+            store_dataframe("pipeline_processed_df", processed_df)
+            store_dataframe("pipeline_removed_df", removed_df)
+            st.session_state.pipeline_summary = summary
+            st.session_state.pipeline_result_key = result_key
+
+        summary = st.session_state.pipeline_summary
+        st.write(
+            f"Kept {summary['cleaned_rows']} of {summary['total_rows']} rows "
+            f"({summary['removed_rows']} removed)."
+        )
+        st.dataframe(processed_df.head(), use_container_width=True)
+
+        # ファイルは「Prepare download」を押したときにのみ作成する
+        st.markdown("##### Processed data")
+        display_download_button(
+            processed_df,
+            "processed_data",
+            "Download Processed Data",
+            key="pipeline_processed",
+            data_fingerprint=f"{result_key}:processed",
+        )
+        st.markdown("##### Removed rows")
+        display_download_button(
+            removed_df,
+            "removed_rows",
+            "Download Removed Rows",
+            key="pipeline_removed",
+            data_fingerprint=f"{result_key}:removed",
+        )
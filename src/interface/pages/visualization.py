@@ -8,8 +8,10 @@ from src.interface.components.display import (
     display_statistics_summary,
 )
 from src.interface.components.input import input_visualization_columns
+from src.utils.logger_config import perf_log
 
 
+@perf_log
 def render_visualization_settings_section(df: pd.DataFrame) -> List[str]:
     """
     可視化用のカラム選択セクションを表示
@@ -31,6 +33,7 @@ def render_visualization_settings_section(df: pd.DataFrame) -> List[str]:
     return selected_columns
 
 
+@perf_log
 def render_visualization_section(df: pd.DataFrame, selected_columns: List[str]) -> None:
     """
     可視化ページ全体を表示
@@ -41,7 +44,12 @@ def render_visualization_section(df: pd.DataFrame, selected_columns: List[str])
     """
 
     # 可視化セクションを表示
+    # ページ切り替えなどの再実行後も表示を維持する（カラムの選択を変更した場合は再度ボタンを押す）
     if st.button("Visualize Data", type="primary"):
+        st.session_state.visualized_columns = list(selected_columns)
+        st.session_state.pop("histogram_page", None)
+
+    if st.session_state.get("visualized_columns") == list(selected_columns):
         # 統計情報のサマリテーブルを表示
         display_statistics_summary(df, selected_columns)
 
@@ -0,0 +1,252 @@
+"""
+開発者向けのプロファイリングパネル
+環境変数 SURVEY_APP_PROFILE または URL の ?profile=1 で有効にすると、ページの再実行ごとに
+cProfile で関数ごとの処理時間を計測し、st.dataframe / st.data_editor / st.plotly_chart で
+ブラウザに送るデータのサイズとあわせてサイドバーに表示する
+"""
+
+import cProfile
+import functools
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pandas as pd
+import streamlit as st
+
+from src.utils.logger_config import logger
+
+PROFILE_ENV = "SURVEY_APP_PROFILE"
+# 関数ごとの内訳に表示する関数の数
+PROFILE_TOP_FUNCTIONS = 25
+# データサイズを計測する Streamlit の要素
+PROFILED_ELEMENTS = ["dataframe", "data_editor", "plotly_chart"]
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# 計測中のスレッドの記録先（他のセッションのスレッドの呼び出しは記録しない）
+_active = threading.local()
+# 記録用のラッパーは計測中の再実行がある間だけ st に設定する（計測中の再実行の数で管理）
+_hooks_lock = threading.Lock()
+_hooks_users = 0
+_original_elements: Dict[str, Any] = {}
+
+
+def is_profiling_enabled() -> bool:
+    """
+    プロファイリングが有効かどうかを判定
+    URL の ?profile=1 / ?profile=0 で切り替えた場合はセッション内で保持する
+    Returns:
+        bool: 有効な場合はTrue
+    """
+    profile_param = st.query_params.get("profile")
+    if profile_param is not None:
+        st.session_state.profiling_enabled = profile_param == "1"
+    if "profiling_enabled" in st.session_state:
+        return st.session_state.profiling_enabled
+    return os.environ.get(PROFILE_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def measure_payload_bytes(element: str, data: Any) -> Dict[str, Any]:
+    """
+    要素に渡したデータをブラウザに送る形式に変換した場合のサイズを計測
+    データフレームは Arrow IPC、グラフは Plotly の JSON のサイズを計測する
+
+    Args:
+        element (str): 要素の種類（PROFILED_ELEMENTS）
+        data (Any): 要素に渡したデータ
+    Returns:
+        Dict[str, Any]: rows, cols, bytes（計測できない場合は None）
+    """
+    if element == "plotly_chart":
+        to_json = getattr(data, "to_json", None)
+        size = len(to_json().encode("utf-8")) if to_json is not None else None
+        return {"rows": None, "cols": None, "bytes": size}
+
+    import pyarrow as pa
+
+    # Styler の場合は元のデータフレームを計測する
+    df = data if isinstance(data, pd.DataFrame) else getattr(data, "data", data)
+    if not isinstance(df, pd.DataFrame):
+        df = pd.DataFrame(df)
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=True)
+    except (pa.ArrowException, TypeError, ValueError):
+        # Streamlit は変換できない型を文字列に変換して送る
+        table = pa.Table.from_pandas(df.astype(str), preserve_index=True)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return {"rows": df.shape[0], "cols": df.shape[1], "bytes": sink.tell()}
+
+
+def _record_element(element: str, original):
+    """要素の呼び出しを記録するラッパーを作成"""
+
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        payloads = getattr(_active, "payloads", None)
+        if payloads is not None:
+            data = args[0] if args else kwargs.get("data", kwargs.get("figure_or_data"))
+            caller = sys._getframe(1)
+            try:
+                payload = measure_payload_bytes(element, data)
+            except Exception:
+                payload = {"rows": None, "cols": None, "bytes": None}
+            payloads.append(
+                {
+                    "element": element,
+                    "location": f"{Path(caller.f_code.co_filename).name}:{caller.f_lineno}",
+                    **payload,
+                }
+            )
+        return original(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def _element_hooks() -> Iterator[None]:
+    """
+    with 文の区間で st.dataframe などを記録用のラッパーに置き換え、終了時に元に戻す
+    複数のセッションで同時に計測する場合は、最後の計測が終わった時点で元に戻す
+    """
+    global _hooks_users
+    with _hooks_lock:
+        if _hooks_users == 0:
+            for element in PROFILED_ELEMENTS:
+                original = getattr(st, element)
+                _original_elements[element] = original
+                setattr(st, element, _record_element(element, original))
+        _hooks_users += 1
+    try:
+        yield
+    finally:
+        with _hooks_lock:
+            _hooks_users -= 1
+            if _hooks_users == 0:
+                for element, original in _original_elements.items():
+                    setattr(st, element, original)
+                _original_elements.clear()
+
+
+def summarize_profile(
+    stats: pstats.Stats, top: int = PROFILE_TOP_FUNCTIONS, project_only: bool = True
+) -> pd.DataFrame:
+    """
+    cProfile の計測結果を関数ごとの表に変換（累積時間の降順）
+    Args:
+        stats (pstats.Stats): 計測結果
+        top (int): 表示する関数の数
+        project_only (bool): このリポジトリ内の関数のみに絞るか
+    Returns:
+        pd.DataFrame: Function, Calls, Own [ms], Total [ms] のデータフレーム
+    """
+    rows = []
+    for (file_name, line, func_name), (_, calls, own, total, _) in stats.stats.items():  # type: ignore[attr-defined]
+        path = Path(file_name)
+        if project_only:
+            if not path.is_absolute() or PROJECT_ROOT not in path.parents:
+                continue
+            path = path.relative_to(PROJECT_ROOT)
+        rows.append(
+            {
+                "Function": f"{func_name} ({path}:{line})",
+                "Calls": calls,
+                "Own [ms]": own * 1000,
+                "Total [ms]": total * 1000,
+            }
+        )
+    summary = pd.DataFrame(
+        rows, columns=["Function", "Calls", "Own [ms]", "Total [ms]"]
+    )
+    return (
+        summary.sort_values("Total [ms]", ascending=False)
+        .head(top)
+        .reset_index(drop=True)
+    )
+
+
+@contextmanager
+def profile_page_run() -> Iterator[None]:
+    """
+    with 文の区間（ページの実行）を計測し、結果をセッション状態に保存する
+    プロファイリングが無効の場合は何もしない
+    """
+    if not is_profiling_enabled():
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as e:
+        # 他のプロファイラが動作している場合
+        logger.warning(f"Profiling skipped: {str(e)}")
+        yield
+        return
+
+    _active.payloads = []
+    start = time.perf_counter()
+    try:
+        with _element_hooks():
+            yield
+    finally:
+        profiler.disable()
+        st.session_state.profiling_report = {
+            "page": st.session_state.get("current_page"),
+            "wall_ms": (time.perf_counter() - start) * 1000,
+            "stats": pstats.Stats(profiler, stream=io.StringIO()),
+            "payloads": _active.payloads,
+        }
+        _active.payloads = None
+
+
+def render_profiling_panel() -> None:
+    """直前のページの実行の計測結果をサイドバーに表示"""
+    if not is_profiling_enabled():
+        return
+    report = st.session_state.get("profiling_report")
+    if report is None:
+        return
+
+    with st.sidebar.expander("🔬 Profiling", expanded=True):
+        st.caption(f"Last rerun of {report['page']}: {report['wall_ms']:.0f} ms")
+
+        project_only = st.checkbox(
+            "Only functions in this app", value=True, key="profiling_project_only"
+        )
+        st.dataframe(
+            summarize_profile(report["stats"], project_only=project_only),
+            hide_index=True,
+            column_config={
+                col: st.column_config.NumberColumn(format="%.1f")
+                for col in ["Own [ms]", "Total [ms]"]
+            },
+        )
+
+        payloads: List[Dict[str, Any]] = report["payloads"]
+        if payloads:
+            payload_df = pd.DataFrame(payloads)
+            total_bytes = payload_df["bytes"].sum()
+            st.caption(
+                f"Payloads sent to the browser: {total_bytes / 1024:.1f} KiB "
+                f"in {len(payload_df)} elements"
+            )
+            st.dataframe(payload_df, hide_index=True)
+
+        # pstats 形式（pstats.Stats(path) で読み込める）
+        st.download_button(
+            "Download pstats",
+            data=marshal.dumps(report["stats"].stats),  # type: ignore[attr-defined]
+            file_name="rerun.pstats",
+            mime="application/octet-stream",
+            key="profiling_download",
+        )
@@ -1,9 +1,156 @@
-from typing import List, Tuple
+import hashlib
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from src.core.cleaning import remove_invalid_responses
+from src.core.cleaning import (
+    CLEANING_RULES,
+    combine_rule_masks,
+    detect_invalid_response_masks,
+    encode_removal_reasons,
+)
+from src.core.dataframe_operation import compute_dataframe_fingerprint
+from src.core.session_store import (
+    delete_frame,
+    evict_idle_sessions,
+    get_frame,
+    put_frame,
+    touch_session,
+)
+from src.utils.logger_config import logger
+
+# セッションごとに保持するルール判定結果の最大件数
+MAX_CACHED_RULE_MASKS = 4
+
+# 読み込んだデータフレームのハッシュ値（id -> (弱参照, ハッシュ値)）
+# 複数のセッションのスレッドから更新されるため、読み書きは _fingerprints_lock の中で行う
+_known_fingerprints: Dict[int, Tuple[weakref.ref, str]] = {}
+_fingerprints_lock = threading.Lock()
+
+
+def get_session_id() -> str:
+    """セッションのデータを保存する際に使用するIDを取得"""
+    if "session_store_id" not in st.session_state:
+        st.session_state.session_store_id = uuid.uuid4().hex
+    return st.session_state.session_store_id
+
+
+def store_dataframe(key: str, df: pd.DataFrame) -> None:
+    """
+    データフレームをセッションのデータストアに保存（セッション状態には参照のみ保持する）
+    Args:
+        key (str): セッション状態のキー
+        df (pd.DataFrame): 保存するデータフレーム
+    """
+    drop_dataframe(key)
+    st.session_state[key] = put_frame(get_session_id(), df)
+
+
+def load_dataframe(key: str) -> pd.DataFrame | None:
+    """
+    セッションのデータストアからデータフレームを取得
+    Args:
+        key (str): セッション状態のキー
+    Returns:
+        pd.DataFrame | None: 保存されたデータフレーム（未保存・期限切れの場合はNone）
+    """
+    handle = st.session_state.get(key)
+    if handle is None:
+        return None
+    try:
+        df = get_frame(handle)
+    except FileNotFoundError:
+        logger.warning(f"Session data '{key}' expired and was removed")
+        del st.session_state[key]
+        return None
+
+    # アップロードされたデータは保存済みのハッシュ値を再利用できるよう記録する
+    if key == "uploaded_df" and st.session_state.get("uploaded_fingerprint"):
+        remember_fingerprint(df, st.session_state.uploaded_fingerprint)
+    return df
+
+
+def has_dataframe(key: str) -> bool:
+    """データフレームがセッションのデータストアに保存されているか確認"""
+    return st.session_state.get(key) is not None
+
+
+def drop_dataframe(key: str) -> None:
+    """セッションのデータストアからデータフレームを削除"""
+    handle = st.session_state.pop(key, None)
+    if handle is not None:
+        delete_frame(handle)
+
+
+def remember_fingerprint(df: pd.DataFrame, data_fingerprint: str) -> None:
+    """
+    データフレームのハッシュ値を記録（同じオブジェクトに対する再計算を省略する）
+    Args:
+        df (pd.DataFrame): 対象のデータフレーム
+        data_fingerprint (str): ハッシュ値
+    """
+    with _fingerprints_lock:
+        for obj_id in [
+            k for k, (ref, _) in _known_fingerprints.items() if ref() is None
+        ]:
+            del _known_fingerprints[obj_id]
+        _known_fingerprints[id(df)] = (weakref.ref(df), data_fingerprint)
+
+
+def get_dataframe_fingerprint(df: pd.DataFrame) -> str:
+    """
+    データフレームのハッシュ値を取得（アップロードされたデータの場合は保存済みの値を使用）
+    Args:
+        df (pd.DataFrame): 対象のデータフレーム
+    Returns:
+        str: ハッシュ値
+    """
+    with _fingerprints_lock:
+        known = _known_fingerprints.get(id(df))
+    if known is not None and known[0]() is df:
+        return known[1]
+    return compute_dataframe_fingerprint(df)
+
+
+def get_rule_masks(
+    df_to_process: pd.DataFrame,
+    likert_scale_case: int,
+    data_fingerprint: str | None = None,
+) -> Dict[str, np.ndarray]:
+    """
+    全ルールの判定結果を取得（データ・カラム選択・リッカート尺度が同じ場合はキャッシュを使用）
+    Args:
+        df_to_process (pd.DataFrame): 処理対象のデータフレーム
+        likert_scale_case (int): リッカート尺度のポイント数
+        data_fingerprint (str | None): 元データのハッシュ値（省略時は処理対象から計算）
+    Returns:
+        Dict[str, np.ndarray]: ルール名ごとの真偽値マスク
+    """
+    if data_fingerprint is None:
+        data_fingerprint = compute_dataframe_fingerprint(df_to_process)
+    cache_key = (data_fingerprint, tuple(df_to_process.columns), likert_scale_case)
+
+    if "rule_mask_cache" not in st.session_state:
+        st.session_state.rule_mask_cache = OrderedDict()
+    cache = st.session_state.rule_mask_cache
+
+    if cache_key in cache:
+        cache.move_to_end(cache_key)
+        return cache[cache_key]
+
+    masks, _ = detect_invalid_response_masks(
+        df_to_process, likert_scale_case, True, True, True, True
+    )
+    cache[cache_key] = masks
+    while len(cache) > MAX_CACHED_RULE_MASKS:
+        cache.popitem(last=False)
+    return masks
 
 
 def initialize_cleaning_state(
@@ -11,15 +158,86 @@ def initialize_cleaning_state(
     df_not_to_process: pd.DataFrame,
     likert_scale_case: int,
     reqs: tuple[bool, bool, bool, bool],
+    data_fingerprint: str | None = None,
 ) -> None:
     """クリーニング処理の初期化と実行"""
-    req1, req2, req3, req4 = reqs
-    remove_rows = remove_invalid_responses(
-        df_to_process, likert_scale_case, req1, req2, req3, req4
+    # キャッシュした全ルールの判定結果から、選択されたルールのみを組み合わせる
+    all_masks = get_rule_masks(df_to_process, likert_scale_case, data_fingerprint)
+    masks = {rule: all_masks[rule] for rule, on in zip(CLEANING_RULES, reqs) if on}
+    remove_mask = combine_rule_masks(masks, len(df_to_process))
+
+    # 元データを1つだけ保持し、削除・保持の状態は真偽値マスクで管理する
+    # 処理対象と対象外のカラムがアップロードされたデータと一致する場合はそのまま参照する
+    uploaded_df = load_dataframe("uploaded_df")
+    if (
+        uploaded_df is not None
+        and set(uploaded_df.columns)
+        == set(df_not_to_process.columns) | set(df_to_process.columns)
+        and uploaded_df.index.equals(df_to_process.index)
+    ):
+        drop_dataframe("cleaning_base_df")
+        st.session_state.cleaning_base_key = "uploaded_df"
+        index = uploaded_df.index
+    else:
+        base_df = pd.concat([df_not_to_process, df_to_process], axis=1)
+        store_dataframe("cleaning_base_df", base_df)
+        st.session_state.cleaning_base_key = "cleaning_base_df"
+        index = base_df.index
+
+    st.session_state.removed_mask = remove_mask
+    # 削除対象のうち最終データに残す行（Keep This Row で選択された行）
+    st.session_state.keep_mask = np.zeros(len(remove_mask), dtype=bool)
+    # 削除理由（ルールごとのビット）を回答者ごとに保持
+    st.session_state.removal_reasons = pd.Series(
+        encode_removal_reasons(masks, len(remove_mask)), index=index
+    )
+    # 検出結果が変わった場合に以前の編集内容を引き継がないようキーを更新する
+    st.session_state.editor_key = st.session_state.get("editor_key", -1) + 1
+
+
+def has_cleaning_results() -> bool:
+    """クリーニング結果がセッションに保存されているか確認"""
+    return "removed_mask" in st.session_state and has_dataframe(
+        st.session_state.get("cleaning_base_key", "cleaning_base_df")
     )
-    all_df = pd.concat([df_not_to_process, df_to_process], axis=1)
-    st.session_state.cleaned_df = all_df.drop(index=remove_rows)
-    st.session_state.removed_df = all_df.loc[remove_rows]
+
+
+def get_cleaning_base() -> pd.DataFrame:
+    """クリーニング対象の元データ（全行・全カラム）を取得"""
+    return load_dataframe(st.session_state.cleaning_base_key)
+
+
+def get_cleaned_data() -> pd.DataFrame:
+    """削除対象を除いたデータを取得（表示・出力時にマスクから作成する）"""
+    return get_cleaning_base()[~st.session_state.removed_mask]
+
+
+def get_removed_data() -> pd.DataFrame:
+    """削除対象として検出された行を取得"""
+    return get_cleaning_base()[st.session_state.removed_mask]
+
+
+def get_final_dataset() -> pd.DataFrame:
+    """最終データ（削除対象以外と、保持を選択した行）を元の行の順序で取得"""
+    return get_cleaning_base()[
+        ~st.session_state.removed_mask | st.session_state.keep_mask
+    ]
+
+
+def get_final_dataset_fingerprint() -> str:
+    """
+    最終データのハッシュ値を取得（データ全体ではなく元データのハッシュ値とマスクから計算）
+    Returns:
+        str: ハッシュ値
+    """
+    if st.session_state.cleaning_base_key == "uploaded_df":
+        base_fingerprint = st.session_state.uploaded_fingerprint
+    else:
+        base_fingerprint = get_dataframe_fingerprint(get_cleaning_base())
+    final_mask = ~st.session_state.removed_mask | st.session_state.keep_mask
+    hasher = hashlib.sha256(base_fingerprint.encode())
+    hasher.update(np.packbits(final_mask).tobytes())
+    return hasher.hexdigest()
 
 
 def check_data_settings_completion(
@@ -77,11 +295,15 @@ def check_file_upload_completion(df: pd.DataFrame | None) -> bool:
 
 def reset_cleaning_state() -> None:
     """クリーニング関連の全セッション状態をリセット"""
+    drop_dataframe("cleaning_base_df")
+
     keys_to_remove = [
         "cleaning_executed",
-        "cleaned_df",
-        "removed_df",
-        "removed_df_with_checkbox",
+        "cleaning_settings",
+        "cleaning_base_key",
+        "removed_mask",
+        "keep_mask",
+        "removal_reasons",
         "editor_key",
     ]
     for key in keys_to_remove:
@@ -142,17 +364,36 @@ def initialize_app_state() -> None:
         st.session_state.uploaded_df = None
     if "use_sample" not in st.session_state:
         st.session_state.use_sample = False
+    if "uploaded_fingerprint" not in st.session_state:
+        st.session_state.uploaded_fingerprint = None
+
+    # 期限切れのセッションのファイルを削除し、このセッションの最終アクセス時刻を更新
+    evict_idle_sessions()
+    touch_session(get_session_id())
 
 
 def save_uploaded_data(df: pd.DataFrame, is_sample: bool = False) -> None:
-    """アップロードされたデータを保存"""
-    st.session_state.uploaded_df = df
+    """アップロードされたデータを保存（以前のデータのクリーニング結果は破棄する）"""
+    reset_cleaning_state()
+    store_dataframe("uploaded_df", df)
     st.session_state.use_sample = is_sample
+    # クリーニング結果のキャッシュのキーとして使用する
+    st.session_state.uploaded_fingerprint = compute_dataframe_fingerprint(df)
+    remember_fingerprint(df, st.session_state.uploaded_fingerprint)
+
+
+def clear_uploaded_data() -> None:
+    """アップロードされたデータとそのクリーニング結果を削除"""
+    reset_cleaning_state()
+    drop_dataframe("uploaded_df")
+    st.session_state.uploaded_df = None
+    st.session_state.use_sample = False
+    st.session_state.uploaded_fingerprint = None
 
 
 def get_uploaded_data() -> Tuple[pd.DataFrame | None, bool]:
     """保存されたデータを取得"""
-    return st.session_state.uploaded_df, st.session_state.use_sample
+    return load_dataframe("uploaded_df"), st.session_state.use_sample
 
 
 def check_visualization_selection_completion(selected_columns: list) -> bool:
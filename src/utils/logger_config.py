@@ -1,6 +1,18 @@
+import functools
+import json
 import logging
 import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
 from logging.handlers import RotatingFileHandler
+from typing import Any, Callable, Dict, Iterator, List, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# 処理時間・メモリの計測ログ。"1" で処理時間とピークメモリ、"time" で処理時間のみを出力する
+PERF_LOG_ENV = "SURVEY_APP_PERF_LOG"
 
 
 def setup_logger():
@@ -52,4 +64,164 @@ def setup_logger():
     return logger
 
 
+def setup_perf_logger():
+    """
+    計測ログ用のロガーを設定する
+    1行に1つのJSONを出力するため、アプリケーションのロガーとは別のフォーマットを使用する
+    """
+    perf_logger = logging.getLogger("survey_cleaning_app.perf")
+    perf_logger.setLevel(logging.INFO)
+    perf_logger.propagate = False
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    perf_logger.handlers.clear()
+    perf_logger.addHandler(handler)
+
+    return perf_logger
+
+
 logger = setup_logger()
+perf_logger = setup_perf_logger()
+
+_perf_enabled = False
+_perf_trace_memory = False
+# set_perf_logging で tracemalloc を開始したか（無効にする際に停止するため）
+_perf_started_tracing = False
+# スレッドごとの計測中の区間（Streamlit はセッションの再実行をスレッドごとに行う）
+_perf_local = threading.local()
+# 全スレッドで計測中の区間。tracemalloc のピークはプロセス全体で1つのため、
+# リセットする前に計測中の全区間へそれまでのピークを引き継ぐ
+_perf_memory_lock = threading.Lock()
+_perf_active_spans: Dict[int, Dict[str, Any]] = {}
+
+
+def set_perf_logging(mode: str | None) -> None:
+    """
+    計測ログの出力を切り替える
+    Args:
+        mode (str | None): "1" / "true" / "on"（処理時間とピークメモリ）、"time"（処理時間のみ）、
+            それ以外は無効
+    """
+    global _perf_enabled, _perf_trace_memory, _perf_started_tracing
+    mode = (mode or "").strip().lower()
+    _perf_enabled = mode in {"1", "true", "yes", "on", "time"}
+    _perf_trace_memory = _perf_enabled and mode != "time"
+
+    # tracemalloc はプロセス全体に影響するため、区間ごとではなくここで開始・停止する
+    if _perf_trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _perf_started_tracing = True
+    elif not _perf_trace_memory and _perf_started_tracing:
+        tracemalloc.stop()
+        _perf_started_tracing = False
+
+
+def is_perf_logging_enabled() -> bool:
+    """計測ログが有効かどうか"""
+    return _perf_enabled
+
+
+def _frame_shape(values) -> tuple[int, int] | None:
+    """引数の中で最初に見つかった2次元のデータ（DataFrame / ndarray）の行数と列数"""
+    for value in values:
+        shape = getattr(value, "shape", None)
+        if isinstance(shape, tuple) and len(shape) == 2:
+            return int(shape[0]), int(shape[1])
+    return None
+
+
+def _thread_stack() -> List[Dict[str, Any]]:
+    """現在のスレッドで計測中の区間のリスト"""
+    stack = getattr(_perf_local, "stack", None)
+    if stack is None:
+        stack = _perf_local.stack = []
+    return stack
+
+
+@contextmanager
+def _measure(name: str, shape: tuple[int, int] | None) -> Iterator[Dict[str, Any]]:
+    """
+    区間の処理時間とピークメモリを計測し、終了時にJSONの1行として出力する
+    ピークメモリはプロセス全体の値のため、同時に実行中の他のスレッドの確保分も含む
+    """
+    trace_memory = _perf_trace_memory and tracemalloc.is_tracing()
+    stack = _thread_stack()
+
+    span: Dict[str, Any] = {"peak": 0}
+    if trace_memory:
+        with _perf_memory_lock:
+            current, peak = tracemalloc.get_traced_memory()
+            for active in _perf_active_spans.values():
+                active["peak"] = max(active["peak"], peak)
+            tracemalloc.reset_peak()
+            span["start"] = current
+            _perf_active_spans[id(span)] = span
+    stack.append(span)
+
+    record: Dict[str, Any] = {"event": "perf", "name": name}
+    if shape is not None:
+        record["rows"], record["cols"] = shape
+    status = "ok"
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        record["wall_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        stack.pop()
+        if trace_memory:
+            with _perf_memory_lock:
+                peak = max(tracemalloc.get_traced_memory()[1], span["peak"])
+                del _perf_active_spans[id(span)]
+            record["peak_bytes"] = max(peak - span["start"], 0)
+        record["depth"] = len(stack)
+        record["thread"] = threading.current_thread().name
+        record["status"] = status
+        perf_logger.info(json.dumps(record, default=str))
+
+
+def perf_span(name: str, data=None):
+    """
+    with 文の区間の処理時間・行数と列数・ピークメモリを計測ログに出力するコンテキストマネージャ
+    計測ログが無効の場合は何もしない
+    Args:
+        name (str): ログに出力する区間の名前
+        data: 行数と列数を記録するデータ（DataFrame / ndarray、省略可）
+    Returns:
+        ContextManager: with 文で使用するコンテキストマネージャ（有効時は出力する辞書を返す）
+    """
+    if not _perf_enabled:
+        return nullcontext({})
+    return _measure(name, _frame_shape((data,)))
+
+
+def perf_log(func: F) -> F:
+    """
+    関数の処理時間・行数と列数・ピークメモリを計測ログに出力するデコレータ
+    行数と列数は最初の2次元の引数（なければ戻り値）から取得する
+    計測ログが無効の場合は元の関数をそのまま呼び出す
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _perf_enabled:
+            return func(*args, **kwargs)
+        shape = _frame_shape(args) or _frame_shape(kwargs.values())
+        with _measure(name, shape) as record:
+            result = func(*args, **kwargs)
+            if shape is None:
+                output_shape = _frame_shape(
+                    result if isinstance(result, tuple) else (result,)
+                )
+                if output_shape is not None:
+                    record["rows"], record["cols"] = output_shape
+            return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+set_perf_logging(os.environ.get(PERF_LOG_ENV))
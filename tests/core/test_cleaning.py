@@ -1,10 +1,20 @@
+import numpy as np
 import pandas as pd
 
 from src.core.cleaning import (
+    MISSING,
+    OUT_OF_RANGE,
+    REASON_BITS,
+    STEP_PATTERN,
+    STRAIGHT_LINE,
+    describe_removal_reasons,
+    detect_invalid_response_masks,
+    encode_removal_reasons,
     remove_invalid_responses,
     remove_missing_values,
     remove_out_of_range_values,
     remove_step_pattern_responses,
+    remove_step_pattern_responses_vectorized,
     remove_straight_line_responses,
 )
 
@@ -234,3 +244,140 @@ def test_remove_invalid_responses_with_step_pattern():
     # 検証
     assert len(remove_rows) == 2  # 両方の行が検出される
     assert set(remove_rows) == {0, 1}
+
+
+def test_remove_step_pattern_responses_vectorized_matches_reference():
+    """ベクトル化した階段パターン検出が参照実装と一致することをテスト"""
+    rng = np.random.default_rng(0)
+    likert_scale = 5
+    n_items = 8
+
+    # ランダムな回答（範囲外の値を含む）
+    random_rows = rng.integers(-1, likert_scale + 2, size=(300, n_items)).astype(float)
+
+    # 昇順・降順・山型・谷型の階段パターン（循環ケースを含む）
+    step_rows = []
+    for _ in range(100):
+        value = int(rng.integers(1, likert_scale + 1))
+        row = [value]
+        for _ in range(n_items - 1):
+            if rng.random() < 0.5:
+                value = 1 if value == likert_scale else value + 1
+            else:
+                value = likert_scale if value == 1 else value - 1
+            row.append(value)
+        step_rows.append(row)
+    step_rows_arr = np.array(step_rows, dtype=float)
+
+    # 欠損値を含む階段パターン
+    missing_rows = step_rows_arr[:20].copy()
+    missing_rows[:, 3] = np.nan
+
+    # 範囲外の値で±1の変化をするパターン（0→1→2 など）
+    out_of_range_steps = np.array([[0, 1, 2, 3, 4, 5, 1, 2], [-1, 0, 1, 5, 4, 3, 2, 1]])
+
+    straight_rows = np.full((5, n_items), 3.0)
+
+    values = np.vstack(
+        [random_rows, step_rows_arr, missing_rows, out_of_range_steps, straight_rows]
+    )
+    # 行ラベルが連番でない場合も同じラベルが返ることを確認
+    df = pd.DataFrame(
+        values,
+        columns=[f"Q{i}" for i in range(1, n_items + 1)],
+        index=np.arange(len(values)) * 3 + 10,
+    )
+
+    expected = remove_step_pattern_responses(df, likert_scale)
+    actual = remove_step_pattern_responses_vectorized(df, likert_scale)
+
+    assert len(expected) > 100
+    assert actual == expected
+
+
+def test_detect_invalid_response_masks_matches_detectors():
+    """一括判定のルール別マスクが個別の検出関数と一致することをテスト"""
+    rng = np.random.default_rng(1)
+    values = rng.integers(0, 8, size=(200, 6)).astype(float)
+    values[rng.random(values.shape) < 0.05] = np.nan
+    values[:10] = 4  # ストレートライン
+    values[10:15] = [1, 2, 3, 4, 5, 6]  # 階段パターン
+    values[15, :5] = np.nan  # 回答が1つだけの行
+    df = pd.DataFrame(values, columns=[f"Q{i}" for i in range(1, 7)])
+
+    masks, combined = detect_invalid_response_masks(
+        df,
+        likert_scale=6,
+        remove_straight_lines=True,
+        remove_missing=True,
+        remove_out_of_range=True,
+        remove_step_pattern=True,
+    )
+
+    def rows(mask):
+        return set(df.index[mask])
+
+    assert rows(masks[STRAIGHT_LINE]) == set(remove_straight_line_responses(df))
+    assert rows(masks[MISSING]) == set(remove_missing_values(df))
+    assert rows(masks[OUT_OF_RANGE]) == set(remove_out_of_range_values(df, 6))
+    assert rows(masks[STEP_PATTERN]) == set(remove_step_pattern_responses(df, 6))
+    assert rows(combined) == set().union(*(rows(mask) for mask in masks.values()))
+
+    # 無効なルールのマスクは返されない
+    masks, combined = detect_invalid_response_masks(
+        df, likert_scale=6, remove_missing=True
+    )
+    assert list(masks) == [MISSING]
+    assert rows(combined) == set(remove_missing_values(df))
+
+
+def test_encode_and_describe_removal_reasons():
+    """削除理由のビットマスクの作成と表示用テキストへの変換をテスト"""
+    masks = {
+        STRAIGHT_LINE: np.array([True, False, False, True]),
+        STEP_PATTERN: np.array([False, True, False, True]),
+        MISSING: np.array([False, False, False, True]),
+    }
+    reasons = encode_removal_reasons(masks, 4)
+
+    assert reasons.dtype == np.uint8
+    assert reasons.tolist() == [
+        REASON_BITS[STRAIGHT_LINE],
+        REASON_BITS[STEP_PATTERN],
+        0,
+        REASON_BITS[STRAIGHT_LINE] | REASON_BITS[STEP_PATTERN] | REASON_BITS[MISSING],
+    ]
+    assert describe_removal_reasons(reasons).tolist() == [
+        "Straight-line",
+        "Step pattern",
+        "",
+        "Straight-line, Missing values, Step pattern",
+    ]
+
+
+def test_detect_invalid_response_masks_compact_dtypes():
+    """1バイト整数型（int8 / Int8）のデータでも判定結果が変わらないことをテスト"""
+    rng = np.random.default_rng(2)
+    values = rng.integers(0, 8, size=(200, 6)).astype(float)
+    values[:10] = 4
+    values[10:15] = [6, 5, 4, 3, 2, 1]
+    df_int8 = pd.DataFrame(values.astype("int8"), columns=[f"Q{i}" for i in range(6)])
+
+    values[rng.random(values.shape) < 0.05] = np.nan
+    values[12, 0] = np.nan  # 欠損値を含む階段パターン
+    df_float = pd.DataFrame(values, columns=[f"Q{i}" for i in range(6)])
+    df_nullable = df_float.astype("Int8")
+
+    for df_compact, df_reference in [
+        (df_int8, df_int8.astype(float)),
+        (df_nullable, df_float),
+    ]:
+        masks, combined = detect_invalid_response_masks(
+            df_compact, 6, True, True, True, True
+        )
+        expected_masks, expected_combined = detect_invalid_response_masks(
+            df_reference, 6, True, True, True, True
+        )
+        for rule in expected_masks:
+            np.testing.assert_array_equal(masks[rule], expected_masks[rule])
+        np.testing.assert_array_equal(combined, expected_combined)
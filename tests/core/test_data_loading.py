@@ -0,0 +1,83 @@
+import io
+
+import pandas as pd
+import streamlit as st
+
+from src.core import data_loading
+from src.core.data_loading import (
+    load_and_validate_arrow,
+    load_and_validate_csv,
+    load_and_validate_excel,
+)
+from src.core.export import serialize_dataframe
+from src.core.upload_cache import clear_upload_cache
+
+
+def create_excel_file(sheets: dict) -> io.BytesIO:
+    """テスト用のExcelファイルを作成"""
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    buffer.seek(0)
+    return buffer
+
+
+def test_load_and_validate_csv():
+    """CSVファイルの読み込みとバリデーションをテスト"""
+    clear_upload_cache()
+    df = load_and_validate_csv(io.BytesIO(b"Q1,Q2\n1,2\n3,\n"))
+    assert df.shape == (2, 2)
+    # リッカート尺度の項目は1バイトの整数型で保持される
+    assert df["Q1"].dtype == "int8"
+    assert df["Q2"].dtype == "Int8"
+
+    # 1カラムのみのファイルは無効
+    assert load_and_validate_csv(io.BytesIO(b"Q1\n1\n2\n")) is None
+
+
+def test_load_and_validate_arrow():
+    """Parquet / Feather ファイルの読み込みをテスト（カラムの型が保持される）"""
+    clear_upload_cache()
+    df = pd.DataFrame(
+        {
+            "ID": ["001", "002"],
+            "Q1": pd.Series([1, 2], dtype="int8"),
+            "Q2": pd.Series([3, None], dtype="Int8"),
+        }
+    )
+    for export_format, file_format in [("Parquet", "parquet"), ("Feather", "feather")]:
+        content = io.BytesIO(serialize_dataframe(df, export_format))
+        loaded = load_and_validate_arrow(content, file_format)
+        pd.testing.assert_frame_equal(loaded, df)
+
+
+def test_load_and_validate_excel_opens_workbook_once(monkeypatch):
+    """Excelファイルのワークブックを開く回数が1回であることをテスト"""
+    clear_upload_cache()
+    for key in ["excel_file_id", "excel_sheets", "selected_sheet", "sheet_confirmed"]:
+        if key in st.session_state:
+            del st.session_state[key]
+
+    opened = []
+    original = data_loading.open_excel_workbook
+
+    def counting_open(content):
+        opened.append(content)
+        return original(content)
+
+    monkeypatch.setattr(data_loading, "open_excel_workbook", counting_open)
+
+    expected = pd.DataFrame({"Q1": [1, 2, 3], "Q2": [4, 5, 6]})
+    file = create_excel_file({"responses": expected})
+
+    # 初回はシート名の取得とシートの解析で1回だけ開く
+    df = load_and_validate_excel(file)
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert len(opened) == 1
+
+    # 再実行時はセッション状態とキャッシュを使い、ワークブックを開かない
+    df = load_and_validate_excel(file)
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert len(opened) == 1
+    clear_upload_cache()
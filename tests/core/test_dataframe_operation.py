@@ -1,6 +1,11 @@
+import numpy as np
 import pandas as pd
 
-from src.core.dataframe_operation import create_final_dataset, split_dataframe
+from src.core.dataframe_operation import (
+    compute_dataframe_fingerprint,
+    downcast_likert_columns,
+    split_dataframe,
+)
 
 
 def test_split_dataframe_basic():
@@ -14,15 +19,45 @@ def test_split_dataframe_basic():
     assert list(df_exclude.columns) == ["ID"]
 
 
-def test_create_final_dataset_basic():
-    """基本的な最終データセット作成のテスト"""
-    cleaned_df = pd.DataFrame({"Q1": [1, 2], "Q2": [3, 4]})
-    removed_df = pd.DataFrame({"Q1": [5], "Q2": [6]})
-
-    # 行を復元しない場合
-    result = create_final_dataset(cleaned_df, removed_df, [])
-    assert len(result) == 2
-
-    # 行を復元する場合
-    result = create_final_dataset(cleaned_df, removed_df, [0])
-    assert len(result) == 3
+def test_downcast_likert_columns():
+    """リッカート尺度の項目が1バイトの整数型に変換されることをテスト"""
+    df = pd.DataFrame(
+        {
+            "ID": ["1", "2", "3"],
+            "Q1": [1, 5, 7],  # 整数 → int8
+            "Q2": [1.0, np.nan, 3.0],  # 欠損値を含む整数 → Int8
+            "score": [1.5, 2.0, 3.0],  # 小数を含む → 変換しない
+            "user_id": [100, 2000, 30000],  # int8の範囲外 → 変換しない
+            "age": [20, 35, 60],  # リッカート尺度の範囲外 → 変換しない
+            "count": [0, 3, 10],  # 0〜10点の範囲内 → int8
+        }
+    )
+    result = downcast_likert_columns(df)
+
+    assert result["Q1"].dtype == "int8"
+    assert result["Q2"].dtype == "Int8"
+    assert result["Q2"].isna().tolist() == [False, True, False]
+    assert result["score"].dtype == "float64"
+    assert result["user_id"].dtype == "int64"
+    assert result["age"].dtype == "int64"
+    assert result["count"].dtype == "int8"
+    assert result["ID"].dtype == object
+
+
+def test_compute_dataframe_fingerprint():
+    """データフレームのハッシュ値計算のテスト"""
+    df = pd.DataFrame({"Q1": [1, 2, 3], "Q2": [3, 4, 5]})
+
+    # 同じ内容のデータフレームは同じハッシュ値
+    assert compute_dataframe_fingerprint(df) == compute_dataframe_fingerprint(df.copy())
+
+    # 値・カラム名・型が変わるとハッシュ値も変わる
+    changed = df.copy()
+    changed.loc[0, "Q1"] = 5
+    assert compute_dataframe_fingerprint(changed) != compute_dataframe_fingerprint(df)
+    assert compute_dataframe_fingerprint(
+        df.rename(columns={"Q2": "Q3"})
+    ) != compute_dataframe_fingerprint(df)
+    assert compute_dataframe_fingerprint(
+        df.astype("int8")
+    ) != compute_dataframe_fingerprint(df)
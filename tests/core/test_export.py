@@ -0,0 +1,73 @@
+import gzip
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+from src.core import export
+from src.core.export import (
+    get_export_file_name,
+    get_export_mime_type,
+    serialize_dataframe,
+)
+
+
+def test_serialize_dataframe_csv():
+    """CSV形式への変換をテスト"""
+    df = pd.DataFrame({"Q1": [1, 2], "Q2": [3, 4]})
+    assert serialize_dataframe(df, "CSV") == b"Q1,Q2\n1,3\n2,4\n"
+
+
+@pytest.mark.parametrize(
+    "export_format,reader",
+    [("Parquet", pd.read_parquet), ("Feather", pd.read_feather)],
+)
+def test_serialize_dataframe_keeps_dtypes(export_format, reader):
+    """Parquet / Feather 形式でカラムの型が保持されることをテスト"""
+    df = pd.DataFrame(
+        {
+            "ID": ["a", "b", "c"],
+            "Q1": pd.Series([1, 2, 3], dtype="int8"),
+            "Q2": pd.Series([1, None, 3], dtype="Int8"),
+        },
+        index=[5, 7, 9],  # クリーニング後のように連番でないインデックス
+    )
+
+    restored = reader(io.BytesIO(serialize_dataframe(df, export_format)))
+
+    pd.testing.assert_frame_equal(restored, df.reset_index(drop=True))
+
+
+def test_serialize_dataframe_unsupported_format():
+    """未対応の形式でエラーになることをテスト"""
+    with pytest.raises(ValueError):
+        serialize_dataframe(pd.DataFrame({"Q1": [1]}), "JSON")
+
+
+def test_serialize_dataframe_in_chunks(monkeypatch):
+    """CSVをチャンク単位で書き出しても一括で書き出した場合と同じになることをテスト"""
+    monkeypatch.setattr(export, "EXPORT_CHUNK_ROWS", 2)
+    df = pd.DataFrame({"Q1": range(5), "Q2": [0.5] * 5})
+    assert serialize_dataframe(df, "CSV") == df.to_csv(index=False).encode()
+
+
+def test_serialize_dataframe_compression():
+    """gzip / zip 圧縮をテスト"""
+    df = pd.DataFrame({"Q1": [1, 2], "Q2": [3, 4]})
+    csv = serialize_dataframe(df, "CSV")
+
+    assert gzip.decompress(serialize_dataframe(df, "CSV", "gzip")) == csv
+
+    with zipfile.ZipFile(io.BytesIO(serialize_dataframe(df, "CSV", "zip"))) as zf:
+        assert zf.namelist() == ["data.csv"]
+        assert zf.read("data.csv") == csv
+
+
+def test_get_export_file_name():
+    """ダウンロードするファイル名とMIMEタイプの作成をテスト"""
+    assert get_export_file_name("cleaned", "Parquet") == "cleaned.parquet"
+    assert get_export_file_name("cleaned", "CSV", "gzip") == "cleaned.csv.gz"
+    assert get_export_file_name("cleaned", "CSV", "zip") == "cleaned.zip"
+    assert get_export_mime_type("CSV") == "text/csv"
+    assert get_export_mime_type("Parquet", "zip") == "application/zip"
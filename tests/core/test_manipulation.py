@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 
 from src.core.manipulation import (
+    calculate_all_scale_scores,
     calculate_scale_scores,
     prepare_download_data,
     reverse_score,
@@ -25,6 +27,31 @@ def test_reverse_score():
     assert "Q3_r" not in result.columns
 
 
+def test_reverse_score_per_item_scale_points():
+    """項目ごとに異なるポイント数での逆転テスト"""
+    df = pd.DataFrame(
+        {
+            "Q1": pd.Series([1, 2, 5], dtype="int8"),
+            "Q2": pd.Series([1, None, 7], dtype="Int8"),
+            "Q3": [1.0, 2.0, 3.0],
+        }
+    )
+
+    result = reverse_score(df, ["Q1", "Q2", "Q3"], {"Q1": 5, "Q2": 7, "Q3": 3})
+
+    assert result["Q1_r"].tolist() == [5, 4, 1]
+    assert result["Q2_r"].tolist() == [7, pd.NA, 1]
+    assert result["Q3_r"].tolist() == [3.0, 2.0, 1.0]
+    # 元の項目の型を維持する
+    assert result["Q1_r"].dtype == "int8"
+    assert result["Q2_r"].dtype == "Int8"
+
+    # 同名の逆転項目は置き換えられる
+    rerun = reverse_score(result, ["Q1"], 7)
+    assert rerun.columns.tolist().count("Q1_r") == 1
+    assert rerun["Q1_r"].tolist() == [7, 6, 3]
+
+
 def test_prepare_download_data():
     """ダウンロードデータの準備テスト"""
     # テストデータの作成
@@ -123,3 +150,42 @@ def test_calculate_scale_scores_single_item():
     # 合計得点と平均得点が同じになることを確認
     assert result["single_factor_total"].tolist() == [1, 2, 3]
     assert result["single_factor_mean"].tolist() == [1, 2, 3]
+
+
+def test_calculate_all_scale_scores():
+    """複数尺度の得点を一度に計算するテスト"""
+    df = pd.DataFrame(
+        {
+            "Q1": [1.0, 2.0, np.nan, np.nan],
+            "Q2": [2.0, 3.0, 4.0, np.nan],
+            "Q3": [3, 4, 5, 1],
+        }
+    )
+    scales_config = {"a": ["Q1", "Q2"], "b": ["Q2", "Q3"], "c": ["Q3"]}
+
+    result = calculate_all_scale_scores(df, scales_config)
+
+    # 尺度ごとに計算した場合と同じ結果になることを確認（欠損値はpandasと同じ扱い）
+    for name, items in scales_config.items():
+        pd.testing.assert_series_equal(
+            result[f"{name}_total"], df[items].sum(axis=1), check_names=False
+        )
+        pd.testing.assert_series_equal(
+            result[f"{name}_mean"], df[items].mean(axis=1), check_names=False
+        )
+
+    # 整数の項目のみの尺度の合計得点は整数型
+    assert result["c_total"].dtype == "int64"
+    assert list(result.columns) == list(df.columns) + [
+        "a_total",
+        "a_mean",
+        "b_total",
+        "b_mean",
+        "c_total",
+        "c_mean",
+    ]
+
+    # 同名の得点カラムは置き換えられる
+    rerun = calculate_all_scale_scores(result, {"c": ["Q1"]})
+    assert rerun.columns.tolist().count("c_total") == 1
+    assert rerun["c_total"].tolist() == [1.0, 2.0, 0.0, 0.0]
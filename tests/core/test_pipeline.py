@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from src.core.cleaning import remove_invalid_responses
+from src.core.manipulation import calculate_scale_scores, reverse_score
+from src.core.pipeline import compile_pipeline, parse_pipeline_spec, run_pipeline
+
+
+def create_test_data() -> pd.DataFrame:
+    """テスト用の回答データを作成"""
+    return pd.DataFrame(
+        {
+            "ID": ["a", "b", "c", "d", "e"],
+            "Q1": [1, 3, 2, 5, 4],
+            "Q2": [1, 4, None, 1, 2],
+            "Q3": [1, 2, 4, 2, 5],
+            "age": [20, 31, 45, 52, 38],
+        }
+    )
+
+
+def test_run_pipeline_matches_step_by_step_processing():
+    """パイプラインの実行結果が各処理を順に適用した結果と一致することをテスト"""
+    df = create_test_data()
+    spec = {
+        "likert_scale": 5,
+        "columns": {"exclude": ["ID", "age"]},
+        "cleaning": {"straight_line": True, "missing": True},
+        "reverse": {"columns": ["Q1"]},
+        "scales": {"total": ["Q1_r", "Q2", "Q3"], "pair": ["Q2", "Q3"]},
+    }
+
+    plan = compile_pipeline(spec, df.columns.tolist())
+    processed_df, removed_df, summary = run_pipeline(plan, df)
+
+    # 各処理を順に適用した場合の期待値
+    remove_rows = remove_invalid_responses(
+        df[["Q1", "Q2", "Q3"]],
+        likert_scale=5,
+        remove_straight_lines=True,
+        remove_missing=True,
+    )
+    expected = reverse_score(df.drop(index=remove_rows), ["Q1"], 5)
+    expected = calculate_scale_scores(expected, ["Q1_r", "Q2", "Q3"], "total")
+    expected = calculate_scale_scores(expected, ["Q2", "Q3"], "pair")
+
+    pd.testing.assert_frame_equal(processed_df, expected, check_dtype=False)
+    assert removed_df["ID"].tolist() == ["a", "c"]
+    assert summary == {
+        "total_rows": 5,
+        "cleaned_rows": 3,
+        "removed_rows": 2,
+        "straight_line": 1,
+        "missing": 1,
+    }
+    # 整数の項目から作成した逆転項目は整数型
+    assert processed_df["Q1_r"].dtype == "int64"
+
+
+def test_parse_pipeline_spec_yaml():
+    """YAML形式の仕様の読み込みをテスト"""
+    pytest.importorskip("yaml")
+    spec = parse_pipeline_spec(
+        "likert_scale: 7\ncolumns:\n  include: [Q1, Q2]\nscales:\n  s1: [Q1, Q2]\n",
+        fmt="yaml",
+    )
+    assert spec == {
+        "likert_scale": 7,
+        "columns": {"include": ["Q1", "Q2"]},
+        "scales": {"s1": ["Q1", "Q2"]},
+    }
+
+
+@pytest.mark.parametrize(
+    "spec,message",
+    [
+        ({"likert_scale": 12}, "likert_scale"),
+        ({"likert_scale": 5, "columns": {"include": ["Q9"]}}, "Q9"),
+        ({"likert_scale": 5, "cleaning": {"speeding": True}}, "speeding"),
+        ({"likert_scale": 5, "scales": {"s1": ["Q2_r"]}}, "Q2_r"),
+        ({"likert_scale": 5, "filters": []}, "filters"),
+    ],
+)
+def test_compile_pipeline_invalid_spec(spec, message):
+    """不正な仕様がエラーになることをテスト"""
+    with pytest.raises(ValueError, match=message):
+        compile_pipeline(spec, create_test_data().columns.tolist())
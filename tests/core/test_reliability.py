@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.reliability import calculate_reliability
+
+
+def cronbach_alpha(values: pd.DataFrame) -> float:
+    """定義どおりに計算したCronbachのα係数（比較用）"""
+    k = values.shape[1]
+    return k / (k - 1) * (1 - values.var().sum() / values.sum(axis=1).var())
+
+
+@pytest.fixture
+def survey_df():
+    """共通因子を持つ回答データ"""
+    rng = np.random.default_rng(0)
+    factor = rng.normal(size=200)
+    return pd.DataFrame(
+        {
+            f"Q{i}": np.clip(np.round(3 + factor + rng.normal(size=200)), 1, 5)
+            for i in range(1, 7)
+        }
+    ).astype("int8")
+
+
+def test_calculate_reliability_matches_definition(survey_df):
+    """α係数・項目を除いた場合のα係数・I-T相関が定義どおりの計算と一致することをテスト"""
+    items = ["Q1", "Q2", "Q3", "Q4"]
+    summary, item_stats = calculate_reliability(
+        survey_df, {"scale_a": items, "scale_b": ["Q4", "Q5", "Q6"]}
+    )
+
+    assert summary.index.tolist() == ["scale_a", "scale_b"]
+    assert summary.loc["scale_a", "n_items"] == 4
+    assert summary.loc["scale_a", "n_respondents"] == 200
+    assert summary.loc["scale_a", "alpha"] == pytest.approx(
+        cronbach_alpha(survey_df[items])
+    )
+    assert summary.loc["scale_b", "alpha"] == pytest.approx(
+        cronbach_alpha(survey_df[["Q4", "Q5", "Q6"]])
+    )
+
+    stats = item_stats["scale_a"]
+    assert stats.index.tolist() == items
+    for item in items:
+        rest = [col for col in items if col != item]
+        assert stats.loc[item, "alpha_if_deleted"] == pytest.approx(
+            cronbach_alpha(survey_df[rest])
+        )
+        assert stats.loc[item, "item_total_r"] == pytest.approx(
+            survey_df[item].astype(float).corr(survey_df[rest].sum(axis=1))
+        )
+
+
+def test_calculate_reliability_listwise_deletion(survey_df):
+    """欠損値を含む行が尺度ごとに除外されることをテスト"""
+    df = survey_df.astype("Int8")
+    df.loc[[0, 1], "Q1"] = pd.NA
+    df.loc[2, "Q6"] = pd.NA
+
+    summary, _ = calculate_reliability(
+        df, {"scale_a": ["Q1", "Q2", "Q3"], "scale_b": ["Q4", "Q5", "Q6"]}
+    )
+
+    assert summary["n_respondents"].tolist() == [198, 199]
+    complete = df[["Q1", "Q2", "Q3"]].dropna().astype(float)
+    assert summary.loc["scale_a", "alpha"] == pytest.approx(cronbach_alpha(complete))
+
+
+def test_calculate_reliability_small_scales(survey_df):
+    """2項目の尺度では項目を除いた場合のα係数が計算されないことをテスト"""
+    summary, item_stats = calculate_reliability(survey_df, {"pair": ["Q1", "Q2"]})
+
+    assert not np.isnan(summary.loc["pair", "alpha"])
+    assert item_stats["pair"]["alpha_if_deleted"].isna().all()
+    # 2項目の場合のI-T相関は2項目間の相関
+    assert item_stats["pair"].loc["Q1", "item_total_r"] == pytest.approx(
+        survey_df["Q1"].astype(float).corr(survey_df["Q2"].astype(float))
+    )
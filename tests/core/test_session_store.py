@@ -0,0 +1,96 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from src.core import session_store
+from src.core.session_store import (
+    delete_frame,
+    evict_idle_sessions,
+    get_frame,
+    put_frame,
+)
+
+
+@pytest.fixture(autouse=True)
+def store_dir(tmp_path, monkeypatch):
+    """テストごとに一時ディレクトリをデータストアとして使用"""
+    monkeypatch.setattr(session_store, "SESSION_STORE_DIR", tmp_path)
+    return tmp_path
+
+
+def create_test_frame() -> pd.DataFrame:
+    """クリーニング後のように連番でないインデックスを持つテストデータ"""
+    return pd.DataFrame(
+        {
+            "ID": ["a", "b", "c"],
+            "Q1": pd.Series([1, 2, 3], dtype="int8"),
+            "Q2": pd.Series([1, None, 3], dtype="Int8"),
+        },
+        index=[2, 5, 9],
+    )
+
+
+def test_put_frame_keeps_small_frames_in_memory():
+    """サイズの小さいデータフレームはメモリ上に保持されることをテスト"""
+    df = create_test_frame()
+    handle = put_frame("session", df)
+
+    assert handle.path is None
+    assert get_frame(handle) is df
+
+
+def test_put_frame_spills_to_disk(store_dir):
+    """ディスクに書き出したデータフレームが型とインデックスを保って読み込めることをテスト"""
+    df = create_test_frame()
+    handle = put_frame("session", df, min_spill_bytes=0)
+
+    assert handle.frame is None
+    assert handle.path.parent == store_dir / "session"
+    pd.testing.assert_frame_equal(get_frame(handle), df)
+
+    delete_frame(handle)
+    assert not handle.path.exists()
+    with pytest.raises(FileNotFoundError):
+        get_frame(handle)
+
+
+def test_get_frame_reuses_loaded_frame(store_dir, monkeypatch):
+    """ディスクに書き出したデータフレームは2回目以降ファイルを読み込まないことをテスト"""
+    import pyarrow.feather as feather
+
+    handle = put_frame("session", create_test_frame(), min_spill_bytes=0)
+    first = get_frame(handle)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("frame was read from disk again")
+
+    monkeypatch.setattr(feather, "read_table", fail)
+    assert get_frame(handle) is first
+
+    # ファイルが削除された場合は保持しているデータフレームも使用しない
+    handle.path.unlink()
+    with pytest.raises(FileNotFoundError):
+        get_frame(handle)
+
+
+def test_put_frame_falls_back_to_memory_for_unsupported_types():
+    """Arrowに変換できないデータフレームはメモリ上に保持されることをテスト"""
+    df = pd.DataFrame({"mixed": [1, "a", 2.5]})
+    handle = put_frame("session", df, min_spill_bytes=0)
+
+    assert handle.path is None
+    assert get_frame(handle) is df
+
+
+def test_evict_idle_sessions(store_dir):
+    """一定時間アクセスのないセッションのみ削除されることをテスト"""
+    idle = put_frame("idle", create_test_frame(), min_spill_bytes=0)
+    active = put_frame("active", create_test_frame(), min_spill_bytes=0)
+    old = time.time() - 3600
+    os.utime(store_dir / "idle", (old, old))
+
+    assert evict_idle_sessions(ttl_seconds=600, force=True) == 1
+    assert not idle.path.exists()
+    assert active.path.exists()
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from src.core.cleaning import (
+    MISSING,
+    STEP_PATTERN,
+    STRAIGHT_LINE,
+    detect_invalid_response_masks,
+)
+from src.core.streaming import clean_csv_in_chunks
+
+
+def test_clean_csv_in_chunks(tmp_path):
+    """チャンク単位のクリーニング結果が一括処理と一致することをテスト"""
+    # テストデータの作成（ストレートライン・欠損値・階段パターンを含む）
+    rng = np.random.default_rng(0)
+    values = rng.integers(1, 6, size=(95, 5)).astype(float)
+    values[::10] = 3
+    values[5::20, 2] = np.nan
+    values[7::25] = [1, 2, 3, 4, 5]
+    df = pd.DataFrame(values, columns=[f"Q{i}" for i in range(1, 6)])
+    df.insert(0, "ID", [f"id_{i}" for i in range(len(df))])
+
+    input_path = tmp_path / "input.csv"
+    df.to_csv(input_path, index=False)
+
+    # 一括処理による期待値
+    masks, remove_mask = detect_invalid_response_masks(
+        df.drop(columns=["ID"]),
+        likert_scale=5,
+        remove_straight_lines=True,
+        remove_missing=True,
+        remove_step_pattern=True,
+    )
+
+    summary = clean_csv_in_chunks(
+        input_path,
+        tmp_path / "cleaned.csv",
+        tmp_path / "removed.csv",
+        likert_scale=5,
+        exclude_columns=["ID"],
+        remove_straight_lines=True,
+        remove_missing=True,
+        remove_step_pattern=True,
+        chunksize=10,
+    )
+
+    cleaned_df = pd.read_csv(tmp_path / "cleaned.csv")
+    removed_df = pd.read_csv(tmp_path / "removed.csv")
+
+    # 書き出された行の検証
+    assert cleaned_df["ID"].tolist() == df.loc[~remove_mask, "ID"].tolist()
+    assert removed_df["ID"].tolist() == df.loc[remove_mask, "ID"].tolist()
+    assert list(cleaned_df.columns) == list(df.columns)
+
+    # サマリーの検証
+    assert summary["total_rows"] == len(df)
+    assert summary["removed_rows"] == int(remove_mask.sum())
+    assert summary["cleaned_rows"] == len(df) - int(remove_mask.sum())
+    for rule in (STRAIGHT_LINE, MISSING, STEP_PATTERN):
+        assert summary[rule] == int(masks[rule].sum())
+    assert "out_of_range" not in summary
+
+
+def test_clean_csv_in_chunks_writes_consistent_values(tmp_path):
+    """欠損値が一部のチャンクにのみ含まれる場合も全チャンクの値が同じ形式で書き出されることをテスト"""
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("ID,Q1,Q2\na,1,2\nb,3,4\nc,,5\nd,2,1\n")
+
+    clean_csv_in_chunks(
+        input_path,
+        tmp_path / "cleaned.csv",
+        tmp_path / "removed.csv",
+        likert_scale=5,
+        exclude_columns=["ID"],
+        chunksize=2,
+    )
+
+    assert (tmp_path / "cleaned.csv").read_text().splitlines() == [
+        "ID,Q1,Q2",
+        "a,1,2",
+        "b,3,4",
+        "c,,5",
+        "d,2,1",
+    ]
@@ -0,0 +1,55 @@
+import pandas as pd
+
+from src.core.upload_cache import (
+    clear_upload_cache,
+    compute_content_hash,
+    get_cached_dataframe,
+    get_upload_cache_bytes,
+    put_cached_dataframe,
+)
+
+
+def test_compute_content_hash():
+    """同じ内容のファイルは同じハッシュ値になることをテスト"""
+    assert compute_content_hash(b"Q1,Q2\n1,2\n") == compute_content_hash(
+        b"Q1,Q2\n1,2\n"
+    )
+    assert compute_content_hash(b"Q1,Q2\n1,2\n") != compute_content_hash(
+        b"Q1,Q2\n1,3\n"
+    )
+
+
+def test_upload_cache_lru_eviction():
+    """メモリ上限を超えた場合に最も古く使われたデータが削除されることをテスト"""
+    clear_upload_cache()
+    df = pd.DataFrame({"Q1": range(100), "Q2": range(100)})
+    size = int(df.memory_usage(index=True, deep=True).sum())
+    max_bytes = size * 2
+
+    put_cached_dataframe("a", df, max_bytes=max_bytes)
+    put_cached_dataframe("b", df.copy(), max_bytes=max_bytes)
+    # "a" を参照して最近使用したものにする
+    assert get_cached_dataframe("a") is not None
+    put_cached_dataframe("c", df.copy(), max_bytes=max_bytes)
+
+    assert get_cached_dataframe("a") is not None
+    assert get_cached_dataframe("b") is None
+    assert get_cached_dataframe("c") is not None
+    assert get_upload_cache_bytes() == max_bytes
+
+    # 上限を超えるデータはキャッシュしない
+    put_cached_dataframe("large", df, max_bytes=size - 1)
+    assert get_cached_dataframe("large") is None
+    clear_upload_cache()
+
+
+def test_cached_dataframe_is_protected_from_column_changes():
+    """取得したデータフレームへの列の追加がキャッシュに影響しないことをテスト"""
+    clear_upload_cache()
+    put_cached_dataframe("a", pd.DataFrame({"Q1": [1, 2], "Q2": [3, 4]}))
+
+    df = get_cached_dataframe("a")
+    df["Q1_r"] = 6 - df["Q1"]
+
+    assert list(get_cached_dataframe("a").columns) == ["Q1", "Q2"]
+    clear_upload_cache()
@@ -1,11 +1,15 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 from src.core.visualization import (
+    MAX_HISTOGRAM_BINS,
+    calculate_histogram,
     calculate_statistics,
     check_ceiling_effect,
     check_floor_effect,
     create_statistics_summary,
+    summarize_columns,
 )
 
 
@@ -87,17 +91,68 @@ def test_create_statistics_summary():
 
     # Q1の検証（通常の分布）
     q1_row = summary_df[summary_df["Variable"] == "Q1"].iloc[0]
-    assert q1_row["Ceiling Effect"] == "No"
-    assert q1_row["Floor Effect"] == "No"
+    assert not q1_row["Ceiling Effect"]
+    assert not q1_row["Floor Effect"]
 
     # Q2の検証（天井効果あり）
     q2_row = summary_df[summary_df["Variable"] == "Q2"].iloc[0]
-    assert q2_row["Ceiling Effect"] == "⚠️ Yes"
+    assert q2_row["Ceiling Effect"]
 
     # Q3の検証（床効果あり）
     q3_row = summary_df[summary_df["Variable"] == "Q3"].iloc[0]
-    assert q3_row["Floor Effect"] == "⚠️ Yes"
-
-    # 数値フォーマットの検証
-    assert "." in q1_row["Mean"]  # 小数点以下が表示されていることを確認
-    assert "." in q1_row["SD"]
+    assert q3_row["Floor Effect"]
+
+    # 数値のまま返されることを確認（整形は表示時に行う）
+    assert q1_row["Mean"] == 3.0
+    assert q1_row["SD"] == pytest.approx(1.5811, abs=0.001)
+    assert summary_df["Ceiling Effect"].dtype == bool
+
+
+def test_summarize_columns():
+    """統計量と度数の一括計算をテスト"""
+    df = pd.DataFrame(
+        {
+            "Q1": [1, 2, 2, 4, 5],
+            "Q2": [5, 5, np.nan, 4, 5],
+            "score": [0.5, 1.25, 3.3, 2.0, 1.0],
+            "empty": [np.nan] * 5,
+        }
+    )
+
+    stats, frequencies = summarize_columns(df, list(df.columns))
+
+    # pandasで個別に計算した場合と同じ結果になることを確認
+    for col in df.columns:
+        assert stats.loc[col, "count"] == df[col].count()
+        for key, expected in [
+            ("mean", df[col].mean()),
+            ("std", df[col].std()),
+            ("min", df[col].min()),
+            ("max", df[col].max()),
+        ]:
+            if pd.isna(expected):
+                assert np.isnan(stats.loc[col, key])
+            else:
+                assert stats.loc[col, key] == pytest.approx(expected)
+
+    # 整数値のカラムのみ、最小値から最大値までの各値の度数を集計する
+    assert set(frequencies) == {"Q1", "Q2"}
+    assert frequencies["Q1"].to_dict() == {1: 1, 2: 2, 3: 0, 4: 1, 5: 1}
+    assert frequencies["Q2"].to_dict() == {4: 1, 5: 3}
+
+
+def test_calculate_histogram():
+    """連続値の階級ごとの度数集計をテスト"""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"score": np.append(rng.normal(size=10_000), np.nan)})
+
+    counts, edges = calculate_histogram(df, "score")
+
+    # 欠損値を除く全ての値がいずれかの階級に含まれ、階級数は上限以下
+    assert counts.sum() == 10_000
+    assert len(edges) == len(counts) + 1
+    assert len(counts) <= MAX_HISTOGRAM_BINS
+
+    # 全て欠損値の場合は空の結果を返す
+    counts, edges = calculate_histogram(pd.DataFrame({"x": [np.nan]}), "x")
+    assert len(counts) == 0
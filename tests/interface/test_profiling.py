@@ -0,0 +1,86 @@
+import cProfile
+import pstats
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from src.core.visualization import summarize_columns
+from src.interface.profiling import (
+    measure_payload_bytes,
+    profile_page_run,
+    summarize_profile,
+)
+
+
+def test_measure_payload_bytes():
+    """データフレームとグラフの送信サイズを計測できることをテスト"""
+    df = pd.DataFrame({"Q1": range(1000), "Q2": ["a"] * 1000})
+    payload = measure_payload_bytes("dataframe", df)
+    assert (payload["rows"], payload["cols"]) == (1000, 2)
+    assert payload["bytes"] > 8000
+
+    # 行数が多いほどサイズが大きくなる
+    assert measure_payload_bytes("dataframe", df.head(10))["bytes"] < payload["bytes"]
+
+    fig = go.Figure(go.Bar(x=[1, 2, 3], y=[4, 5, 6]))
+    assert measure_payload_bytes("plotly_chart", fig)["bytes"] > 0
+
+
+def test_summarize_profile_project_only():
+    """計測結果からこのリポジトリ内の関数のみを抽出できることをテスト"""
+    df = pd.DataFrame({"Q1": [1, 2, 3], "Q2": [3, 2, 1]})
+    profiler = cProfile.Profile()
+    profiler.enable()
+    summarize_columns(df, ["Q1", "Q2"])
+    profiler.disable()
+    stats = pstats.Stats(profiler)
+
+    summary = summarize_profile(stats)
+    assert summary.columns.tolist() == ["Function", "Calls", "Own [ms]", "Total [ms]"]
+    assert summary["Function"].str.contains("src/core/visualization.py").any()
+    assert summary["Function"].str.startswith("summarize_columns").any()
+    assert summary["Total [ms]"].is_monotonic_decreasing
+
+    # ライブラリの関数を含めると行数が増える
+    assert len(summarize_profile(stats, top=1000, project_only=False)) > len(
+        summarize_profile(stats, top=1000)
+    )
+
+
+def test_profile_page_run_records_payloads(monkeypatch):
+    """有効な場合に再実行の計測結果と送信サイズが保存されることをテスト"""
+    monkeypatch.setenv("SURVEY_APP_PROFILE", "1")
+    st.session_state.pop("profiling_enabled", None)
+    st.session_state.pop("profiling_report", None)
+
+    original = st.dataframe
+    with profile_page_run():
+        assert st.dataframe is not original
+        st.dataframe(pd.DataFrame({"Q1": [1, 2, 3]}))
+
+    # 計測の終了後は元の関数に戻る（他のセッションはラッパーを経由しない）
+    assert st.dataframe is original
+
+    report = st.session_state.profiling_report
+    assert report["wall_ms"] >= 0
+    assert len(report["payloads"]) == 1
+    assert report["payloads"][0]["element"] == "dataframe"
+    assert report["payloads"][0]["location"].startswith("test_profiling.py:")
+
+    # 計測していない区間の呼び出しは記録されない
+    st.dataframe(pd.DataFrame({"Q1": [1]}))
+    assert len(report["payloads"]) == 1
+    del st.session_state.profiling_report
+
+
+def test_profile_page_run_disabled(monkeypatch):
+    """無効の場合は計測結果を保存しないことをテスト"""
+    monkeypatch.delenv("SURVEY_APP_PROFILE", raising=False)
+    st.session_state.pop("profiling_enabled", None)
+    st.session_state.pop("profiling_report", None)
+
+    with profile_page_run():
+        pass
+
+    assert "profiling_report" not in st.session_state
@@ -8,8 +8,17 @@ from src.interface.state import (
     check_manipulation_settings_completion,
     check_scale_scores_completion,
     check_visualization_selection_completion,
+    clear_uploaded_data,
+    get_cleaned_data,
+    get_final_dataset,
+    get_removed_data,
+    has_cleaning_results,
+    has_dataframe,
     initialize_cleaning_state,
+    load_dataframe,
     reset_cleaning_state,
+    save_uploaded_data,
+    store_dataframe,
 )
 
 
@@ -110,35 +119,41 @@ def test_initialize_cleaning_state():
     initialize_cleaning_state(df_to_process, df_not_to_process, likert_scale, reqs)
 
     # セッション状態の検証
-    assert "cleaned_df" in st.session_state
-    assert "removed_df" in st.session_state
+    assert has_cleaning_results()
 
     # クリーニング結果の検証
-    assert len(st.session_state.cleaned_df) + len(st.session_state.removed_df) == len(
-        df_to_process
-    )
-    assert "ID" in st.session_state.cleaned_df.columns
-    assert "ID" in st.session_state.removed_df.columns
+    assert len(get_cleaned_data()) + len(get_removed_data()) == len(df_to_process)
+    assert "ID" in get_cleaned_data().columns
+    assert "ID" in get_removed_data().columns
+
+    # 削除理由のビットマスクの検証（ストレートラインは1ビット目）
+    assert st.session_state.removal_reasons.dtype == "uint8"
+    assert st.session_state.removal_reasons.tolist() == [1, 1, 1]
 
 
 def test_reset_cleaning_state():
     """クリーニング状態のリセットテスト"""
     # テスト用のセッション状態を設定
-    st.session_state.cleaned_df = pd.DataFrame({"test": [1, 2, 3]})
-    st.session_state.removed_df = pd.DataFrame({"test": [4, 5]})
+    initialize_cleaning_state(
+        pd.DataFrame({"Q1": [1, 2], "Q2": [1, 3]}),
+        pd.DataFrame({"ID": ["001", "002"]}),
+        5,
+        (True, False, False, False),
+    )
     st.session_state.cleaning_executed = True
-    st.session_state.removed_df_with_checkbox = pd.DataFrame({"test": [4, 5]})
-    st.session_state.editor_key = 0
 
     # リセット実行
     reset_cleaning_state()
 
     # セッション状態の検証
+    assert not has_cleaning_results()
+    assert not has_dataframe("cleaning_base_df")
     keys_to_check = [
-        "cleaned_df",
-        "removed_df",
+        "cleaning_base_key",
+        "removed_mask",
+        "keep_mask",
+        "removal_reasons",
         "cleaning_executed",
-        "removed_df_with_checkbox",
         "editor_key",
     ]
     for key in keys_to_check:
@@ -175,5 +190,113 @@ def test_initialize_cleaning_state_various_cases(df_to_process, reqs, expected_r
 
     initialize_cleaning_state(df_to_process, df_not_to_process, likert_scale, reqs)
 
-    assert len(st.session_state.removed_df) == expected_removed
-    assert len(st.session_state.cleaned_df) == len(df_to_process) - expected_removed
+    assert len(get_removed_data()) == expected_removed
+    assert len(get_cleaned_data()) == len(df_to_process) - expected_removed
+
+
+def test_initialize_cleaning_state_reuses_rule_masks(monkeypatch):
+    """ルールの組み合わせを変更しても判定処理を再実行しないことのテスト"""
+    import src.interface.state as state
+
+    st.session_state.pop("rule_mask_cache", None)
+    calls = []
+    original = state.detect_invalid_response_masks
+
+    def counting_detect(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(state, "detect_invalid_response_masks", counting_detect)
+
+    df_to_process = pd.DataFrame({"Q1": [1, None, 6, 2], "Q2": [1, 2, 3, 3]})
+    df_not_to_process = pd.DataFrame({"ID": ["001", "002", "003", "004"]})
+
+    initialize_cleaning_state(
+        df_to_process, df_not_to_process, 5, (True, False, False, False)
+    )
+    assert get_cleaned_data()["ID"].tolist() == ["002", "003", "004"]
+
+    initialize_cleaning_state(
+        df_to_process, df_not_to_process, 5, (False, True, True, False)
+    )
+    assert get_cleaned_data()["ID"].tolist() == ["001", "004"]
+    assert st.session_state.removal_reasons.tolist() == [0, 2, 4, 0]
+    assert len(calls) == 1
+
+    # リッカート尺度が変わった場合は再判定する
+    initialize_cleaning_state(
+        df_to_process, df_not_to_process, 7, (False, False, True, False)
+    )
+    assert get_removed_data().empty
+    assert len(calls) == 2
+
+
+def test_store_dataframe_spills_to_disk(tmp_path, monkeypatch):
+    """大きいデータフレームはファイルに書き出され、リセット時に削除されることをテスト"""
+    from src.core import session_store
+
+    monkeypatch.setattr(session_store, "SESSION_STORE_DIR", tmp_path)
+    monkeypatch.setattr(session_store, "SESSION_SPILL_MIN_BYTES", 0)
+
+    df = pd.DataFrame({"Q1": [1, 2, 3]}, index=[3, 4, 7])
+    store_dataframe("cleaning_base_df", df)
+    handle = st.session_state.cleaning_base_df
+
+    # セッション状態には参照のみ保持される
+    assert handle.frame is None and handle.path.exists()
+    pd.testing.assert_frame_equal(load_dataframe("cleaning_base_df"), df)
+
+    reset_cleaning_state()
+    assert not has_dataframe("cleaning_base_df")
+    assert not handle.path.exists()
+
+
+def test_cleaning_state_shares_uploaded_data():
+    """アップロードされたデータを複製せずにマスクで最終データを作成することのテスト"""
+    uploaded_df = pd.DataFrame(
+        {"ID": ["001", "002", "003", "004"], "Q1": [1, 2, 3, 9], "Q2": [1, 3, 3, 2]}
+    )
+    save_uploaded_data(uploaded_df)
+
+    initialize_cleaning_state(
+        uploaded_df[["Q1", "Q2"]],
+        uploaded_df[["ID"]],
+        5,
+        (True, False, True, False),
+    )
+
+    # 元データはアップロードされたデータをそのまま参照する
+    assert st.session_state.cleaning_base_key == "uploaded_df"
+    assert not has_dataframe("cleaning_base_df")
+    assert get_removed_data()["ID"].tolist() == ["001", "003", "004"]
+
+    # 保持を選択した行は元の行の順序で最終データに含まれる
+    st.session_state.keep_mask[[0, 3]] = True
+    assert get_final_dataset()["ID"].tolist() == ["001", "002", "004"]
+    assert get_final_dataset().columns.tolist() == ["ID", "Q1", "Q2"]
+
+    reset_cleaning_state()
+    st.session_state.uploaded_df = None
+
+
+def test_new_upload_discards_cleaning_results():
+    """別のデータをアップロードした場合に以前のクリーニング結果が破棄されることをテスト"""
+    first_df = pd.DataFrame({"ID": ["v", "w", "x"], "Q1": [1, 9, 2], "Q2": [2, 2, 3]})
+    save_uploaded_data(first_df)
+    initialize_cleaning_state(
+        first_df[["Q1", "Q2"]], first_df[["ID"]], 5, (False, False, True, False)
+    )
+    assert has_cleaning_results()
+
+    clear_uploaded_data()
+    assert not has_cleaning_results()
+    assert "removed_mask" not in st.session_state
+
+    initialize_cleaning_state(
+        first_df[["Q1", "Q2"]], first_df[["ID"]], 5, (False, False, True, False)
+    )
+    second_df = pd.DataFrame({"ID": ["y", "z"], "Q1": [1, 2], "Q2": [2, 3]})
+    save_uploaded_data(second_df)
+    assert not has_cleaning_results()
+
+    clear_uploaded_data()
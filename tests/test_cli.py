@@ -0,0 +1,144 @@
+import logging
+from logging.handlers import RotatingFileHandler
+
+import pandas as pd
+import pytest
+
+from src.cli import main, parse_scale_definition
+from src.utils.logger_config import logger
+
+
+@pytest.fixture(autouse=True)
+def error_log(tmp_path, monkeypatch):
+    """エラーログの出力先を一時ディレクトリに変更し、ログレベルをテスト後に戻す"""
+    handler = logging.FileHandler(tmp_path / "error.log", encoding="utf-8")
+    handler.setLevel(logging.ERROR)
+    handlers = [h for h in logger.handlers if not isinstance(h, RotatingFileHandler)]
+    monkeypatch.setattr(logger, "handlers", handlers + [handler])
+    level = logger.level
+    yield tmp_path / "error.log"
+    logger.setLevel(level)
+    handler.close()
+
+
+def test_parse_scale_definition():
+    """尺度定義の解析をテスト"""
+    assert parse_scale_definition("anxiety=Q1, Q2,Q3_r") == (
+        "anxiety",
+        ["Q1", "Q2", "Q3_r"],
+    )
+    with pytest.raises(Exception):
+        parse_scale_definition("anxiety")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_main(tmp_path, jobs):
+    """複数ファイルのクリーニング・逆転・尺度得点の計算をテスト"""
+    df = pd.DataFrame(
+        {
+            "ID": ["a", "b", "c", "d"],
+            "Q1": [1, 3, 2, 5],
+            "Q2": [1, 4, None, 1],
+            "Q3": [1, 2, 4, 2],
+        }
+    )
+    inputs = [tmp_path / "wave1.csv", tmp_path / "wave2.csv"]
+    for path in inputs:
+        df.to_csv(path, index=False)
+    output_dir = tmp_path / "out"
+
+    exit_code = main(
+        [str(path) for path in inputs]
+        + [
+            "--likert-scale",
+            "5",
+            "--exclude-columns",
+            "ID",
+            "--remove-straight-lines",
+            "--remove-missing",
+            "--reverse",
+            "Q1",
+            "--scale",
+            "total=Q1_r,Q2,Q3",
+            "--output-dir",
+            str(output_dir),
+            "--jobs",
+            str(jobs),
+        ]
+    )
+
+    assert exit_code == 0
+    for stem in ["wave1", "wave2"]:
+        # 行0（ストレートライン）と行2（欠損値）が削除される
+        removed_df = pd.read_csv(output_dir / f"{stem}_removed.csv")
+        assert removed_df["ID"].tolist() == ["a", "c"]
+
+        processed_df = pd.read_csv(output_dir / f"{stem}_processed.csv")
+        assert processed_df["Q1_r"].tolist() == [3, 1]
+        assert processed_df["total_total"].tolist() == [9, 4]
+
+        stats_df = pd.read_csv(output_dir / f"{stem}_statistics.csv")
+        assert "total_mean" in stats_df["Variable"].tolist()
+        assert "ID" not in stats_df["Variable"].tolist()
+
+
+def test_main_reports_failed_files(tmp_path, error_log):
+    """存在しないファイルを処理した場合に失敗を返すことをテスト"""
+    exit_code = main(
+        [
+            str(tmp_path / "missing.csv"),
+            "--likert-scale",
+            "5",
+            "--output-dir",
+            str(tmp_path / "out"),
+        ]
+    )
+    assert exit_code == 1
+    assert "missing.csv" in error_log.read_text(encoding="utf-8")
+
+
+def test_main_with_pipeline_spec(tmp_path):
+    """パイプライン仕様による一括実行をテスト"""
+    df = pd.DataFrame(
+        {"ID": ["a", "b", "c"], "Q1": [1, 3, 2], "Q2": [1, 4, 5], "Q3": [1, 2, 4]}
+    )
+    input_path = tmp_path / "wave1.csv"
+    df.to_csv(input_path, index=False)
+    spec_path = tmp_path / "study.json"
+    spec_path.write_text(
+        '{"likert_scale": 5, "columns": {"exclude": ["ID"]},'
+        ' "cleaning": {"straight_line": true}, "reverse": {"columns": ["Q1"]},'
+        ' "scales": {"s1": ["Q1_r", "Q2"]}}'
+    )
+    output_dir = tmp_path / "out"
+
+    exit_code = main(
+        [str(input_path), "--spec", str(spec_path), "--output-dir", str(output_dir)]
+    )
+
+    assert exit_code == 0
+    processed_df = pd.read_csv(output_dir / "wave1_processed.csv")
+    assert processed_df["ID"].tolist() == ["b", "c"]
+    assert processed_df["s1_total"].tolist() == [7, 9]
+
+
+def test_main_rejects_duplicate_output_names(tmp_path):
+    """出力ファイル名が重複する入力ファイルを指定した場合にエラーとなることをテスト"""
+    for name in ["2024", "2025"]:
+        (tmp_path / name).mkdir()
+        pd.DataFrame({"Q1": [1, 2]}).to_csv(
+            tmp_path / name / "responses.csv", index=False
+        )
+
+    with pytest.raises(SystemExit):
+        main(
+            [
+                str(tmp_path / "2024" / "responses.csv"),
+                str(tmp_path / "2025" / "responses.csv"),
+                "--likert-scale",
+                "5",
+                "--output-dir",
+                str(tmp_path / "out"),
+            ]
+        )
+    assert not (tmp_path / "out").exists()
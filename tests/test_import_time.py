@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# src.app の読み込み時間の上限（ミリ秒）。遅い環境では環境変数で変更できる
+IMPORT_TIME_BUDGET_MS = int(os.environ.get("IMPORT_TIME_BUDGET_MS", "3000"))
+
+# ページのモジュールを読み込んだ時点では読み込まれないはずのモジュール
+# （plotly.graph_objs._figure はグラフの作成時、openpyxl はExcelファイルの読み込み時に読み込む）
+LAZY_MODULES = ["plotly.express", "plotly.graph_objs._figure", "openpyxl", "yaml"]
+
+PAGE_MODULES = [
+    "src.interface.pages.common",
+    "src.interface.pages.cleaning",
+    "src.interface.pages.pipeline",
+    "src.interface.pages.manipulation",
+    "src.interface.pages.visualization",
+]
+
+
+def run_importtime(code: str) -> tuple[dict[str, int], str]:
+    """
+    python -X importtime でコードを実行し、モジュールごとの累積の読み込み時間を取得
+    Args:
+        code (str): 実行するコード
+    Returns:
+        tuple[dict[str, int], str]: モジュール名 -> 累積時間（マイクロ秒）, 標準出力
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total, name = line.split("|")
+        cumulative[name.strip()] = int(total)
+    return cumulative, result.stdout
+
+
+def test_import_app_within_budget():
+    """src.app の読み込み時間が上限以内であることをテスト"""
+    cumulative, _ = run_importtime("import src.app")
+    elapsed_ms = cumulative["src.app"] / 1000
+    assert elapsed_ms < IMPORT_TIME_BUDGET_MS, (
+        f"Importing src.app took {elapsed_ms:.0f} ms "
+        f"(budget: {IMPORT_TIME_BUDGET_MS} ms)"
+    )
+
+
+def test_heavy_modules_are_imported_lazily():
+    """アプリとページのモジュールを読み込んだ時点で重い依存関係が読み込まれないことをテスト"""
+    code = "; ".join(
+        ["import sys", "import src.app"]
+        + [f"import {module}" for module in PAGE_MODULES]
+        + [f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"]
+    )
+    _, stdout = run_importtime(code)
+    assert stdout.strip() == ""
@@ -0,0 +1,146 @@
+import json
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.logger_config import (
+    perf_log,
+    perf_logger,
+    perf_span,
+    set_perf_logging,
+)
+
+
+class ListHandler(logging.Handler):
+    """出力されたログのメッセージを保持するハンドラ"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def perf_records():
+    """計測ログを有効にし、出力されたJSONを辞書のリストとして返す"""
+    handler = ListHandler()
+    perf_logger.addHandler(handler)
+    set_perf_logging("1")
+    yield lambda: [json.loads(message) for message in handler.messages]
+    set_perf_logging(None)
+    perf_logger.removeHandler(handler)
+
+
+def test_perf_log_records_shape_time_and_memory(perf_records):
+    """デコレータが行数・列数・処理時間・ピークメモリを出力することをテスト"""
+
+    @perf_log
+    def double(df):
+        return df * 2
+
+    df = pd.DataFrame(np.ones((1000, 4)))
+    result = double(df)
+
+    assert result.iloc[0, 0] == 2
+    (record,) = perf_records()
+    assert record["event"] == "perf"
+    assert record["name"].endswith("double")
+    assert (record["rows"], record["cols"]) == (1000, 4)
+    assert record["wall_ms"] >= 0
+    # 結果のデータフレーム（8バイト × 4000）分以上のメモリが確保される
+    assert record["peak_bytes"] >= 32_000
+    assert record["status"] == "ok"
+
+
+def test_perf_span_nested_peak_is_carried_to_outer(perf_records):
+    """入れ子の区間のピークメモリが外側の区間にも反映されることをテスト"""
+    with perf_span("outer"):
+        with perf_span("inner"):
+            block = np.ones(1_000_000)
+            del block
+
+    inner, outer = perf_records()
+    assert (inner["name"], inner["depth"]) == ("inner", 1)
+    assert (outer["name"], outer["depth"]) == ("outer", 0)
+    assert inner["peak_bytes"] >= 8_000_000
+    assert outer["peak_bytes"] >= inner["peak_bytes"]
+
+
+def test_perf_log_records_errors(perf_records):
+    """例外が発生した場合もステータスを出力して例外を再送出することをテスト"""
+
+    @perf_log
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        fail()
+
+    (record,) = perf_records()
+    assert record["status"] == "error"
+
+
+def test_perf_log_disabled():
+    """計測ログが無効の場合は何も出力しないことをテスト"""
+    handler = ListHandler()
+    perf_logger.addHandler(handler)
+    set_perf_logging(None)
+
+    @perf_log
+    def identity(value):
+        return value
+
+    try:
+        assert identity(3) == 3
+        with perf_span("disabled") as record:
+            assert record == {}
+        assert handler.messages == []
+    finally:
+        perf_logger.removeHandler(handler)
+
+
+def test_perf_logging_time_only(perf_records):
+    """処理時間のみ（"time"）を指定した場合はピークメモリを計測しないことをテスト"""
+    set_perf_logging("time")
+    with perf_span("time_only", np.zeros((3, 2))):
+        pass
+
+    (record,) = perf_records()
+    assert (record["rows"], record["cols"]) == (3, 2)
+    assert "peak_bytes" not in record
+
+
+def test_perf_span_concurrent_threads(perf_records):
+    """複数のスレッドで同時に計測しても区間の深さとピークメモリが崩れないことをテスト"""
+    barrier = threading.Barrier(2)
+
+    def run(size):
+        with perf_span(f"outer_{size}"):
+            barrier.wait()
+            with perf_span(f"inner_{size}"):
+                block = np.ones(size)
+                barrier.wait()
+                del block
+            barrier.wait()
+
+    threads = [
+        threading.Thread(target=run, args=(size,)) for size in [500_000, 1_000_000]
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    records = {record["name"]: record for record in perf_records()}
+    for size in [500_000, 1_000_000]:
+        inner, outer = records[f"inner_{size}"], records[f"outer_{size}"]
+        assert (inner["depth"], outer["depth"]) == (1, 0)
+        assert inner["thread"] == outer["thread"]
+        # 他のスレッドのリセット後も自分の区間のピークが失われない
+        assert inner["peak_bytes"] >= size * 8
+        assert outer["peak_bytes"] >= size * 8